@@ -29,6 +29,7 @@ from redbot.core.bot import Red, ExitCodes, _NoOwnerSet
 from redbot.core.cli import interactive_config, confirm, parse_cli_flags
 from redbot.setup import get_data_dir, get_name, save_config
 from redbot.core import data_manager, drivers
+from redbot.core._cluster import ClusterBus, run_cluster
 from redbot.core._debuginfo import DebugInfo
 from redbot.core._sharedlibdeprecation import SharedLibImportWarner
 
@@ -312,9 +313,14 @@ async def run_bot(red: Red, cli_flags: Namespace) -> None:
 
     await driver_cls.initialize(**data_manager.storage_details())
 
+    cluster_bus = ClusterBus.from_env()
+    log_location = data_manager.core_data_path() / "logs"
+    if cluster_bus is not None:
+        # Log rotation isn't safe with several processes writing to the same files.
+        log_location /= f"cluster-{cluster_bus.cluster_id}"
     redbot.logging.init_logging(
         level=cli_flags.logging_level,
-        location=data_manager.core_data_path() / "logs",
+        location=log_location,
         cli_flags=cli_flags,
     )
 
@@ -360,6 +366,8 @@ async def run_bot(red: Red, cli_flags: Namespace) -> None:
 
     if cli_flags.dry_run:
         sys.exit(0)
+    if cluster_bus is not None:
+        await red._connect_cluster(cluster_bus)
     try:
         # `async with red:` is unnecessary here because we call red.close() in shutdown handler
         await red.start(token)
@@ -478,6 +486,23 @@ def red_exception_handler(red, red_task: asyncio.Future):
         asyncio.create_task(shutdown_handler(red))
 
 
+def cluster_main(cli_flags: Namespace) -> NoReturn:
+    if cli_flags.no_instance:
+        print("--cluster-workers can't be used with --no-instance")
+        sys.exit(1)
+    data_manager.load_basic_configuration(cli_flags.instance_name)
+    if data_manager.storage_type() == drivers.BackendType.JSON.value:
+        print(
+            "Cluster mode requires a storage backend which can be shared between processes."
+            " Use `redbot-setup convert` to convert this instance to PostgreSQL."
+        )
+        sys.exit(1)
+    logging.basicConfig(
+        level=cli_flags.logging_level, format="[%(asctime)s] %(levelname)s %(name)s: %(message)s"
+    )
+    sys.exit(run_cluster(cli_flags, sys.argv[1:]))
+
+
 def main():
     red = None  # Error handling for users misusing the bot
     cli_flags = parse_cli_flags(sys.argv[1:])
@@ -485,6 +510,8 @@ def main():
     if cli_flags.edit:
         early_exit_runner(cli_flags, edit_instance)
         return
+    if cli_flags.cluster_workers:
+        cluster_main(cli_flags)
     try:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
@@ -552,6 +579,7 @@ def main():
         asyncio.set_event_loop(None)
         loop.stop()
         loop.close()
+        redbot.logging.shutdown_logging()
     exit_code = red._shutdown_mode if red is not None else 1
     sys.exit(exit_code)
 
@@ -3,7 +3,7 @@ import json
 from collections import namedtuple
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, MutableMapping, Optional, Union
+from typing import MutableMapping, Optional, Union
 
 import discord
 import lavalink
@@ -71,11 +71,7 @@ class PlaylistFetchResult:
     scope_id: int
     author_id: int
     playlist_url: Optional[str] = None
-    tracks: List[MutableMapping] = field(default_factory=lambda: [])
-
-    def __post_init__(self):
-        if isinstance(self.tracks, str):
-            self.tracks = json.loads(self.tracks)
+    track_count: int = 0
 
 
 @dataclass
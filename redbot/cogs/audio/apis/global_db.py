@@ -13,6 +13,7 @@ from red_commons.logging import getLogger
 from redbot.core import Config
 from redbot.core.bot import Red
 from redbot.core.commands import Cog
+from redbot.core.http_client import HTTPClient
 from redbot.core.i18n import Translator
 
 from ..audio_dataclasses import Query
@@ -27,18 +28,23 @@ log = getLogger("red.cogs.Audio.api.GlobalDB")
 
 class GlobalCacheWrapper:
     def __init__(
-        self, bot: Red, config: Config, session: aiohttp.ClientSession, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, http_client: HTTPClient, cog: Union["Audio", Cog]
     ):
         # Place Holder for the Global Cache PR
         self.bot = bot
         self.config = config
-        self.session = session
+        self.http_client = http_client
         self.api_key = None
         self._handshake_token = ""
         self.has_api_key = None
         self._token: Mapping[str, str] = {}
         self.cog = cog
 
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # The shared client creates a new session if its session was closed.
+        return self.http_client.session
+
     async def update_token(self, new_token: Mapping[str, str]):
         self._token = new_token
         await self.get_perms()
@@ -175,15 +181,14 @@ class GlobalCacheWrapper:
         if (not is_enabled) or self.api_key is None:
             return global_api_user
         with contextlib.suppress(Exception):
-            async with aiohttp.ClientSession(json_serialize=json.dumps) as session:
-                async with session.get(
-                    f"{_API_URL}api/v2/users/me",
-                    headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
-                ) as resp:
-                    if resp.status == 200:
-                        search_response = await resp.json(loads=json.loads)
-                        global_api_user["fetched"] = True
-                        global_api_user["can_read"] = search_response.get("can_read", False)
-                        global_api_user["can_post"] = search_response.get("can_post", False)
-                        global_api_user["can_delete"] = search_response.get("can_delete", False)
+            async with self.session.get(
+                f"{_API_URL}api/v2/users/me",
+                headers={"Authorization": self.api_key, "X-Token": self._handshake_token},
+            ) as resp:
+                if resp.status == 200:
+                    search_response = await resp.json(loads=json.loads)
+                    global_api_user["fetched"] = True
+                    global_api_user["can_read"] = search_response.get("can_read", False)
+                    global_api_user["can_post"] = search_response.get("can_post", False)
+                    global_api_user["can_delete"] = search_response.get("can_delete", False)
         return global_api_user
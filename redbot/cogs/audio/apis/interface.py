@@ -1,13 +1,26 @@
 import asyncio
+import collections
 import contextlib
 import datetime
+import itertools
 import json
 import random
 import time
 
 from collections import namedtuple
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, List, MutableMapping, Optional, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import aiohttp
 import discord
@@ -18,9 +31,10 @@ from lavalink.rest_api import LoadResult, LoadType
 from redbot.core import Config, commands
 from redbot.core.bot import Red
 from redbot.core.commands import Cog, Context
+from redbot.core.http_client import HTTPClient
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
 
 from ..audio_dataclasses import Query
 from ..errors import DatabaseError, SpotifyFetchError, TrackEnqueueError, YouTubeApiError
@@ -28,6 +42,7 @@ from ..utils import CacheLevel, Notifier
 from .api_utils import LavalinkCacheFetchForGlobalResult
 from .global_db import GlobalCacheWrapper
 from .local_db import LocalCacheWrapper
+from .local_tracks_wrapper import LocalTracksWrapper
 from .persist_queue_wrapper import QueueInterface
 from .playlist_interface import get_playlist
 from .playlist_wrapper import PlaylistWrapper
@@ -40,6 +55,7 @@ if TYPE_CHECKING:
 _ = Translator("Audio", Path(__file__))
 log = getLogger("red.cogs.Audio.api.AudioAPIInterface")
 _TOP_100_US = "https://www.youtube.com/playlist?list=PL4fGSI1pDJn5rWitrRWFKdm-ulaFiIyoK"
+_SPOTIFY_RESOLVE_CONCURRENCY = 10
 # TODO: Get random from global Cache
 
 
@@ -53,20 +69,24 @@ class AudioAPIInterface:
         self,
         bot: Red,
         config: Config,
-        session: aiohttp.ClientSession,
-        conn: APSWConnectionWrapper,
+        http_client: HTTPClient,
+        conn: ThreadedAPSWConnection,
         cog: Union["Audio", Cog],
     ):
         self.bot = bot
         self.config = config
         self.conn = conn
         self.cog = cog
-        self.spotify_api: SpotifyWrapper = SpotifyWrapper(self.bot, self.config, session, self.cog)
-        self.youtube_api: YouTubeWrapper = YouTubeWrapper(self.bot, self.config, session, self.cog)
+        self.spotify_api: SpotifyWrapper = SpotifyWrapper(
+            self.bot, self.config, http_client, self.cog
+        )
+        self.youtube_api: YouTubeWrapper = YouTubeWrapper(
+            self.bot, self.config, http_client, self.cog
+        )
         self.local_cache_api = LocalCacheWrapper(self.bot, self.config, self.conn, self.cog)
-        self.global_cache_api = GlobalCacheWrapper(self.bot, self.config, session, self.cog)
+        self.global_cache_api = GlobalCacheWrapper(self.bot, self.config, http_client, self.cog)
         self.persistent_queue_api = QueueInterface(self.bot, self.config, self.conn, self.cog)
-        self._session: aiohttp.ClientSession = session
+        self.local_tracks_api = LocalTracksWrapper(self.bot, self.config, self.conn, self.cog)
         self._tasks: MutableMapping = {}
         self._lock: asyncio.Lock = asyncio.Lock()
 
@@ -74,6 +94,7 @@ class AudioAPIInterface:
         """Initialises the Local Cache connection."""
         await self.local_cache_api.lavalink.init()
         await self.persistent_queue_api.init()
+        await self.local_tracks_api.init()
 
     def close(self) -> None:
         """Closes the Local Cache connection."""
@@ -477,7 +498,8 @@ class AudioAPIInterface:
             time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
             youtube_cache = CacheLevel.set_youtube().is_subset(current_cache_level)
             spotify_cache = CacheLevel.set_spotify().is_subset(current_cache_level)
-            async for track_count, track in AsyncIter(tracks_from_spotify).enumerate(start=1):
+            track_infos = []
+            async for track in AsyncIter(tracks_from_spotify):
                 (
                     song_url,
                     track_info,
@@ -501,18 +523,23 @@ class AudioAPIInterface:
                         "last_fetched": time_now,
                     }
                 )
-                val = None
+                track_infos.append((track_info, track_name, artist_name))
+            cached_urls = {}
+            if youtube_cache:
+                cached_urls = await self.local_cache_api.youtube.fetch_many(
+                    track_info for track_info, __, __ in track_infos
+                )
+
+            if not forced and cached_urls:
+                await self.prefetch_tracks(ctx, cached_urls.values())
+
+            async def resolve(
+                track_info: str, track_name: str, artist_name: str
+            ) -> Tuple[List[lavalink.Track], Optional[str]]:
+                nonlocal skip_youtube_api
+                val = cached_urls.get(track_info)
                 llresponse = None
-                if youtube_cache:
-                    try:
-                        (val, last_updated) = await self.local_cache_api.youtube.fetch_one(
-                            {"track": track_info}
-                        )
-                    except Exception as exc:
-                        log.verbose(
-                            "Failed to fetch %r from YouTube table", track_info, exc_info=exc
-                        )
-                should_query_global = globaldb_toggle and query_global and val is None
+                should_query_global = global_entry and val is None
                 if should_query_global:
                     llresponse = await self.global_cache_api.get_spotify(track_name, artist_name)
                     if llresponse:
@@ -526,106 +553,139 @@ class AudioAPIInterface:
                             ctx, track_info, current_cache_level=current_cache_level
                         )
                     except YouTubeApiError as exc:
-                        val = None
-                        youtube_api_error = exc.message
                         skip_youtube_api = True
-                if not youtube_api_error:
-                    if youtube_cache and val and llresponse is None:
-                        task = ("update", ("youtube", {"track": track_info}))
-                        self.append_task(ctx, *task)
-
-                    if isinstance(llresponse, LoadResult):
-                        track_object = llresponse.tracks
-                    elif val:
-                        result = None
-                        if should_query_global:
-                            llresponse = await self.global_cache_api.get_call(val)
-                            if llresponse:
-                                if llresponse.get("loadType") == "V2_COMPACT":
-                                    llresponse["loadType"] = "V2_COMPAT"
-                                llresponse = LoadResult(llresponse)
-                            result = llresponse or None
-                        if not result:
-                            try:
-                                (result, called_api) = await self.fetch_track(
-                                    ctx,
-                                    player,
-                                    Query.process_input(val, self.cog.local_folder_current_path),
-                                    forced=forced,
-                                    should_query_global=not should_query_global,
-                                )
-                            except (RuntimeError, aiohttp.ServerDisconnectedError):
-                                lock(ctx, False)
-                                error_embed = discord.Embed(
-                                    colour=await ctx.embed_colour(),
-                                    title=_(
-                                        "The connection was reset while loading the playlist."
-                                    ),
-                                )
-                                if notifier is not None:
-                                    await notifier.update_embed(error_embed)
-                                break
-                            except asyncio.TimeoutError:
-                                lock(ctx, False)
-                                error_embed = discord.Embed(
-                                    colour=await ctx.embed_colour(),
-                                    title=_("Player timeout, skipping remaining tracks."),
-                                )
-                                if notifier is not None:
-                                    await notifier.update_embed(error_embed)
-                                break
-                        track_object = result.tracks
-                    else:
-                        track_object = []
-                else:
-                    track_object = []
-                if (track_count % 2 == 0) or (track_count == total_tracks):
-                    key = "lavalink"
-                    seconds = "???"
-                    second_key = None
-                    if notifier is not None:
-                        await notifier.notify_user(
-                            current=track_count,
-                            total=total_tracks,
-                            key=key,
-                            seconds_key=second_key,
-                            seconds=seconds,
-                        )
+                        return [], exc.message
+                if youtube_cache and val and llresponse is None:
+                    task = ("update", ("youtube", {"track": track_info}))
+                    self.append_task(ctx, *task)
 
-                if (youtube_api_error and not global_entry) or consecutive_fails >= (
-                    20 if global_entry else 10
-                ):
-                    error_embed = discord.Embed(
-                        colour=await ctx.embed_colour(),
-                        title=_("Failing to get tracks, skipping remaining."),
+                if isinstance(llresponse, LoadResult):
+                    return llresponse.tracks, None
+                if not val:
+                    return [], None
+                result = None
+                if should_query_global:
+                    llresponse = await self.global_cache_api.get_call(val)
+                    if llresponse:
+                        if llresponse.get("loadType") == "V2_COMPACT":
+                            llresponse["loadType"] = "V2_COMPAT"
+                        llresponse = LoadResult(llresponse)
+                    result = llresponse or None
+                if not result:
+                    (result, called_api) = await self.fetch_track(
+                        ctx,
+                        player,
+                        Query.process_input(val, self.cog.local_folder_current_path),
+                        forced=forced,
+                        should_query_global=not should_query_global,
                     )
-                    if notifier is not None:
-                        await notifier.update_embed(error_embed)
-                    if youtube_api_error:
-                        lock(ctx, False)
-                        raise SpotifyFetchError(message=youtube_api_error)
-                    break
-                if not track_object:
-                    consecutive_fails += 1
-                    continue
-                consecutive_fails = 0
-                single_track = track_object[0]
-                query = Query.process_input(single_track, self.cog.local_folder_current_path)
-                if not await self.cog.is_query_allowed(
-                    self.config,
-                    ctx,
-                    f"{single_track.title} {single_track.author} {single_track.uri} {query}",
-                    query_obj=query,
+                return result.tracks, None
+
+            # Tracks are resolved concurrently, a few ahead of the one being enqueued,
+            # so that they're still enqueued in the playlist's order as soon as possible.
+            pending: Deque[asyncio.Task] = collections.deque()
+            to_resolve = iter(track_infos)
+
+            def resolve_ahead() -> None:
+                for args in itertools.islice(
+                    to_resolve, _SPOTIFY_RESOLVE_CONCURRENCY - len(pending)
                 ):
-                    has_not_allowed = True
-                    log.debug("Query is not allowed in %r (%s)", ctx.guild.name, ctx.guild.id)
-                    continue
-                track_list.append(single_track)
-                if enqueue:
-                    if len(player.queue) >= 10000:
+                    pending.append(asyncio.create_task(resolve(*args)))
+
+            try:
+                resolve_ahead()
+                track_count = 0
+                while pending:
+                    track_count += 1
+                    try:
+                        (track_object, error) = await pending.popleft()
+                    except (RuntimeError, aiohttp.ServerDisconnectedError):
+                        lock(ctx, False)
+                        error_embed = discord.Embed(
+                            colour=await ctx.embed_colour(),
+                            title=_("The connection was reset while loading the playlist."),
+                        )
+                        if notifier is not None:
+                            await notifier.update_embed(error_embed)
+                        break
+                    except asyncio.TimeoutError:
+                        lock(ctx, False)
+                        error_embed = discord.Embed(
+                            colour=await ctx.embed_colour(),
+                            title=_("Player timeout, skipping remaining tracks."),
+                        )
+                        if notifier is not None:
+                            await notifier.update_embed(error_embed)
+                        break
+                    resolve_ahead()
+                    youtube_api_error = youtube_api_error or error
+                    if youtube_api_error:
+                        track_object = []
+                    if (track_count % 2 == 0) or (track_count == total_tracks):
+                        key = "lavalink"
+                        seconds = "???"
+                        second_key = None
+                        if notifier is not None:
+                            await notifier.notify_user(
+                                current=track_count,
+                                total=total_tracks,
+                                key=key,
+                                seconds_key=second_key,
+                                seconds=seconds,
+                            )
+
+                    if (youtube_api_error and not global_entry) or consecutive_fails >= (
+                        20 if global_entry else 10
+                    ):
+                        error_embed = discord.Embed(
+                            colour=await ctx.embed_colour(),
+                            title=_("Failing to get tracks, skipping remaining."),
+                        )
+                        if notifier is not None:
+                            await notifier.update_embed(error_embed)
+                        if youtube_api_error:
+                            lock(ctx, False)
+                            raise SpotifyFetchError(message=youtube_api_error)
+                        break
+                    if not track_object:
+                        consecutive_fails += 1
                         continue
-                    if guild_data["maxlength"] > 0:
-                        if self.cog.is_track_length_allowed(single_track, guild_data["maxlength"]):
+                    consecutive_fails = 0
+                    single_track = track_object[0]
+                    query = Query.process_input(single_track, self.cog.local_folder_current_path)
+                    if not await self.cog.is_query_allowed(
+                        self.config,
+                        ctx,
+                        f"{single_track.title} {single_track.author} {single_track.uri} {query}",
+                        query_obj=query,
+                    ):
+                        has_not_allowed = True
+                        log.debug("Query is not allowed in %r (%s)", ctx.guild.name, ctx.guild.id)
+                        continue
+                    track_list.append(single_track)
+                    if enqueue:
+                        if len(player.queue) >= 10000:
+                            continue
+                        if guild_data["maxlength"] > 0:
+                            if self.cog.is_track_length_allowed(
+                                single_track, guild_data["maxlength"]
+                            ):
+                                enqueued_tracks += 1
+                                single_track.extras.update(
+                                    {
+                                        "enqueue_time": int(time.time()),
+                                        "vc": player.channel.id,
+                                        "requester": ctx.author.id,
+                                    }
+                                )
+                                player.add(ctx.author, single_track)
+                                self.bot.dispatch(
+                                    "red_audio_track_enqueue",
+                                    player.guild,
+                                    single_track,
+                                    ctx.author,
+                                )
+                        else:
                             enqueued_tracks += 1
                             single_track.extras.update(
                                 {
@@ -641,25 +701,13 @@ class AudioAPIInterface:
                                 single_track,
                                 ctx.author,
                             )
-                    else:
-                        enqueued_tracks += 1
-                        single_track.extras.update(
-                            {
-                                "enqueue_time": int(time.time()),
-                                "vc": player.channel.id,
-                                "requester": ctx.author.id,
-                            }
-                        )
-                        player.add(ctx.author, single_track)
-                        self.bot.dispatch(
-                            "red_audio_track_enqueue",
-                            player.guild,
-                            single_track,
-                            ctx.author,
-                        )
 
-                    if not player.current:
-                        await player.play()
+                        if not player.current:
+                            await player.play()
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
             if enqueue and tracks_from_spotify:
                 if total_tracks > enqueued_tracks:
                     maxlength_msg = _(" {bad_tracks} tracks cannot be queued.").format(
@@ -760,6 +808,35 @@ class AudioAPIInterface:
             youtube_url = val
         return youtube_url
 
+    async def prefetch_tracks(
+        self, ctx: commands.Context, queries: Iterable[Union[Query, str]]
+    ) -> None:
+        """Load the cached Lavalink results of many queries in a single database query,
+        ahead of :code:`fetch_track` calls for them.
+
+        Parameters
+        ----------
+        ctx: commands.Context
+            The context the queries will be fetched under.
+        queries: Iterable[Union[audio_dataclasses.Query, str]]
+            The queries which are about to be fetched.
+        """
+        current_cache_level = CacheLevel(await self.config.cache_level())
+        if not CacheLevel.set_lavalink().is_subset(current_cache_level):
+            return
+        prefer_lyrics = await self.cog.get_lyrics_status(ctx)
+        query_strings = []
+        async for query in AsyncIter(queries):
+            query = Query.process_input(query, self.cog.local_folder_current_path)
+            if query.is_local:
+                continue
+            if prefer_lyrics and query.is_youtube and query.is_search:
+                query_strings.append(f"{query} - lyrics")
+            else:
+                query_strings.append(str(query))
+        if query_strings:
+            await self.local_cache_api.lavalink.prefetch(query_strings)
+
     async def fetch_track(
         self,
         ctx: commands.Context,
@@ -1,11 +1,22 @@
-import concurrent
 import contextlib
 import datetime
+import json
 import random
 import time
+from collections import Counter
 from pathlib import Path
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Callable, List, MutableMapping, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from red_commons.logging import getLogger
 
@@ -14,39 +25,55 @@ from redbot.core.bot import Red
 from redbot.core.commands import Cog
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
 
 from ..sql_statements import (
+    LAVALINK_COUNT,
     LAVALINK_CREATE_INDEX,
+    LAVALINK_CREATE_INDEX_LAST_FETCHED,
     LAVALINK_CREATE_TABLE,
+    LAVALINK_DELETE_LEAST_RECENTLY_FETCHED,
     LAVALINK_DELETE_OLD_ENTRIES,
     LAVALINK_FETCH_ALL_ENTRIES_GLOBAL,
     LAVALINK_QUERY,
     LAVALINK_QUERY_ALL,
-    LAVALINK_QUERY_LAST_FETCHED_RANDOM,
+    LAVALINK_QUERY_BY_ID,
+    LAVALINK_QUERY_LAST_FETCHED_RANDOM_IDS,
+    LAVALINK_QUERY_MANY,
     LAVALINK_UPDATE,
     LAVALINK_UPSERT,
+    SPOTIFY_COUNT,
     SPOTIFY_CREATE_INDEX,
+    SPOTIFY_CREATE_INDEX_LAST_FETCHED,
     SPOTIFY_CREATE_TABLE,
+    SPOTIFY_DELETE_LEAST_RECENTLY_FETCHED,
     SPOTIFY_DELETE_OLD_ENTRIES,
     SPOTIFY_QUERY,
     SPOTIFY_QUERY_ALL,
     SPOTIFY_QUERY_LAST_FETCHED_RANDOM,
     SPOTIFY_UPDATE,
     SPOTIFY_UPSERT,
+    YOUTUBE_COUNT,
     YOUTUBE_CREATE_INDEX,
+    YOUTUBE_CREATE_INDEX_LAST_FETCHED,
     YOUTUBE_CREATE_TABLE,
+    YOUTUBE_DELETE_LEAST_RECENTLY_FETCHED,
     YOUTUBE_DELETE_OLD_ENTRIES,
     YOUTUBE_QUERY,
     YOUTUBE_QUERY_ALL,
     YOUTUBE_QUERY_LAST_FETCHED_RANDOM,
+    YOUTUBE_QUERY_MANY,
     YOUTUBE_UPDATE,
     YOUTUBE_UPSERT,
+    VACUUM,
+    PRAGMA_FETCH_auto_vacuum,
     PRAGMA_FETCH_user_version,
+    PRAGMA_SET_auto_vacuum,
     PRAGMA_SET_journal_mode,
     PRAGMA_SET_read_uncommitted,
     PRAGMA_SET_temp_store,
     PRAGMA_SET_user_version,
+    PRAGMA_incremental_vacuum,
 )
 from .api_utils import (
     LavalinkCacheFetchForGlobalResult,
@@ -62,11 +89,18 @@ if TYPE_CHECKING:
 log = getLogger("red.cogs.Audio.api.LocalDB")
 _ = Translator("Audio", Path(__file__))
 _SCHEMA_VERSION = 3
+# How many random tracks are picked from the Lavalink table at once, and for how long (in seconds)
+_RANDOM_POOL_SIZE = 100
+_RANDOM_POOL_TTL = 600
+# How long (in seconds) prefetched Lavalink entries are kept for
+_PREFETCH_TTL = 60
+# The auto_vacuum mode which lets evicted pages be given back to the file system
+_AUTO_VACUUM_INCREMENTAL = 2
 
 
 class BaseWrapper:
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, conn: ThreadedAPSWConnection, cog: Union["Audio", Cog]
     ):
         self.bot = bot
         self.config = config
@@ -79,21 +113,25 @@ class BaseWrapper:
         self.statement.get_user_version = PRAGMA_FETCH_user_version
         self.fetch_result: Optional[Callable] = None
         self.cog = cog
+        # Hits, misses and evictions since the cog was loaded
+        self.stats: Counter = Counter()
 
     async def init(self) -> None:
         """Initialize the local cache"""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.pragma_temp_store)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_journal_mode)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_read_uncommitted)
-            executor.submit(self.maybe_migrate)
-            executor.submit(self.database.cursor().execute, LAVALINK_CREATE_TABLE)
-            executor.submit(self.database.cursor().execute, LAVALINK_CREATE_INDEX)
-            executor.submit(self.database.cursor().execute, YOUTUBE_CREATE_TABLE)
-            executor.submit(self.database.cursor().execute, YOUTUBE_CREATE_INDEX)
-            executor.submit(self.database.cursor().execute, SPOTIFY_CREATE_TABLE)
-            executor.submit(self.database.cursor().execute, SPOTIFY_CREATE_INDEX)
-            await self.clean_up_old_entries()
+        await self.database.execute(self.statement.pragma_temp_store, transaction=False)
+        await self.database.execute(self.statement.pragma_journal_mode, transaction=False)
+        await self.database.execute(self.statement.pragma_read_uncommitted, transaction=False)
+        await self.maybe_migrate()
+        await self.database.execute(LAVALINK_CREATE_TABLE)
+        await self.database.execute(LAVALINK_CREATE_INDEX)
+        await self.database.execute(LAVALINK_CREATE_INDEX_LAST_FETCHED)
+        await self.database.execute(YOUTUBE_CREATE_TABLE)
+        await self.database.execute(YOUTUBE_CREATE_INDEX)
+        await self.database.execute(YOUTUBE_CREATE_INDEX_LAST_FETCHED)
+        await self.database.execute(SPOTIFY_CREATE_TABLE)
+        await self.database.execute(SPOTIFY_CREATE_INDEX)
+        await self.database.execute(SPOTIFY_CREATE_INDEX_LAST_FETCHED)
+        await self.clean_up_old_entries()
 
     def close(self) -> None:
         """Close the connection with the local cache"""
@@ -106,39 +144,46 @@ class BaseWrapper:
         maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=max_age)
         maxage_int = int(time.mktime(maxage.timetuple()))
         values = {"maxage": maxage_int}
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, LAVALINK_DELETE_OLD_ENTRIES, values)
-            executor.submit(self.database.cursor().execute, YOUTUBE_DELETE_OLD_ENTRIES, values)
-            executor.submit(self.database.cursor().execute, SPOTIFY_DELETE_OLD_ENTRIES, values)
-
-    def maybe_migrate(self) -> None:
+        await self.database.execute(LAVALINK_DELETE_OLD_ENTRIES, values)
+        await self.database.execute(YOUTUBE_DELETE_OLD_ENTRIES, values)
+        await self.database.execute(SPOTIFY_DELETE_OLD_ENTRIES, values)
+
+    async def count(self) -> int:
+        """Get the number of entries in the table"""
+        row = await self.database.fetchone(self.statement.count)
+        return row[0] if row else 0
+
+    async def evict(self, max_entries: int) -> int:
+        """Delete the least recently fetched entries beyond `max_entries` from the table
+
+        Returns the number of deleted entries.
+        """
+        excess = await self.count() - max_entries
+        if excess <= 0:
+            return 0
+        await self.database.execute(
+            self.statement.delete_least_recently_fetched, {"count": excess}
+        )
+        self.stats["evictions"] += excess
+        return excess
+
+    async def maybe_migrate(self) -> None:
         """Maybe migrate Database schema for the local cache"""
         current_version = 0
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_user_version)]
-            ):
-                try:
-                    row_result = future.result()
-                    current_version = row_result.fetchone()
-                    break
-                except Exception as exc:
-                    log.verbose("Failed to completed fetch from database", exc_info=exc)
-            if isinstance(current_version, tuple):
-                current_version = current_version[0]
-            if current_version == _SCHEMA_VERSION:
-                return
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.set_user_version,
-                {"version": _SCHEMA_VERSION},
-            )
+        try:
+            current_version = await self.database.fetchone(self.statement.get_user_version)
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
+        if isinstance(current_version, tuple):
+            current_version = current_version[0]
+        if current_version == _SCHEMA_VERSION:
+            return
+        await self.database.execute(self.statement.set_user_version, {"version": _SCHEMA_VERSION})
 
     async def insert(self, values: List[MutableMapping]) -> None:
         """Insert an entry into the local cache"""
         try:
-            with self.database.transaction() as transaction:
-                transaction.executemany(self.statement.upsert, values)
+            await self.database.executemany(self.statement.upsert, values)
         except Exception as exc:
             log.trace("Error during table insert", exc_info=exc)
 
@@ -148,8 +193,7 @@ class BaseWrapper:
         try:
             time_now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
             values["last_fetched"] = time_now
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                executor.submit(self.database.cursor().execute, self.statement.update, values)
+            await self.database.execute(self.statement.update, values)
         except Exception as exc:
             log.verbose("Error during table update", exc_info=exc)
 
@@ -164,15 +208,11 @@ class BaseWrapper:
         maxage_int = int(time.mktime(maxage.timetuple()))
         values.update({"maxage": maxage_int})
         row = None
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_one, values)]
-            ):
-                try:
-                    row_result = future.result()
-                    row = row_result.fetchone()
-                except Exception as exc:
-                    log.verbose("Failed to completed fetch from database", exc_info=exc)
+        try:
+            row = await self.database.fetchone(self.statement.get_one, values)
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
+        self.stats["hits" if row else "misses"] += 1
         if not row:
             return None
         if self.fetch_result is None:
@@ -187,14 +227,10 @@ class BaseWrapper:
         row_result = []
         if self.fetch_result is None:
             return []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_all, values)]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    log.verbose("Failed to completed fetch from database", exc_info=exc)
+        try:
+            row_result = await self.database.fetchall(self.statement.get_all, values)
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
         async for row in AsyncIter(row_result):
             output.append(self.fetch_result(*row))
         return output
@@ -206,23 +242,12 @@ class BaseWrapper:
     ]:
         """Get a random entry from the local cache"""
         row = None
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute, self.statement.get_random, values
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                    rows = row_result.fetchall()
-                    if rows:
-                        row = random.choice(rows)
-                    else:
-                        row = None
-                except Exception as exc:
-                    log.verbose("Failed to completed random fetch from database", exc_info=exc)
+        try:
+            rows = await self.database.fetchall(self.statement.get_random, values)
+            if rows:
+                row = random.choice(rows)
+        except Exception as exc:
+            log.verbose("Failed to completed random fetch from database", exc_info=exc)
         if not row:
             return None
         if self.fetch_result is None:
@@ -232,14 +257,17 @@ class BaseWrapper:
 
 class YouTubeTableWrapper(BaseWrapper):
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, conn: ThreadedAPSWConnection, cog: Union["Audio", Cog]
     ):
         super().__init__(bot, config, conn, cog)
         self.statement.upsert = YOUTUBE_UPSERT
         self.statement.update = YOUTUBE_UPDATE
+        self.statement.count = YOUTUBE_COUNT
+        self.statement.delete_least_recently_fetched = YOUTUBE_DELETE_LEAST_RECENTLY_FETCHED
         self.statement.get_one = YOUTUBE_QUERY
         self.statement.get_all = YOUTUBE_QUERY_ALL
         self.statement.get_random = YOUTUBE_QUERY_LAST_FETCHED_RANDOM
+        self.statement.get_many = YOUTUBE_QUERY_MANY
         self.fetch_result = YouTubeCacheFetchResult
 
     async def fetch_one(
@@ -251,6 +279,26 @@ class YouTubeTableWrapper(BaseWrapper):
             return None, None
         return result.query, result.updated_on
 
+    async def fetch_many(self, tracks: Iterable[str]) -> Dict[str, str]:
+        """Get the entries of many tracks from the Youtube table, in a single query"""
+        max_age = await self.config.cache_age()
+        maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=max_age)
+        maxage_int = int(time.mktime(maxage.timetuple()))
+        tracks = list(tracks)
+        values = {"tracks": json.dumps(tracks), "maxage": maxage_int}
+        output = {}
+        try:
+            rows = await self.database.fetchall(self.statement.get_many, values)
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
+            return output
+        for track_info, youtube_url, __ in rows:
+            if isinstance(youtube_url, str):
+                output.setdefault(track_info, youtube_url)
+        self.stats["hits"] += len(output)
+        self.stats["misses"] += len(tracks) - len(output)
+        return output
+
     async def fetch_all(self, values: MutableMapping) -> List[YouTubeCacheFetchResult]:
         """Get all entries from the Youtube table"""
         result = await self._fetch_all(values)
@@ -268,11 +316,13 @@ class YouTubeTableWrapper(BaseWrapper):
 
 class SpotifyTableWrapper(BaseWrapper):
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, conn: ThreadedAPSWConnection, cog: Union["Audio", Cog]
     ):
         super().__init__(bot, config, conn, cog)
         self.statement.upsert = SPOTIFY_UPSERT
         self.statement.update = SPOTIFY_UPDATE
+        self.statement.count = SPOTIFY_COUNT
+        self.statement.delete_least_recently_fetched = SPOTIFY_DELETE_LEAST_RECENTLY_FETCHED
         self.statement.get_one = SPOTIFY_QUERY
         self.statement.get_all = SPOTIFY_QUERY_ALL
         self.statement.get_random = SPOTIFY_QUERY_LAST_FETCHED_RANDOM
@@ -304,27 +354,104 @@ class SpotifyTableWrapper(BaseWrapper):
 
 class LavalinkTableWrapper(BaseWrapper):
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, conn: ThreadedAPSWConnection, cog: Union["Audio", Cog]
     ):
         super().__init__(bot, config, conn, cog)
         self.statement.upsert = LAVALINK_UPSERT
         self.statement.update = LAVALINK_UPDATE
+        self.statement.count = LAVALINK_COUNT
+        self.statement.delete_least_recently_fetched = LAVALINK_DELETE_LEAST_RECENTLY_FETCHED
         self.statement.get_one = LAVALINK_QUERY
         self.statement.get_all = LAVALINK_QUERY_ALL
-        self.statement.get_random = LAVALINK_QUERY_LAST_FETCHED_RANDOM
+        self.statement.get_many = LAVALINK_QUERY_MANY
+        self.statement.get_by_id = LAVALINK_QUERY_BY_ID
+        self.statement.get_random_ids = LAVALINK_QUERY_LAST_FETCHED_RANDOM_IDS
         self.statement.get_all_global = LAVALINK_FETCH_ALL_ENTRIES_GLOBAL
         self.fetch_result = LavalinkCacheFetchResult
         self.fetch_for_global: Optional[Callable] = LavalinkCacheFetchForGlobalResult
+        self._prefetched: Dict[str, Tuple[float, LavalinkCacheFetchResult]] = {}
+        self._random_pool: List[int] = []
+        self._random_pool_expires = 0.0
 
     async def fetch_one(
         self, values: MutableMapping
     ) -> Tuple[Optional[MutableMapping], Optional[datetime.datetime]]:
         """Get an entry from the Lavalink table"""
-        result = await self._fetch_one(values)
+        prefetched = self._prefetched.pop(values["query"], None)
+        if prefetched is not None and prefetched[0] > time.monotonic():
+            result = prefetched[1]
+            self.stats["hits"] += 1
+        else:
+            result = await self._fetch_one(values)
         if not result or not isinstance(result.query, dict):
             return None, None
         return result.query, result.updated_on
 
+    async def fetch_many(self, queries: Iterable[str]) -> Dict[str, LavalinkCacheFetchResult]:
+        """Get the entries of many queries from the Lavalink table, in a single query"""
+        max_age = await self.config.cache_age()
+        maxage = datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=max_age)
+        maxage_int = int(time.mktime(maxage.timetuple()))
+        values = {"queries": json.dumps(list(queries)), "maxage": maxage_int}
+        output = {}
+        try:
+            rows = await self.database.fetchall(self.statement.get_many, values)
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
+            return output
+        async for query, data, last_updated in AsyncIter(rows):
+            output[query] = LavalinkCacheFetchResult(data, last_updated)
+        return output
+
+    async def prefetch(self, queries: Iterable[str]) -> None:
+        """Load the entries of many queries at once, for `fetch_one` to use in the next minute"""
+        now = time.monotonic()
+        self._prefetched = {
+            query: entry for query, entry in self._prefetched.items() if entry[0] > now
+        }
+        expires = now + _PREFETCH_TTL
+        for query, result in (await self.fetch_many(queries)).items():
+            self._prefetched[query] = (expires, result)
+
+    async def fetch_random(self, values: MutableMapping) -> Optional[MutableMapping]:
+        """Get a random entry from the Lavalink table
+
+        Entries are drawn from a pool of random entries, which is refilled
+        when it runs out or gets old, rather than searching the table on every call.
+        """
+        refilled = False
+        if not self._random_pool or self._random_pool_expires < time.monotonic():
+            if not await self._fill_random_pool(values):
+                return None
+            refilled = True
+        while True:
+            while self._random_pool:
+                # The entry might have been replaced or deleted since the pool was filled.
+                row = await self.database.fetchone(
+                    self.statement.get_by_id,
+                    {"id": self._random_pool.pop(), "maxage": values["maxage"]},
+                )
+                if row:
+                    result = self.fetch_result(*row)
+                    if isinstance(result.query, dict):
+                        return result.query
+            # Every entry of an old pool was stale, try once more with a fresh one.
+            if refilled or not await self._fill_random_pool(values):
+                return None
+            refilled = True
+
+    async def _fill_random_pool(self, values: MutableMapping) -> bool:
+        try:
+            rows = await self.database.fetchall(
+                self.statement.get_random_ids, {**values, "limit": _RANDOM_POOL_SIZE}
+            )
+        except Exception as exc:
+            log.verbose("Failed to completed random fetch from database", exc_info=exc)
+            return False
+        self._random_pool = [rowid for (rowid,) in rows]
+        self._random_pool_expires = time.monotonic() + _RANDOM_POOL_TTL
+        return True
+
     async def fetch_all(self, values: MutableMapping) -> List[LavalinkCacheFetchResult]:
         """Get all entries from the Lavalink table"""
         result = await self._fetch_all(values)
@@ -332,27 +459,16 @@ class LavalinkTableWrapper(BaseWrapper):
             return result
         return []
 
-    async def fetch_random(self, values: MutableMapping) -> Optional[MutableMapping]:
-        """Get a random entry from the Lavalink table"""
-        result = await self._fetch_random(values)
-        if not result or not isinstance(result.query, dict):
-            return None
-        return result.query
-
     async def fetch_all_for_global(self) -> List[LavalinkCacheFetchForGlobalResult]:
         """Get all entries from the Lavalink table"""
         output: List[LavalinkCacheFetchForGlobalResult] = []
         row_result = []
         if self.fetch_for_global is None:
             return []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [executor.submit(self.database.cursor().execute, self.statement.get_all_global)]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    log.verbose("Failed to completed fetch from database", exc_info=exc)
+        try:
+            row_result = await self.database.fetchall(self.statement.get_all_global)
+        except Exception as exc:
+            log.verbose("Failed to completed fetch from database", exc_info=exc)
         async for row in AsyncIter(row_result):
             output.append(self.fetch_for_global(*row))
         return output
@@ -362,7 +478,7 @@ class LocalCacheWrapper:
     """Wraps all table apis into 1 object representing the local cache"""
 
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, conn: ThreadedAPSWConnection, cog: Union["Audio", Cog]
     ):
         self.bot = bot
         self.config = config
@@ -371,3 +487,29 @@ class LocalCacheWrapper:
         self.lavalink: LavalinkTableWrapper = LavalinkTableWrapper(bot, config, conn, self.cog)
         self.spotify: SpotifyTableWrapper = SpotifyTableWrapper(bot, config, conn, self.cog)
         self.youtube: YouTubeTableWrapper = YouTubeTableWrapper(bot, config, conn, self.cog)
+
+    @property
+    def tables(self) -> Dict[str, BaseWrapper]:
+        """The wrappers of the cache tables, by name"""
+        return {"lavalink": self.lavalink, "spotify": self.spotify, "youtube": self.youtube}
+
+    async def run_maintenance(self, max_entries: int) -> Dict[str, int]:
+        """Expire old entries, evict the least recently fetched ones and shrink the database
+
+        Returns the number of entries evicted from each table.
+        """
+        row = await self.database.fetchone(PRAGMA_FETCH_auto_vacuum)
+        if row and row[0] != _AUTO_VACUUM_INCREMENTAL:
+            # Databases created before the cache was bounded have to be rebuilt once.
+            log.info(
+                "Enabling incremental vacuuming of the Audio database, this may take a while."
+            )
+            await self.database.execute(PRAGMA_SET_auto_vacuum, transaction=False)
+            await self.database.execute(VACUUM, transaction=False)
+        await self.lavalink.clean_up_old_entries()
+        evicted = {}
+        for name, table in self.tables.items():
+            evicted[name] = await table.evict(max_entries) if max_entries else 0
+        # Every step of the pragma frees a single page.
+        await self.database.fetchall(PRAGMA_incremental_vacuum)
+        return evicted
@@ -0,0 +1,206 @@
+import asyncio
+import os
+from collections import defaultdict
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, List, MutableMapping, Optional, Set, Tuple, Union
+
+from red_commons.logging import getLogger
+
+from redbot.core import Config
+from redbot.core.bot import Red
+from redbot.core.commands import Cog
+from redbot.core.i18n import Translator
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
+
+from ..audio_dataclasses import LocalPath
+from ..sql_statements import (
+    LOCAL_TRACKS_CREATE_INDEX,
+    LOCAL_TRACKS_CREATE_TABLE,
+    LOCAL_TRACKS_DELETE_FOLDER,
+    LOCAL_TRACKS_FETCH_FOLDER,
+    LOCAL_TRACKS_FETCH_TREE,
+    LOCAL_TRACKS_FOLDERS_CREATE_INDEX,
+    LOCAL_TRACKS_FOLDERS_CREATE_TABLE,
+    LOCAL_TRACKS_FOLDERS_DELETE,
+    LOCAL_TRACKS_FOLDERS_FETCH_ALL,
+    LOCAL_TRACKS_FOLDERS_FETCH_CHILDREN,
+    LOCAL_TRACKS_FOLDERS_FETCH_TREE,
+    LOCAL_TRACKS_FOLDERS_UPSERT,
+    LOCAL_TRACKS_INSERT,
+    PRAGMA_SET_journal_mode,
+    PRAGMA_SET_read_uncommitted,
+    PRAGMA_SET_temp_store,
+)
+
+log = getLogger("red.cogs.Audio.api.LocalTracksWrapper")
+_ = Translator("Audio", Path(__file__))
+
+if TYPE_CHECKING:
+    from .. import Audio
+
+
+class LocalTracksWrapper:
+    """Index of the local tracks folder, stored in the Audio database.
+
+    The folder tree is walked with a single :func:`os.scandir` per directory.
+    On refresh, only directories whose modification time changed are listed again,
+    every other directory costs a single ``stat`` call.
+    """
+
+    def __init__(
+        self, bot: Red, config: Config, conn: ThreadedAPSWConnection, cog: Union["Audio", Cog]
+    ):
+        self.bot = bot
+        self.database = conn
+        self.config = config
+        self.cog = cog
+        self.statement = SimpleNamespace()
+        self.statement.pragma_temp_store = PRAGMA_SET_temp_store
+        self.statement.pragma_journal_mode = PRAGMA_SET_journal_mode
+        self.statement.pragma_read_uncommitted = PRAGMA_SET_read_uncommitted
+        self.statement.create_table = LOCAL_TRACKS_CREATE_TABLE
+        self.statement.create_index = LOCAL_TRACKS_CREATE_INDEX
+        self.statement.folders_create_table = LOCAL_TRACKS_FOLDERS_CREATE_TABLE
+        self.statement.folders_create_index = LOCAL_TRACKS_FOLDERS_CREATE_INDEX
+
+        self.statement.insert = LOCAL_TRACKS_INSERT
+        self.statement.delete_folder = LOCAL_TRACKS_DELETE_FOLDER
+        self.statement.folders_upsert = LOCAL_TRACKS_FOLDERS_UPSERT
+        self.statement.folders_delete = LOCAL_TRACKS_FOLDERS_DELETE
+
+        self.statement.get_folder = LOCAL_TRACKS_FETCH_FOLDER
+        self.statement.get_tree = LOCAL_TRACKS_FETCH_TREE
+        self.statement.folders_get_all = LOCAL_TRACKS_FOLDERS_FETCH_ALL
+        self.statement.folders_get_children = LOCAL_TRACKS_FOLDERS_FETCH_CHILDREN
+        self.statement.folders_get_tree = LOCAL_TRACKS_FOLDERS_FETCH_TREE
+        self._lock = asyncio.Lock()
+
+    async def init(self) -> None:
+        """Initialize the local tracks tables"""
+        await self.database.execute(self.statement.pragma_temp_store, transaction=False)
+        await self.database.execute(self.statement.pragma_journal_mode, transaction=False)
+        await self.database.execute(self.statement.pragma_read_uncommitted, transaction=False)
+        await self.database.execute(self.statement.create_table)
+        await self.database.execute(self.statement.create_index)
+        await self.database.execute(self.statement.folders_create_table)
+        await self.database.execute(self.statement.folders_create_index)
+
+    async def refresh(self, root: Union[Path, str]) -> None:
+        """Bring the index of the given localtracks folder up to date"""
+        async with self._lock:
+            try:
+                rows = await self.database.fetchall(self.statement.folders_get_all)
+                # The walk runs in the default executor, to keep the database free meanwhile.
+                changed, removed = await asyncio.get_running_loop().run_in_executor(
+                    None, self._scan, str(root), rows
+                )
+                if changed or removed:
+                    await self.database.run(self._store, changed, removed)
+                    log.debug(
+                        "Local tracks index refreshed: %s folders listed, %s removed.",
+                        len(changed),
+                        len(removed),
+                    )
+            except Exception as exc:
+                log.verbose("Failed to refresh the local tracks index", exc_info=exc)
+
+    async def fetch_tracks(self, folder: Union[Path, str], recursive: bool) -> List[str]:
+        """Fetch the paths of all indexed tracks in the given folder"""
+        folder = str(folder)
+        if recursive:
+            return await self._fetch(self.statement.get_tree, _tree_range(folder))
+        return await self._fetch(self.statement.get_folder, {"folder": folder})
+
+    async def fetch_folders(self, folder: Union[Path, str], recursive: bool) -> List[str]:
+        """Fetch the paths of all indexed subfolders of the given folder"""
+        folder = str(folder)
+        if recursive:
+            return await self._fetch(self.statement.folders_get_tree, _tree_range(folder))
+        return await self._fetch(self.statement.folders_get_children, {"parent": folder})
+
+    async def _fetch(self, statement: str, values: MutableMapping) -> List[str]:
+        try:
+            return [row[0] for row in await self.database.fetchall(statement, values)]
+        except Exception as exc:
+            log.verbose("Failed to fetch from the local tracks index", exc_info=exc)
+            return []
+
+    def _scan(
+        self, root: str, rows: List[Tuple[str, Optional[str], int]]
+    ) -> Tuple[List[Tuple[str, Optional[str], int, List[str]]], Set[str]]:
+        known: Dict[str, int] = {}
+        children: Dict[str, List[str]] = defaultdict(list)
+        for path, parent, mtime in rows:
+            known[path] = mtime
+            if parent is not None:
+                children[parent].append(path)
+
+        visited: Set[str] = set()
+        changed: List[Tuple[str, Optional[str], int, List[str]]] = []
+        real_paths: Set[str] = {os.path.realpath(root)}
+        stack: List[Tuple[str, Optional[str]]] = [(root, None)]
+        while stack:
+            folder, parent = stack.pop()
+            if folder in visited:
+                continue
+            try:
+                mtime = os.stat(folder).st_mtime_ns
+            except OSError:
+                continue
+            visited.add(folder)
+            if known.get(folder) == mtime:
+                stack.extend((child, folder) for child in children.get(folder, ()))
+                continue
+
+            tracks = []
+            try:
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        # Mirror `glob`, which skips hidden files and folders
+                        if entry.name.startswith("."):
+                            continue
+                        try:
+                            if entry.is_dir():
+                                if entry.is_symlink():
+                                    # Avoid walking symlink loops forever
+                                    real_path = os.path.realpath(entry.path)
+                                    if real_path in real_paths:
+                                        continue
+                                    real_paths.add(real_path)
+                                stack.append((entry.path, folder))
+                            elif (
+                                os.path.splitext(entry.name)[1] in LocalPath._all_music_ext
+                                and entry.is_file()
+                            ):
+                                tracks.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError:
+                visited.discard(folder)
+                continue
+            changed.append((folder, parent, mtime, tracks))
+
+        return changed, known.keys() - visited
+
+    def _store(
+        self, changed: List[Tuple[str, Optional[str], int, List[str]]], removed: Set[str]
+    ) -> None:
+        with self.database.connection.transaction() as transaction:
+            for folder in removed:
+                transaction.execute(self.statement.folders_delete, {"path": folder})
+                transaction.execute(self.statement.delete_folder, {"folder": folder})
+            for folder, parent, mtime, tracks in changed:
+                transaction.execute(
+                    self.statement.folders_upsert,
+                    {"path": folder, "parent": parent, "mtime": mtime},
+                )
+                transaction.execute(self.statement.delete_folder, {"folder": folder})
+                transaction.executemany(
+                    self.statement.insert, [{"path": t, "folder": folder} for t in tracks]
+                )
+
+
+def _tree_range(folder: str) -> MutableMapping:
+    # Every path below `folder` sorts between these two strings.
+    return {"start": folder + os.sep, "end": folder + chr(ord(os.sep) + 1)}
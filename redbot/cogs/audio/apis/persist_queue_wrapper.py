@@ -1,10 +1,23 @@
-import concurrent
+import asyncio
+import itertools
 import json
+import operator
 import time
+from collections import defaultdict
 from pathlib import Path
 
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, List, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    DefaultDict,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import lavalink
 from red_commons.logging import getLogger
@@ -14,7 +27,7 @@ from redbot.core.bot import Red
 from redbot.core.commands import Cog
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
 
 from ..sql_statements import (
     PERSIST_QUEUE_BULK_PLAYED,
@@ -23,6 +36,8 @@ from ..sql_statements import (
     PERSIST_QUEUE_DELETE_SCHEDULED,
     PERSIST_QUEUE_DROP_TABLE,
     PERSIST_QUEUE_FETCH_ALL,
+    PERSIST_QUEUE_FETCH_GUILD,
+    PERSIST_QUEUE_FETCH_GUILD_IDS,
     PERSIST_QUEUE_PLAYED,
     PERSIST_QUEUE_UPSERT,
     PRAGMA_FETCH_user_version,
@@ -35,6 +50,7 @@ from .api_utils import QueueFetchResult
 
 log = getLogger("red.cogs.Audio.api.PersistQueueWrapper")
 _ = Translator("Audio", Path(__file__))
+_FLUSH_DELAY = 0.5
 
 if TYPE_CHECKING:
     from .. import Audio
@@ -42,7 +58,7 @@ if TYPE_CHECKING:
 
 class QueueInterface:
     def __init__(
-        self, bot: Red, config: Config, conn: APSWConnectionWrapper, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, conn: ThreadedAPSWConnection, cog: Union["Audio", Cog]
     ):
         self.bot = bot
         self.database = conn
@@ -63,73 +79,110 @@ class QueueInterface:
         self.statement.drop_table = PERSIST_QUEUE_DROP_TABLE
 
         self.statement.get_all = PERSIST_QUEUE_FETCH_ALL
+        self.statement.get_guild_ids = PERSIST_QUEUE_FETCH_GUILD_IDS
+        self.statement.get_guild = PERSIST_QUEUE_FETCH_GUILD
         self.statement.get_player = PERSIST_QUEUE_PLAYED
+        self._pending: DefaultDict[int, List[Tuple[str, MutableMapping[str, Any]]]] = defaultdict(
+            list
+        )
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def init(self) -> None:
         """Initialize the PersistQueue table"""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.pragma_temp_store)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_journal_mode)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_read_uncommitted)
-            executor.submit(self.database.cursor().execute, self.statement.create_table)
-            executor.submit(self.database.cursor().execute, self.statement.create_index)
+        await self.database.execute(self.statement.pragma_temp_store, transaction=False)
+        await self.database.execute(self.statement.pragma_journal_mode, transaction=False)
+        await self.database.execute(self.statement.pragma_read_uncommitted, transaction=False)
+        await self.database.execute(self.statement.create_table)
+        await self.database.execute(self.statement.create_index)
 
     async def fetch_all(self) -> List[QueueFetchResult]:
         """Fetch all playlists"""
+        await self.flush()
         output = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute,
-                        self.statement.get_all,
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    log.verbose("Failed to complete playlist fetch from database", exc_info=exc)
-                    return []
+        try:
+            row_result = await self.database.fetchall(self.statement.get_all)
+        except Exception as exc:
+            log.verbose("Failed to complete playlist fetch from database", exc_info=exc)
+            return []
 
         async for index, row in AsyncIter(row_result).enumerate(start=1):
             output.append(QueueFetchResult(*row))
         return output
 
+    async def fetch_by_guild(self) -> AsyncIterator[Tuple[int, List[QueueFetchResult]]]:
+        """Fetch the queued tracks one guild at a time, in the order they were enqueued"""
+        await self.flush()
+        try:
+            guild_ids = await self.database.fetchall(self.statement.get_guild_ids)
+        except Exception as exc:
+            log.verbose("Failed to complete queue fetch from database", exc_info=exc)
+            return
+        for (guild_id,) in guild_ids:
+            try:
+                rows = await self.database.fetchall(
+                    self.statement.get_guild, {"guild_id": guild_id}
+                )
+            except Exception as exc:
+                log.verbose("Failed to complete queue fetch from database", exc_info=exc)
+                continue
+            if rows:
+                yield guild_id, [QueueFetchResult(*row) async for row in AsyncIter(rows)]
+
     async def played(self, guild_id: int, track_id: str) -> None:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                PERSIST_QUEUE_PLAYED,
-                {"guild_id": guild_id, "track_id": track_id},
-            )
+        self._buffer(guild_id, PERSIST_QUEUE_PLAYED, {"guild_id": guild_id, "track_id": track_id})
 
     async def delete_scheduled(self):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, PERSIST_QUEUE_DELETE_SCHEDULED)
+        await self.flush()
+        await self.database.execute(PERSIST_QUEUE_DELETE_SCHEDULED)
 
     async def drop(self, guild_id: int):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute, PERSIST_QUEUE_BULK_PLAYED, ({"guild_id": guild_id})
-            )
+        self._buffer(guild_id, PERSIST_QUEUE_BULK_PLAYED, {"guild_id": guild_id})
+        await self.flush(guild_id)
 
     async def enqueued(self, guild_id: int, room_id: int, track: lavalink.Track):
+        self._buffer(guild_id, PERSIST_QUEUE_UPSERT, self._track_values(guild_id, room_id, track))
+
+    def _track_values(
+        self, guild_id: int, room_id: int, track: lavalink.Track
+    ) -> MutableMapping[str, Any]:
         enqueue_time = track.extras.get("enqueue_time", 0)
         if enqueue_time == 0:
             track.extras["enqueue_time"] = int(time.time())
-        track_identifier = track.track_identifier
-        track = self.cog.track_to_json(track)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                PERSIST_QUEUE_UPSERT,
-                {
-                    "guild_id": int(guild_id),
-                    "room_id": int(room_id),
-                    "played": False,
-                    "time": enqueue_time,
-                    "track": json.dumps(track),
-                    "track_id": track_identifier,
-                },
-            )
+        return {
+            "guild_id": int(guild_id),
+            "room_id": int(room_id),
+            "played": False,
+            "time": enqueue_time,
+            "track": json.dumps(self.cog.track_to_json(track)),
+            "track_id": track.track_identifier,
+        }
+
+    def _buffer(self, guild_id: int, statement: str, values: MutableMapping[str, Any]) -> None:
+        # Writes are buffered per guild and flushed together shortly after,
+        # or as soon as the guild's player is stopped.
+        self._pending[guild_id].append((statement, values))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(_FLUSH_DELAY)
+        await self.flush()
+
+    async def flush(self, guild_id: Optional[int] = None) -> None:
+        """Write the buffered changes of the given guild, or of all guilds, to the database"""
+        if guild_id is None:
+            writes = [write for writes in self._pending.values() for write in writes]
+            self._pending.clear()
+        else:
+            writes = self._pending.pop(guild_id, [])
+        if not writes:
+            return
+        try:
+            await self.database.run(self._write, writes)
+        except Exception as exc:
+            log.warning("Failed to write the queue to the database", exc_info=exc)
+
+    def _write(self, writes: List[Tuple[str, MutableMapping[str, Any]]]) -> None:
+        with self.database.connection.transaction() as transaction:
+            for statement, group in itertools.groupby(writes, key=operator.itemgetter(0)):
+                transaction.executemany(statement, [values for __, values in group])
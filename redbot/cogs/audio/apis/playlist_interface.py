@@ -34,6 +34,7 @@ class Playlist:
         playlist_url: Optional[str] = None,
         tracks: Optional[List[MutableMapping]] = None,
         guild: Union[discord.Guild, int, None] = None,
+        track_count: Optional[int] = None,
     ):
         self.bot = bot
         self.guild = guild
@@ -51,14 +52,40 @@ class Playlist:
         self.tracks = tracks or []
         self.tracks_obj = [lavalink.Track(data=track) for track in self.tracks]
         self.playlist_api = playlist_api
+        # The number of stored tracks, while they haven't been loaded.
+        self._track_count = track_count
+        # The tracks as they are stored, and their positions in the playlist tracks table.
+        self._saved_tracks: List[MutableMapping] = []
+        self._saved_positions: Optional[List[int]] = None
 
     def __repr__(self):
         return (
             f"Playlist(name={self.name}, id={self.id}, scope={self.scope}, "
             f"scope_id={self.scope_id}, author={self.author_id}, "
-            f"tracks={len(self.tracks)}, url={self.url})"
+            f"tracks={self.track_count}, url={self.url})"
         )
 
+    @property
+    def track_count(self) -> int:
+        """int: The number of tracks in the playlist, even if they haven't been loaded."""
+        if self._track_count is not None:
+            return self._track_count
+        return len(self.tracks)
+
+    async def load_tracks(self) -> "Playlist":
+        """Loads the tracks of a Playlist fetched without them."""
+        scope, scope_id = self.config_scope
+        positions, tracks = await self.playlist_api.fetch_tracks(scope, int(self.id), scope_id)
+        self.tracks = tracks
+        self.tracks_obj = [lavalink.Track(data=track) for track in tracks]
+        self._mark_saved(positions)
+        return self
+
+    def _mark_saved(self, positions: List[int]) -> None:
+        self._track_count = None
+        self._saved_tracks = list(self.tracks)
+        self._saved_positions = positions
+
     async def edit(self, data: MutableMapping):
         """
         Edits a Playlist.
@@ -77,7 +104,11 @@ class Playlist:
         return self
 
     async def save(self):
-        """Saves a Playlist."""
+        """Saves a Playlist.
+
+        Only the tracks added to the end of the playlist or removed from it since it was
+        loaded are written, any other change to its tracks rewrites all of them.
+        """
         scope, scope_id = self.config_scope
         await self.playlist_api.upsert(
             scope,
@@ -86,8 +117,47 @@ class Playlist:
             scope_id=scope_id,
             author_id=self.author_id,
             playlist_url=self.url,
-            tracks=self.tracks,
         )
+        tracks = list(self.tracks)
+        if self._saved_positions is None:
+            if self._track_count is not None and not tracks:
+                # The tracks were never loaded, so there's nothing to write.
+                return
+            positions = await self.playlist_api.replace_tracks(
+                scope, int(self.id), scope_id, tracks
+            )
+        else:
+            positions = await self._save_changed_tracks(scope, scope_id, tracks)
+        self._mark_saved(positions)
+
+    async def _save_changed_tracks(
+        self, scope: str, scope_id: int, tracks: List[MutableMapping]
+    ) -> List[int]:
+        saved_tracks, saved_positions = self._saved_tracks, self._saved_positions
+        saved_count = len(saved_tracks)
+        if tracks[:saved_count] == saved_tracks:
+            if len(tracks) == saved_count:
+                return saved_positions
+            return saved_positions + await self.playlist_api.append_tracks(
+                scope, int(self.id), scope_id, tracks[saved_count:]
+            )
+        if len(tracks) < saved_count:
+            kept_positions = []
+            removed_positions = []
+            remaining = iter(tracks)
+            current = next(remaining, None)
+            for track, position in zip(saved_tracks, saved_positions):
+                if current is not None and track == current:
+                    kept_positions.append(position)
+                    current = next(remaining, None)
+                else:
+                    removed_positions.append(position)
+            if current is None:
+                await self.playlist_api.remove_tracks(
+                    scope, int(self.id), scope_id, removed_positions
+                )
+                return kept_positions
+        return await self.playlist_api.replace_tracks(scope, int(self.id), scope_id, tracks)
 
     def to_json(self) -> MutableMapping:
         """Transform the object to a dict.
@@ -152,7 +222,6 @@ class Playlist:
         playlist_id = data.playlist_id or playlist_number
         name = data.playlist_name
         playlist_url = data.playlist_url
-        tracks = data.tracks
 
         return cls(
             bot=bot,
@@ -163,7 +232,7 @@ class Playlist:
             playlist_id=playlist_id,
             name=name,
             playlist_url=playlist_url,
-            tracks=tracks,
+            track_count=data.track_count,
         )
 
 
@@ -388,7 +457,7 @@ async def get_playlist(
 
     if not (playlist_data and playlist_data.playlist_id):
         raise RuntimeError(f"That playlist does not exist for the following scope: {scope}")
-    return await Playlist.from_json(
+    playlist = await Playlist.from_json(
         bot,
         playlist_api,
         scope_standard,
@@ -397,6 +466,7 @@ async def get_playlist(
         guild=guild,
         author=author,
     )
+    return await playlist.load_tracks()
 
 
 async def get_all_playlist(
@@ -426,7 +496,8 @@ async def get_all_playlist(
     Returns
     -------
     list
-        A list of all playlists for the specified scope
+        A list of all playlists for the specified scope.
+        Their tracks aren't loaded, see `Playlist.load_tracks`.
     Raises
     ------
     `InvalidPlaylistScope`
@@ -487,7 +558,8 @@ async def get_all_playlist_converter(
     Returns
     -------
     list
-        A list of all playlists for the specified scope
+        A list of all playlists for the specified scope.
+        Their tracks aren't loaded, see `Playlist.load_tracks`.
     Raises
     ------
     `InvalidPlaylistScope`
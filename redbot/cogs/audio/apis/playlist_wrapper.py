@@ -1,9 +1,8 @@
-import concurrent
 import json
 from pathlib import Path
 
 from types import SimpleNamespace
-from typing import List, MutableMapping, Optional
+from typing import List, MutableMapping, Optional, Sequence, Tuple
 
 from red_commons.logging import getLogger
 
@@ -11,10 +10,11 @@ from redbot.core import Config
 from redbot.core.bot import Red
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
 
 from ..sql_statements import (
     HANDLE_DISCORD_DATA_DELETION_QUERY,
+    PLAYLIST_CLEAR_LEGACY_TRACKS,
     PLAYLIST_CREATE_INDEX,
     PLAYLIST_CREATE_TABLE,
     PLAYLIST_DELETE,
@@ -24,6 +24,16 @@ from ..sql_statements import (
     PLAYLIST_FETCH_ALL,
     PLAYLIST_FETCH_ALL_CONVERTER,
     PLAYLIST_FETCH_ALL_WITH_FILTER,
+    PLAYLIST_FETCH_LEGACY_TRACKS,
+    PLAYLIST_MIGRATE_LEGACY_TRACKS,
+    PLAYLIST_TRACKS_CREATE_TABLE,
+    PLAYLIST_TRACKS_DELETE,
+    PLAYLIST_TRACKS_DELETE_PLAYLIST,
+    PLAYLIST_TRACKS_DELETE_SCHEDULED,
+    PLAYLIST_TRACKS_DELETE_SCOPE,
+    PLAYLIST_TRACKS_FETCH,
+    PLAYLIST_TRACKS_FETCH_LAST_POSITION,
+    PLAYLIST_TRACKS_INSERT,
     PLAYLIST_UPSERT,
     PRAGMA_FETCH_user_version,
     PRAGMA_SET_journal_mode,
@@ -39,7 +49,7 @@ _ = Translator("Audio", Path(__file__))
 
 
 class PlaylistWrapper:
-    def __init__(self, bot: Red, config: Config, conn: APSWConnectionWrapper):
+    def __init__(self, bot: Red, config: Config, conn: ThreadedAPSWConnection):
         self.bot = bot
         self.database = conn
         self.config = config
@@ -62,16 +72,29 @@ class PlaylistWrapper:
         self.statement.get_all_with_filter = PLAYLIST_FETCH_ALL_WITH_FILTER
         self.statement.get_all_converter = PLAYLIST_FETCH_ALL_CONVERTER
 
+        self.statement.tracks_create_table = PLAYLIST_TRACKS_CREATE_TABLE
+        self.statement.tracks_insert = PLAYLIST_TRACKS_INSERT
+        self.statement.tracks_delete = PLAYLIST_TRACKS_DELETE
+        self.statement.tracks_delete_playlist = PLAYLIST_TRACKS_DELETE_PLAYLIST
+        self.statement.tracks_delete_scope = PLAYLIST_TRACKS_DELETE_SCOPE
+        self.statement.tracks_delete_scheduled = PLAYLIST_TRACKS_DELETE_SCHEDULED
+        self.statement.tracks_get = PLAYLIST_TRACKS_FETCH
+        self.statement.tracks_get_last_position = PLAYLIST_TRACKS_FETCH_LAST_POSITION
+
+        self.statement.get_legacy_tracks = PLAYLIST_FETCH_LEGACY_TRACKS
+        self.statement.migrate_legacy_tracks = PLAYLIST_MIGRATE_LEGACY_TRACKS
+        self.statement.clear_legacy_tracks = PLAYLIST_CLEAR_LEGACY_TRACKS
+
         self.statement.drop_user_playlists = HANDLE_DISCORD_DATA_DELETION_QUERY
 
     async def init(self) -> None:
         """Initialize the Playlist table."""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.pragma_temp_store)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_journal_mode)
-            executor.submit(self.database.cursor().execute, self.statement.pragma_read_uncommitted)
-            executor.submit(self.database.cursor().execute, self.statement.create_table)
-            executor.submit(self.database.cursor().execute, self.statement.create_index)
+        await self.database.execute(self.statement.pragma_temp_store, transaction=False)
+        await self.database.execute(self.statement.pragma_journal_mode, transaction=False)
+        await self.database.execute(self.statement.pragma_read_uncommitted, transaction=False)
+        await self.database.execute(self.statement.create_table)
+        await self.database.execute(self.statement.create_index)
+        await self.database.execute(self.statement.tracks_create_table)
 
     @staticmethod
     def get_scope_type(scope: str) -> int:
@@ -89,31 +112,16 @@ class PlaylistWrapper:
     ) -> Optional[PlaylistFetchResult]:
         """Fetch a single playlist."""
         scope_type = self.get_scope_type(scope)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute,
-                        self.statement.get_one,
-                        (
-                            {
-                                "playlist_id": playlist_id,
-                                "scope_id": scope_id,
-                                "scope_type": scope_type,
-                            }
-                        ),
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    log.verbose("Failed to complete playlist fetch from database", exc_info=exc)
-                    return None
-            row = row_result.fetchone()
-            if row:
-                row = PlaylistFetchResult(*row)
+        try:
+            row = await self.database.fetchone(
+                self.statement.get_one,
+                {"playlist_id": playlist_id, "scope_id": scope_id, "scope_type": scope_type},
+            )
+        except Exception as exc:
+            log.verbose("Failed to complete playlist fetch from database", exc_info=exc)
+            return None
+        if row:
+            row = PlaylistFetchResult(*row)
         return row
 
     async def fetch_all(
@@ -122,47 +130,17 @@ class PlaylistWrapper:
         """Fetch all playlists."""
         scope_type = self.get_scope_type(scope)
         output = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            if author_id is not None:
-                for future in concurrent.futures.as_completed(
-                    [
-                        executor.submit(
-                            self.database.cursor().execute,
-                            self.statement.get_all_with_filter,
-                            (
-                                {
-                                    "scope_type": scope_type,
-                                    "scope_id": scope_id,
-                                    "author_id": author_id,
-                                }
-                            ),
-                        )
-                    ]
-                ):
-                    try:
-                        row_result = future.result()
-                    except Exception as exc:
-                        log.verbose(
-                            "Failed to complete playlist fetch from database", exc_info=exc
-                        )
-                        return []
-            else:
-                for future in concurrent.futures.as_completed(
-                    [
-                        executor.submit(
-                            self.database.cursor().execute,
-                            self.statement.get_all,
-                            ({"scope_type": scope_type, "scope_id": scope_id}),
-                        )
-                    ]
-                ):
-                    try:
-                        row_result = future.result()
-                    except Exception as exc:
-                        log.verbose(
-                            "Failed to complete playlist fetch from database", exc_info=exc
-                        )
-                        return []
+        if author_id is not None:
+            statement = self.statement.get_all_with_filter
+            values = {"scope_type": scope_type, "scope_id": scope_id, "author_id": author_id}
+        else:
+            statement = self.statement.get_all
+            values = {"scope_type": scope_type, "scope_id": scope_id}
+        try:
+            row_result = await self.database.fetchall(statement, values)
+        except Exception as exc:
+            log.verbose("Failed to complete playlist fetch from database", exc_info=exc)
+            return []
         async for row in AsyncIter(row_result):
             output.append(PlaylistFetchResult(*row))
         return output
@@ -179,61 +157,142 @@ class PlaylistWrapper:
             playlist_id = -1
 
         output = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            for future in concurrent.futures.as_completed(
-                [
-                    executor.submit(
-                        self.database.cursor().execute,
-                        self.statement.get_all_converter,
-                        (
-                            {
-                                "scope_type": scope_type,
-                                "playlist_name": playlist_name,
-                                "playlist_id": playlist_id,
-                            }
-                        ),
-                    )
-                ]
-            ):
-                try:
-                    row_result = future.result()
-                except Exception as exc:
-                    log.verbose("Failed to complete fetch from database", exc_info=exc)
-                    return []
-
-            async for row in AsyncIter(row_result):
-                output.append(PlaylistFetchResult(*row))
+        try:
+            row_result = await self.database.fetchall(
+                self.statement.get_all_converter,
+                {
+                    "scope_type": scope_type,
+                    "playlist_name": playlist_name,
+                    "playlist_id": playlist_id,
+                },
+            )
+        except Exception as exc:
+            log.verbose("Failed to complete fetch from database", exc_info=exc)
+            return []
+
+        async for row in AsyncIter(row_result):
+            output.append(PlaylistFetchResult(*row))
         return output
 
+    async def fetch_tracks(
+        self, scope: str, playlist_id: int, scope_id: int
+    ) -> Tuple[List[int], List[MutableMapping]]:
+        """Fetch the tracks of a playlist along with their positions."""
+        scope_type = self.get_scope_type(scope)
+        try:
+            rows = await self.database.fetchall(
+                self.statement.tracks_get,
+                {"playlist_id": playlist_id, "scope_id": scope_id, "scope_type": scope_type},
+            )
+        except Exception as exc:
+            log.verbose("Failed to complete playlist tracks fetch from database", exc_info=exc)
+            return [], []
+        positions = [position for position, __ in rows]
+        tracks = [json.loads(track) async for __, track in AsyncIter(rows, steps=1000)]
+        return positions, tracks
+
+    async def append_tracks(
+        self, scope: str, playlist_id: int, scope_id: int, tracks: Sequence[MutableMapping]
+    ) -> List[int]:
+        """Add tracks to the end of a playlist, returning the positions they were given."""
+        key = self._playlist_key(scope, playlist_id, scope_id)
+        return await self.database.run(self._append_tracks, key, tracks)
+
+    async def remove_tracks(
+        self, scope: str, playlist_id: int, scope_id: int, positions: Sequence[int]
+    ) -> None:
+        """Remove the tracks at the given positions from a playlist."""
+        key = self._playlist_key(scope, playlist_id, scope_id)
+        await self.database.executemany(
+            self.statement.tracks_delete, [{**key, "position": p} for p in positions]
+        )
+
+    async def replace_tracks(
+        self, scope: str, playlist_id: int, scope_id: int, tracks: Sequence[MutableMapping]
+    ) -> List[int]:
+        """Replace all tracks of a playlist, returning the positions they were given."""
+        key = self._playlist_key(scope, playlist_id, scope_id)
+        return await self.database.run(self._replace_tracks, key, tracks)
+
+    def _playlist_key(self, scope: str, playlist_id: int, scope_id: int) -> MutableMapping:
+        return {
+            "scope_type": self.get_scope_type(scope),
+            "playlist_id": int(playlist_id),
+            "scope_id": int(scope_id),
+        }
+
+    def _append_tracks(self, key: MutableMapping, tracks: Sequence[MutableMapping]) -> List[int]:
+        # Runs on the connection's thread, so nothing can be appended in between.
+        with self.database.connection.transaction() as transaction:
+            (last_position,) = transaction.execute(
+                self.statement.tracks_get_last_position, key
+            ).fetchone()
+            return self._insert_tracks(
+                transaction, key, tracks, -1 if last_position is None else last_position
+            )
+
+    def _replace_tracks(self, key: MutableMapping, tracks: Sequence[MutableMapping]) -> List[int]:
+        with self.database.connection.transaction() as transaction:
+            transaction.execute(self.statement.tracks_delete_playlist, key)
+            return self._insert_tracks(transaction, key, tracks, -1)
+
+    def _insert_tracks(
+        self, cursor, key: MutableMapping, tracks: Sequence[MutableMapping], last_position: int
+    ) -> List[int]:
+        positions = list(range(last_position + 1, last_position + 1 + len(tracks)))
+        cursor.executemany(
+            self.statement.tracks_insert,
+            [
+                {**key, "position": position, "track": json.dumps(track)}
+                for position, track in zip(positions, tracks)
+            ],
+        )
+        return positions
+
+    async def migrate_legacy_tracks(self, batch_size: int = 50) -> None:
+        """Move the tracks stored in the playlists table to the playlist tracks table.
+
+        Playlists are migrated a batch at a time, so other queries can run in between.
+        """
+        while True:
+            rows = await self.database.fetchall(
+                self.statement.get_legacy_tracks, {"limit": batch_size}
+            )
+            if not rows:
+                break
+            await self.database.run(self._migrate_legacy_tracks, rows)
+
+    def _migrate_legacy_tracks(self, rows: List[tuple]) -> None:
+        keys = [
+            {"scope_type": scope_type, "playlist_id": playlist_id, "scope_id": scope_id}
+            for scope_type, playlist_id, scope_id in rows
+        ]
+        with self.database.connection.transaction() as transaction:
+            transaction.executemany(self.statement.migrate_legacy_tracks, keys)
+            transaction.executemany(self.statement.clear_legacy_tracks, keys)
+
     async def delete(self, scope: str, playlist_id: int, scope_id: int):
         """Deletes a single playlists."""
         scope_type = self.get_scope_type(scope)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.delete,
-                ({"playlist_id": playlist_id, "scope_id": scope_id, "scope_type": scope_type}),
-            )
+        await self.database.execute(
+            self.statement.delete,
+            {"playlist_id": playlist_id, "scope_id": scope_id, "scope_type": scope_type},
+        )
 
     async def delete_scheduled(self):
         """Clean up database from all deleted playlists."""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, self.statement.delete_scheduled)
+        await self.database.execute(self.statement.tracks_delete_scheduled)
+        await self.database.execute(self.statement.delete_scheduled)
 
     async def drop(self, scope: str):
         """Delete all playlists in a scope."""
         scope_type = self.get_scope_type(scope)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.delete_scope,
-                ({"scope_type": scope_type}),
-            )
+        await self.database.execute(self.statement.tracks_delete_scope, {"scope_type": scope_type})
+        await self.database.execute(self.statement.delete_scope, {"scope_type": scope_type})
 
     async def create_table(self):
         """Create the playlist table."""
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(self.database.cursor().execute, PLAYLIST_CREATE_TABLE)
+        await self.database.execute(PLAYLIST_CREATE_TABLE)
 
     async def upsert(
         self,
@@ -243,29 +302,29 @@ class PlaylistWrapper:
         scope_id: int,
         author_id: int,
         playlist_url: Optional[str],
-        tracks: List[MutableMapping],
+        tracks: Optional[List[MutableMapping]] = None,
     ):
-        """Insert or update a playlist into the database."""
+        """Insert or update a playlist into the database.
+
+        If ``tracks`` is given, they replace the tracks of the playlist.
+        """
         scope_type = self.get_scope_type(scope)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.upsert,
-                {
-                    "scope_type": str(scope_type),
-                    "playlist_id": int(playlist_id),
-                    "playlist_name": str(playlist_name),
-                    "scope_id": int(scope_id),
-                    "author_id": int(author_id),
-                    "playlist_url": playlist_url,
-                    "tracks": json.dumps(tracks),
-                },
-            )
+        await self.database.execute(
+            self.statement.upsert,
+            {
+                "scope_type": scope_type,
+                "playlist_id": int(playlist_id),
+                "playlist_name": str(playlist_name),
+                "scope_id": int(scope_id),
+                "author_id": int(author_id),
+                "playlist_url": playlist_url,
+            },
+        )
+        if tracks is not None:
+            await self.replace_tracks(scope, playlist_id, scope_id, tracks)
 
     async def handle_playlist_user_id_deletion(self, user_id: int):
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(
-                self.database.cursor().execute,
-                self.statement.drop_user_playlists,
-                {"user_id": user_id},
-            )
+        # The query manages its own transactions.
+        await self.database.execute(
+            self.statement.drop_user_playlists, {"user_id": user_id}, transaction=False
+        )
@@ -12,6 +12,7 @@ from red_commons.logging import getLogger
 from redbot.core import Config
 from redbot.core.bot import Red
 from redbot.core.commands import Cog, Context
+from redbot.core.http_client import HTTPClient
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
 
@@ -36,17 +37,22 @@ class SpotifyWrapper:
     """Wrapper for the Spotify API."""
 
     def __init__(
-        self, bot: Red, config: Config, session: aiohttp.ClientSession, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, http_client: HTTPClient, cog: Union["Audio", Cog]
     ):
         self.bot = bot
         self.config = config
-        self.session = session
+        self.http_client = http_client
         self.spotify_token: Optional[MutableMapping] = None
         self.client_id: Optional[str] = None
         self.client_secret: Optional[str] = None
         self._token: Mapping[str, str] = {}
         self.cog = cog
 
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # The shared client creates a new session if its session was closed.
+        return self.http_client.session
+
     @staticmethod
     def spotify_format_call(query_type: str, key: str) -> Tuple[str, MutableMapping]:
         """Format the spotify endpoint."""
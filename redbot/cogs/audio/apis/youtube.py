@@ -9,6 +9,7 @@ from red_commons.logging import getLogger
 from redbot.core import Config
 from redbot.core.bot import Red
 from redbot.core.commands import Cog
+from redbot.core.http_client import HTTPClient
 from redbot.core.i18n import Translator
 
 from ..errors import YouTubeApiError
@@ -25,15 +26,20 @@ class YouTubeWrapper:
     """Wrapper for the YouTube Data API."""
 
     def __init__(
-        self, bot: Red, config: Config, session: aiohttp.ClientSession, cog: Union["Audio", Cog]
+        self, bot: Red, config: Config, http_client: HTTPClient, cog: Union["Audio", Cog]
     ):
         self.bot = bot
         self.config = config
-        self.session = session
+        self.http_client = http_client
         self.api_key: Optional[str] = None
         self._token: Mapping[str, str] = {}
         self.cog = cog
 
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # The shared client creates a new session if its session was closed.
+        return self.http_client.session
+
     async def update_token(self, new_token: Mapping[str, str]):
         self._token = new_token
 
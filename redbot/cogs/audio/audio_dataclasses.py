@@ -241,7 +241,7 @@ class LocalPath:
         return sorted(tracks, key=lambda x: x.to_string_user().lower())
 
     async def subfolders_in_tree(self):
-        return_folders = []
+        return_folders = set()
         async for f in self.multirglob("", folder=True):
             with contextlib.suppress(ValueError):
                 if (
@@ -250,7 +250,7 @@ class LocalPath:
                     and f.path != self.localtrack_folder
                     and f.path.relative_to(self.path)
                 ):
-                    return_folders.append(f)
+                    return_folders.add(f)
         return sorted(return_folders, key=lambda x: x.to_string_user().lower())
 
     async def tracks_in_folder(self):
@@ -264,7 +264,7 @@ class LocalPath:
         return sorted(tracks, key=lambda x: x.to_string_user().lower())
 
     async def subfolders(self):
-        return_folders = []
+        return_folders = set()
         async for f in self.multiglob("", folder=True):
             with contextlib.suppress(ValueError):
                 if (
@@ -272,7 +272,7 @@ class LocalPath:
                     and f.path != self.localtrack_folder
                     and f.path.relative_to(self.path)
                 ):
-                    return_folders.append(f)
+                    return_folders.add(f)
         return sorted(return_folders, key=lambda x: x.to_string_user().lower())
 
     def __eq__(self, other):
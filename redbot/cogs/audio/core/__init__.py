@@ -1,6 +1,5 @@
 import asyncio
 import datetime
-import json
 
 from collections import Counter, defaultdict
 from pathlib import Path
@@ -62,6 +61,15 @@ class Audio(
         self._persist_queue_cache = {}
         self._dj_status_cache = {}
         self._dj_role_cache = {}
+        self._url_keyword_filters = {}
+        self._url_keyword_filters_generation = 0
+        self._empty_channel_settings = {}
+        self._empty_channel_settings_generation = 0
+        self._player_event_settings = {}
+        self._player_event_settings_generation = 0
+        self._empty_channel_since = {}
+        self._empty_channel_timers = []
+        self._empty_channel_wakeup = asyncio.Event()
         self.skip_votes = {}
         self.play_lock = {}
         self.antispam: Dict[int, Dict[str, AntiSpam]] = defaultdict(lambda: defaultdict(AntiSpam))
@@ -69,6 +77,7 @@ class Audio(
         self.lavalink_connect_task = None
         self._restore_task = None
         self.player_automated_timer_task = None
+        self.cache_maintenance_task = None
         self.cog_cleaned_up = False
         self.lavalink_connection_aborted = False
         self.permission_cache = discord.Permissions(
@@ -78,7 +87,8 @@ class Audio(
             add_reactions=True,
         )
 
-        self.session = aiohttp.ClientSession(json_serialize=json.dumps)
+        # Shared with the rest of the bot, must not be closed by this cog.
+        self.http_client = self.bot.http_client
         self.cog_ready_event = asyncio.Event()
         self._ws_resume = defaultdict(asyncio.Event)
         self._ws_op_codes = defaultdict(asyncio.LifoQueue)
@@ -100,6 +110,7 @@ class Audio(
             owner_notification=0,
             cache_level=CacheLevel.all().value,
             cache_age=365,
+            cache_max_entries=100000,
             daily_playlists=False,
             global_db_enabled=False,
             global_db_get_timeout=5,
@@ -164,3 +175,11 @@ class Audio(
         self.config.register_guild(**default_guild)
         self.config.register_global(**default_global)
         self.config.register_user(country_code=None)
+        self.config.add_change_listener(self._on_url_keyword_change)
+        self.config.add_change_listener(self._on_empty_channel_setting_change)
+        self.config.add_change_listener(self._on_player_event_setting_change)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # The shared client creates a new session if its session was closed.
+        return self.http_client.session
@@ -17,6 +17,7 @@ from typing import (
     Tuple,
     Union,
     Dict,
+    Pattern,
 )
 
 import aiohttp
@@ -26,8 +27,10 @@ import lavalink
 from redbot.core import Config, commands
 from redbot.core.bot import Red
 from redbot.core.commands import Context
+from redbot.core.config import ConfigChange
+from redbot.core.http_client import HTTPClient
 from redbot.core.utils.antispam import AntiSpam
-from redbot.core.utils.dbtools import APSWConnectionWrapper
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
 
 if TYPE_CHECKING:
     from ..apis.interface import AudioAPIInterface
@@ -36,6 +39,7 @@ if TYPE_CHECKING:
     from ..audio_dataclasses import LocalPath, Query
     from ..equalizer import Equalizer
     from ..manager import ServerManager
+    from ..utils import IndexedQueue
 
 
 class MixinMeta(ABC):
@@ -50,7 +54,8 @@ class MixinMeta(ABC):
     managed_node_controller: Optional["ServerManager"]
     playlist_api: Optional["PlaylistWrapper"]
     local_folder_current_path: Optional[Path]
-    db_conn: Optional[APSWConnectionWrapper]
+    db_conn: Optional[ThreadedAPSWConnection]
+    http_client: HTTPClient
     session: aiohttp.ClientSession
     antispam: Dict[int, Dict[str, AntiSpam]]
     llset_captcha_intervals: List[Tuple[datetime.timedelta, int]]
@@ -62,6 +67,17 @@ class MixinMeta(ABC):
     _persist_queue_cache: MutableMapping[int, bool]
     _dj_status_cache: MutableMapping[int, Optional[bool]]
     _dj_role_cache: MutableMapping[int, Optional[int]]
+    _url_keyword_filters: MutableMapping[
+        Optional[int], Tuple[Optional[Pattern], Optional[Pattern]]
+    ]
+    _url_keyword_filters_generation: int
+    _empty_channel_settings: MutableMapping[int, Tuple[Optional[int], Optional[int]]]
+    _empty_channel_settings_generation: int
+    _player_event_settings: MutableMapping[int, MutableMapping[str, Any]]
+    _player_event_settings_generation: int
+    _empty_channel_since: MutableMapping[int, float]
+    _empty_channel_timers: List[Tuple[float, int]]
+    _empty_channel_wakeup: asyncio.Event
     _error_timer: MutableMapping[int, float]
     _disconnected_players: MutableMapping[int, bool]
     global_api_user: MutableMapping[str, Any]
@@ -74,6 +90,7 @@ class MixinMeta(ABC):
     lavalink_connect_task: Optional[asyncio.Task]
     _restore_task: Optional[asyncio.Task]
     player_automated_timer_task: Optional[asyncio.Task]
+    cache_maintenance_task: Optional[asyncio.Task]
     cog_init_task: Optional[asyncio.Task]
     cog_ready_event: asyncio.Event
     _ws_resume: defaultdict[Any, asyncio.Event]
@@ -141,12 +158,28 @@ class MixinMeta(ABC):
     async def player_automated_timer(self) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def cache_maintenance(self) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def update_empty_channel_timer(self, guild: discord.Guild) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _on_empty_channel_setting_change(self, change: ConfigChange) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     async def lavalink_event_handler(
         self, player: lavalink.Player, event_type: lavalink.LavalinkEvents, extra
     ) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    def _on_player_event_setting_change(self, change: ConfigChange) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     async def lavalink_update_handler(
         self, player: lavalink.Player, event_type: lavalink.enums.PlayerState, extra
@@ -202,6 +235,10 @@ class MixinMeta(ABC):
     ) -> bool:
         raise NotImplementedError()
 
+    @abstractmethod
+    def _on_url_keyword_change(self, change: ConfigChange) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     def is_track_length_allowed(self, track: Union[lavalink.Track, int], maxlength: int) -> bool:
         raise NotImplementedError()
@@ -460,6 +497,18 @@ class MixinMeta(ABC):
     ) -> List[Union[Path, "LocalPath"]]:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def _get_indexed_local_tracks(
+        self, local_path: "LocalPath", recursive: bool
+    ) -> Optional[List["Query"]]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def _get_indexed_local_folders(
+        self, local_path: "LocalPath", recursive: bool
+    ) -> Optional[List["LocalPath"]]:
+        raise NotImplementedError()
+
     @abstractmethod
     async def _build_local_search_list(
         self, to_search: List["Query"], search_words: str
@@ -484,9 +533,16 @@ class MixinMeta(ABC):
     async def command_pause(self, ctx: commands.Context):
         raise NotImplementedError()
 
+    @abstractmethod
+    def _get_queue(self, player: lavalink.player.Player) -> "IndexedQueue":
+        raise NotImplementedError()
+
     @abstractmethod
     async def _build_queue_search_list(
-        self, queue_list: List[lavalink.Track], search_words: str
+        self,
+        queue_list: List[lavalink.Track],
+        search_words: str,
+        player: Optional[lavalink.player.Player] = None,
     ) -> List[Tuple[int, str]]:
         raise NotImplementedError()
 
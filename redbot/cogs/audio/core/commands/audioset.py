@@ -1347,6 +1347,31 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         has_spotify_cache = current_level.is_superset(spotify_cache)
         has_youtube_cache = current_level.is_superset(youtube_cache)
         has_lavalink_cache = current_level.is_superset(lavalink_cache)
+        max_entries = await self.config.cache_max_entries()
+        cache_usage = _("Max entries:      [{max_entries}]\n").format(
+            max_entries=_("{entries} per table").format(entries=max_entries)
+            if max_entries
+            else _("Unlimited")
+        )
+        tables = {
+            _("Spotify"): self.api_interface.local_cache_api.spotify,
+            _("Youtube"): self.api_interface.local_cache_api.youtube,
+            _("Lavalink"): self.api_interface.local_cache_api.lavalink,
+        }
+        for name, table in tables.items():
+            cache_usage += _(
+                "\n[{table}]\n"
+                "Entries:          [{entries}]\n"
+                "Hits:             [{hits}]\n"
+                "Misses:           [{misses}]\n"
+                "Evictions:        [{evictions}]\n"
+            ).format(
+                table=name,
+                entries=await table.count(),
+                hits=table.stats["hits"],
+                misses=table.stats["misses"],
+                evictions=table.stats["evictions"],
+            )
 
         if level is None:
             msg = (
@@ -1359,7 +1384,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
                 spotify_status=_("Enabled") if has_spotify_cache else _("Disabled"),
                 youtube_status=_("Enabled") if has_youtube_cache else _("Disabled"),
                 lavalink_status=_("Enabled") if has_lavalink_cache else _("Disabled"),
-            )
+            ) + cache_usage
             await self.send_embed_msg(
                 ctx, title=_("Cache Settings"), description=box(msg, lang="ini")
             )
@@ -1404,7 +1429,7 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
             spotify_status=_("Enabled") if has_spotify_cache else _("Disabled"),
             youtube_status=_("Enabled") if has_youtube_cache else _("Disabled"),
             lavalink_status=_("Enabled") if has_lavalink_cache else _("Disabled"),
-        )
+        ) + cache_usage
 
         await self.send_embed_msg(ctx, title=_("Cache Settings"), description=box(msg, lang="ini"))
 
@@ -1429,6 +1454,29 @@ class AudioSetCommands(MixinMeta, metaclass=CompositeMetaClass):
         await self.config.cache_age.set(age)
         await self.send_embed_msg(ctx, title=_("Setting Changed"), description=msg)
 
+    @command_audioset.command(name="cachesize")
+    @commands.is_owner()
+    async def command_audioset_cachesize(self, ctx: commands.Context, entries: int):
+        """Sets the max number of entries in each cache table.
+
+        Once a table grows past this size, its least recently used entries are removed.
+        Use 0 to let the cache grow without limit.
+        """
+        msg = ""
+        if entries < 0:
+            entries = 0
+        elif 0 < entries < 1000:
+            msg = _("Cache size cannot be less than 1000 entries.\n")
+            entries = 1000
+        if entries:
+            msg += _("I've set the cache size to {entries} entries per table.").format(
+                entries=entries
+            )
+        else:
+            msg += _("I've removed the cache size limit.")
+        await self.config.cache_max_entries.set(entries)
+        await self.send_embed_msg(ctx, title=_("Setting Changed"), description=msg)
+
     @command_audioset.command(name="persistqueue")
     @commands.admin()
     async def command_audioset_persist_queue(self, ctx: commands.Context):
@@ -834,17 +834,12 @@ class PlayerControllerCommands(MixinMeta, metaclass=CompositeMetaClass):
                 description=_("Removed {track} from the queue.").format(track=removed_title),
             )
         else:
-            clean_tracks = []
-            removed_tracks = 0
-            async for track in AsyncIter(player.queue):
-                if track.uri != index_or_url:
-                    clean_tracks.append(track)
-                else:
-                    await self.api_interface.persistent_queue_api.played(
-                        ctx.guild.id, track.extras.get("enqueue_time")
-                    )
-                    removed_tracks += 1
-            player.queue = clean_tracks
+            removed = self._get_queue(player).remove_uri(index_or_url)
+            async for track in AsyncIter(removed):
+                await self.api_interface.persistent_queue_api.played(
+                    ctx.guild.id, track.extras.get("enqueue_time")
+                )
+            removed_tracks = len(removed)
             if removed_tracks == 0:
                 await self.send_embed_msg(
                     ctx,
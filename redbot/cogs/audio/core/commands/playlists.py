@@ -1033,7 +1033,7 @@ class PlaylistCommands(MixinMeta, metaclass=CompositeMetaClass):
                         (
                             bold(playlist.name),
                             _("ID: {id}").format(id=playlist.id),
-                            _("Tracks: {num}").format(num=len(playlist.tracks)),
+                            _("Tracks: {num}").format(num=playlist.track_count),
                             _("Author: {name}").format(
                                 name=self.bot.get_user(playlist.author)
                                 or playlist.author
@@ -227,18 +227,14 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
                 title=_("Unable To Clean Queue"),
                 description=_("You need the DJ role to clean the queue."),
             )
-        clean_tracks = []
-        removed_tracks = 0
-        listeners = player.channel.members
-        async for track in AsyncIter(player.queue):
-            if track.requester in listeners:
-                clean_tracks.append(track)
-            else:
-                await self.api_interface.persistent_queue_api.played(
-                    ctx.guild.id, track.extras.get("enqueue_time")
-                )
-                removed_tracks += 1
-        player.queue = clean_tracks
+        queue = self._get_queue(player)
+        listeners = {member.id for member in player.channel.members}
+        removed = queue.remove_requesters(queue.requesters.keys() - listeners)
+        async for track in AsyncIter(removed):
+            await self.api_interface.persistent_queue_api.played(
+                ctx.guild.id, track.extras.get("enqueue_time")
+            )
+        removed_tracks = len(removed)
         if removed_tracks == 0:
             await self.send_embed_msg(ctx, title=_("Removed 0 tracks."))
         else:
@@ -262,17 +258,12 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
         if not self._player_check(ctx) or not player.queue:
             return await self.send_embed_msg(ctx, title=_("There's nothing in the queue."))
 
-        clean_tracks = []
-        removed_tracks = 0
-        async for track in AsyncIter(player.queue):
-            if track.requester != ctx.author:
-                clean_tracks.append(track)
-            else:
-                removed_tracks += 1
-                await self.api_interface.persistent_queue_api.played(
-                    ctx.guild.id, track.extras.get("enqueue_time")
-                )
-        player.queue = clean_tracks
+        removed = self._get_queue(player).remove_requesters({ctx.author.id})
+        async for track in AsyncIter(removed):
+            await self.api_interface.persistent_queue_api.played(
+                ctx.guild.id, track.extras.get("enqueue_time")
+            )
+        removed_tracks = len(removed)
         if removed_tracks == 0:
             await self.send_embed_msg(ctx, title=_("Removed 0 tracks."))
         else:
@@ -294,7 +285,9 @@ class QueueCommands(MixinMeta, metaclass=CompositeMetaClass):
         if not self._player_check(ctx) or not player.queue:
             return await self.send_embed_msg(ctx, title=_("There's nothing in the queue."))
 
-        search_list = await self._build_queue_search_list(player.queue, search_words)
+        search_list = await self._build_queue_search_list(
+            self._get_queue(player), search_words, player
+        )
         if not search_list:
             return await self.send_embed_msg(ctx, title=_("No matches."))
 
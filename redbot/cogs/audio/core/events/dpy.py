@@ -415,10 +415,12 @@ class DpyEvents(MixinMeta, metaclass=CompositeMetaClass):
     async def cog_unload(self) -> None:
         if not self.cog_cleaned_up:
             self.bot.dispatch("red_audio_unload", self)
-            await self.session.close()
             if self.player_automated_timer_task:
                 self.player_automated_timer_task.cancel()
 
+            if self.cache_maintenance_task:
+                self.cache_maintenance_task.cancel()
+
             if self.lavalink_connect_task:
                 self.lavalink_connect_task.cancel()
 
@@ -430,6 +432,9 @@ class DpyEvents(MixinMeta, metaclass=CompositeMetaClass):
 
             lavalink.unregister_event_listener(self.lavalink_event_handler)
             lavalink.unregister_update_listener(self.lavalink_update_handler)
+            self.config.remove_change_listener(self._on_url_keyword_change)
+            self.config.remove_change_listener(self._on_empty_channel_setting_change)
+            self.config.remove_change_listener(self._on_player_event_setting_change)
             await lavalink.close(self.bot)
             await self._close_database()
             if self.managed_node_controller is not None:
@@ -449,6 +454,7 @@ class DpyEvents(MixinMeta, metaclass=CompositeMetaClass):
                 self.skip_votes[before.channel.guild.id].discard(member.id)
             except (ValueError, KeyError, AttributeError):
                 pass
+            await self.update_empty_channel_timer(member.guild)
 
         channel = self.rgetattr(member, "voice.channel", None)
         bot_voice_state = self.rgetattr(member, "guild.me.voice.self_deaf", None)
@@ -465,6 +471,12 @@ class DpyEvents(MixinMeta, metaclass=CompositeMetaClass):
                 if player.channel.id == channel.id:
                     await self.self_deafen(player)
 
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self._player_event_settings.pop(guild.id, None)
+        await self.cog_ready_event.wait()
+        await self.update_empty_channel_timer(guild)
+
     @commands.Cog.listener()
     async def on_shard_disconnect(self, shard_id):
         self._disconnected_shard.add(shard_id)
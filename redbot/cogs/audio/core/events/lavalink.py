@@ -2,13 +2,15 @@ import asyncio
 import contextlib
 import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, MutableMapping
 
 import discord
 import lavalink
 from discord.backoff import ExponentialBackoff
 from red_commons.logging import getLogger
 
+from redbot.core import Config
+from redbot.core.config import ConfigChange
 from redbot.core.i18n import Translator, set_contextual_locales_from_guild
 from ...errors import DatabaseError, TrackEnqueueError
 from ..abc import MixinMeta
@@ -19,6 +21,17 @@ ws_audio_log = getLogger("red.Audio.WS.Audio")
 
 _ = Translator("Audio", Path(__file__))
 
+# The guild settings read by the Lavalink event handler
+_PLAYER_EVENT_SETTINGS = (
+    "auto_deafen",
+    "auto_play",
+    "currently_auto_playing_in",
+    "disconnect",
+    "notify",
+    "repeat",
+    "thumbnail",
+)
+
 
 class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
     async def lavalink_update_handler(
@@ -51,7 +64,9 @@ class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
             return
         # This event is rather spammy during playback - specially if there's multiple player
         #  Lets move it to Verbose that way it still there if needed alongside the other more verbose content.
-        guild_data = await self.config.guild(guild).all()
+        guild_data = self._player_event_settings.get(guild.id)
+        if guild_data is None:
+            guild_data = await self._load_player_event_settings(guild)
         disconnect = guild_data["disconnect"]
         if event_type == lavalink.LavalinkEvents.FORCED_DISCONNECT:
             self.bot.dispatch("red_audio_audio_disconnect", guild)
@@ -119,7 +134,7 @@ class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
         description = await self.get_track_description(
             current_track, self.local_folder_current_path
         )
-        status = await self.config.status()
+        status = guild_data["status"]
         prev_song: lavalink.Track = player.fetch("prev_song")
         await self.maybe_reset_error_counter(player)
 
@@ -138,12 +153,13 @@ class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
                 )
             notify_channel = player.fetch("notify_channel")
             if notify_channel and autoplay:
-                await self.config.guild_from_id(guild_id=guild_id).currently_auto_playing_in.set(
-                    [notify_channel, player.channel.id]
-                )
+                auto_playing_in = [notify_channel, player.channel.id]
             else:
+                auto_playing_in = []
+            # Most tracks start in the same channel as the previous one.
+            if guild_data["currently_auto_playing_in"] != auto_playing_in:
                 await self.config.guild_from_id(guild_id=guild_id).currently_auto_playing_in.set(
-                    []
+                    auto_playing_in
                 )
         if event_type == lavalink.LavalinkEvents.TRACK_END:
             prev_requester = player.fetch("prev_requester")
@@ -198,7 +214,7 @@ class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
                     dur = self.format_time(current_length)
 
                 thumb = None
-                if await self.config.guild(guild).thumbnail() and current_thumbnail:
+                if guild_data["thumbnail"] and current_thumbnail:
                     thumb = current_thumbnail
 
                 notify_message = await self.send_embed_msg(
@@ -251,11 +267,8 @@ class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
             lavalink.LavalinkEvents.TRACK_STUCK,
         ]:
             message_channel = player.fetch("notify_channel")
-            while True:
-                if current_track in player.queue:
-                    player.queue.remove(current_track)
-                else:
-                    break
+            if current_track is not None:
+                self._get_queue(player).remove_identifier(current_track.track_identifier)
             if repeat:
                 player.current = None
             if not guild_id:
@@ -330,6 +343,32 @@ class LavalinkEvents(MixinMeta, metaclass=CompositeMetaClass):
             if player.node.ready:
                 await player.skip()
 
+    async def _load_player_event_settings(self, guild: discord.Guild) -> MutableMapping[str, Any]:
+        generation = self._player_event_settings_generation
+        guild_data = await self.config.guild(guild).all()
+        settings = {key: guild_data[key] for key in _PLAYER_EVENT_SETTINGS}
+        settings["status"] = await self.config.status()
+        # Only keep the snapshot if nothing it's made of was changed in the meantime.
+        if generation == self._player_event_settings_generation:
+            self._player_event_settings[guild.id] = settings
+        return settings
+
+    def _on_player_event_setting_change(self, change: ConfigChange) -> None:
+        if change.overlaps(Config.GLOBAL, "status"):
+            self._player_event_settings_generation += 1
+            self._player_event_settings.clear()
+            return
+        if not any(
+            change.overlaps(Config.GUILD, *change.primary_key[:1], setting)
+            for setting in _PLAYER_EVENT_SETTINGS
+        ):
+            return
+        self._player_event_settings_generation += 1
+        if change.primary_key:
+            self._player_event_settings.pop(int(change.primary_key[0]), None)
+        else:
+            self._player_event_settings.clear()
+
     async def _websocket_closed_handler(
         self,
         guild: discord.Guild,
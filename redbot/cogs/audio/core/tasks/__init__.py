@@ -1,6 +1,7 @@
 from red_commons.logging import getLogger
 
 from ..cog_utils import CompositeMetaClass
+from .cache import CacheTasks
 from .lavalink import LavalinkTasks
 from .player import PlayerTasks
 from .startup import StartUpTasks
@@ -8,5 +9,5 @@ from .startup import StartUpTasks
 log = getLogger("red.cogs.Audio.cog.Tasks")
 
 
-class Tasks(LavalinkTasks, PlayerTasks, StartUpTasks, metaclass=CompositeMetaClass):
+class Tasks(CacheTasks, LavalinkTasks, PlayerTasks, StartUpTasks, metaclass=CompositeMetaClass):
     """Class joining all task subclasses"""
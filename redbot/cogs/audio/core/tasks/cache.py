@@ -0,0 +1,30 @@
+import asyncio
+from pathlib import Path
+
+from red_commons.logging import getLogger
+
+from redbot.core.i18n import Translator
+
+from ..abc import MixinMeta
+from ..cog_utils import CompositeMetaClass
+
+log = getLogger("red.cogs.Audio.cog.Tasks.cache")
+_ = Translator("Audio", Path(__file__))
+
+# How often (in seconds) the local cache is trimmed
+_CACHE_MAINTENANCE_INTERVAL = 3600
+
+
+class CacheTasks(MixinMeta, metaclass=CompositeMetaClass):
+    async def cache_maintenance(self) -> None:
+        while True:
+            await asyncio.sleep(_CACHE_MAINTENANCE_INTERVAL)
+            try:
+                evicted = await self.api_interface.local_cache_api.run_maintenance(
+                    await self.config.cache_max_entries()
+                )
+            except Exception as exc:
+                log.verbose("Failed to run the local cache maintenance", exc_info=exc)
+                continue
+            if any(evicted.values()):
+                log.debug("Evicted entries from the local cache: %r", evicted)
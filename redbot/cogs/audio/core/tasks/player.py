@@ -1,12 +1,18 @@
 import asyncio
+import contextlib
+import heapq
 import time
 from pathlib import Path
 
-from typing import Dict
+from typing import Optional, Tuple
 
+import discord
 import lavalink
+from lavalink import NodeNotFound, PlayerNotFound
 from red_commons.logging import getLogger
 
+from redbot.core import Config
+from redbot.core.config import ConfigChange
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
 
@@ -16,81 +22,135 @@ from ..cog_utils import CompositeMetaClass
 log = getLogger("red.cogs.Audio.cog.Tasks.player")
 _ = Translator("Audio", Path(__file__))
 
+_EMPTY_CHANNEL_SETTINGS = (
+    "emptydc_enabled",
+    "emptydc_timer",
+    "emptypause_enabled",
+    "emptypause_timer",
+)
+# How often a player left alone in a guild where the cog is disabled is checked again.
+_DISABLED_RECHECK_DELAY = 60
+
 
 class PlayerTasks(MixinMeta, metaclass=CompositeMetaClass):
     async def player_automated_timer(self) -> None:
-        stop_times: Dict = {}
-        pause_times: Dict = {}
+        # Players can have been left alone while the cog wasn't listening.
+        async for p in AsyncIter(lavalink.all_players()):
+            if not await self.bot.cog_disabled_in_guild(self, p.guild):
+                await self.update_empty_channel_timer(p.guild)
         while True:
-            async for p in AsyncIter(lavalink.all_players()):
-                server = p.guild
-                if await self.bot.cog_disabled_in_guild(self, server):
-                    continue
+            self._empty_channel_wakeup.clear()
+            timeout = None
+            if self._empty_channel_timers:
+                timeout = max(self._empty_channel_timers[0][0] - time.time(), 0)
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._empty_channel_wakeup.wait(), timeout)
+            now = time.time()
+            while self._empty_channel_timers and self._empty_channel_timers[0][0] <= now:
+                __, guild_id = heapq.heappop(self._empty_channel_timers)
+                await self._on_empty_channel_timer(guild_id, now)
+
+    async def update_empty_channel_timer(self, guild: discord.Guild) -> None:
+        """Start timing how long the player has been alone, or stop when someone joins it."""
+        try:
+            player = lavalink.get_player(guild.id)
+        except (NodeNotFound, PlayerNotFound):
+            self._empty_channel_since.pop(guild.id, None)
+            return
+        if self.bot.get_guild(guild.id) is None:
+            # The bot was removed from the guild, its player is disconnected right away.
+            self._empty_channel_since[guild.id] = time.time()
+            self._wake_empty_channel_timer(guild.id)
+            return
+        # The player's channel is only updated after this event on moves.
+        channel = self.rgetattr(guild, "me.voice.channel", None)
+        if channel and channel.members and all(m.bot for m in channel.members):
+            if guild.id not in self._empty_channel_since:
+                self._empty_channel_since[guild.id] = time.time()
+                self._wake_empty_channel_timer(guild.id)
+        elif self._empty_channel_since.pop(guild.id, None) is not None and player.paused:
+            try:
+                await player.pause(False)
+            except Exception as exc:
+                log.debug("Exception raised in Audio's unpausing %r.", player, exc_info=exc)
+
+    def _wake_empty_channel_timer(self, guild_id: int) -> None:
+        # The timer works out when the guild's player is actually due.
+        heapq.heappush(self._empty_channel_timers, (0.0, guild_id))
+        self._empty_channel_wakeup.set()
+
+    async def _on_empty_channel_timer(self, guild_id: int, now: float) -> None:
+        since = self._empty_channel_since.get(guild_id)
+        if since is None:
+            return
+        server_obj = self.bot.get_guild(guild_id)
+        if not server_obj:
+            self._empty_channel_since.pop(guild_id, None)
+            await self._disconnect_empty_player(guild_id)
+            return
+        if await self.bot.cog_disabled_in_guild(self, server_obj):
+            # The cog might be enabled again while the player is still alone.
+            heapq.heappush(self._empty_channel_timers, (now + _DISABLED_RECHECK_DELAY, guild_id))
+            return
+        emptydc_timer, emptypause_timer = await self._get_empty_channel_settings(server_obj)
+        timer = emptydc_timer if emptydc_timer is not None else emptypause_timer
+        if timer is None:
+            return
+        if now - since < timer:
+            heapq.heappush(self._empty_channel_timers, (since + timer, guild_id))
+        elif emptydc_timer is not None:
+            self._empty_channel_since.pop(guild_id, None)
+            await self._disconnect_empty_player(guild_id)
+        else:
+            try:
+                await lavalink.get_player(guild_id).pause()
+            except Exception as exc:
+                log.debug("Exception raised in Audio's pausing for %s.", guild_id, exc_info=exc)
+
+    async def _disconnect_empty_player(self, guild_id: int) -> None:
+        try:
+            player = lavalink.get_player(guild_id)
+            await self.api_interface.persistent_queue_api.drop(guild_id)
+            player.store("autoplay_notified", False)
+            await player.stop()
+            await player.disconnect()
+            await self.config.guild_from_id(guild_id=guild_id).currently_auto_playing_in.set([])
+        except Exception as exc:
+            log.debug("Exception raised in Audio's emptydc_timer for %s.", guild_id, exc_info=exc)
 
-                if p.channel.members and all(m.bot for m in p.channel.members):
-                    stop_times.setdefault(server.id, time.time())
-                    pause_times.setdefault(server.id, time.time())
-                else:
-                    stop_times.pop(server.id, None)
-                    if p.paused and server.id in pause_times:
-                        try:
-                            await p.pause(False)
-                        except Exception as exc:
-                            log.debug("Exception raised in Audio's unpausing %r.", p, exc_info=exc)
-                    pause_times.pop(server.id, None)
-            servers = stop_times.copy()
-            servers.update(pause_times)
-            async for sid in AsyncIter(servers, steps=5):
-                server_obj = self.bot.get_guild(sid)
-                if not server_obj:
-                    stop_times.pop(sid, None)
-                    pause_times.pop(sid, None)
-                    try:
-                        player = lavalink.get_player(sid)
-                        await self.api_interface.persistent_queue_api.drop(sid)
-                        player.store("autoplay_notified", False)
-                        await player.stop()
-                        await player.disconnect()
-                        await self.config.guild_from_id(
-                            guild_id=sid
-                        ).currently_auto_playing_in.set([])
-                    except Exception as exc:
-                        log.debug(
-                            "Exception raised in Audio's emptydc_timer for %s.", sid, exc_info=exc
-                        )
+    async def _get_empty_channel_settings(
+        self, guild: discord.Guild
+    ) -> Tuple[Optional[int], Optional[int]]:
+        try:
+            return self._empty_channel_settings[guild.id]
+        except KeyError:
+            pass
+        generation = self._empty_channel_settings_generation
+        guild_config = self.config.guild(guild)
+        settings = (
+            await guild_config.emptydc_timer() if await guild_config.emptydc_enabled() else None,
+            await guild_config.emptypause_timer()
+            if await guild_config.emptypause_enabled()
+            else None,
+        )
+        # The settings may have changed while they were being read.
+        if generation == self._empty_channel_settings_generation:
+            self._empty_channel_settings[guild.id] = settings
+        return settings
 
-                elif sid in stop_times and await self.config.guild(server_obj).emptydc_enabled():
-                    emptydc_timer = await self.config.guild(server_obj).emptydc_timer()
-                    if (time.time() - stop_times[sid]) >= emptydc_timer:
-                        stop_times.pop(sid)
-                        try:
-                            player = lavalink.get_player(sid)
-                            await self.api_interface.persistent_queue_api.drop(sid)
-                            player.store("autoplay_notified", False)
-                            await player.stop()
-                            await player.disconnect()
-                            await self.config.guild_from_id(
-                                guild_id=sid
-                            ).currently_auto_playing_in.set([])
-                        except Exception as exc:
-                            if "No such player for that guild" in str(exc):
-                                stop_times.pop(sid, None)
-                            log.debug(
-                                "Exception raised in Audio's emptydc_timer for %s.",
-                                sid,
-                                exc_info=exc,
-                            )
-                elif (
-                    sid in pause_times and await self.config.guild(server_obj).emptypause_enabled()
-                ):
-                    emptypause_timer = await self.config.guild(server_obj).emptypause_timer()
-                    if (time.time() - pause_times.get(sid, 0)) >= emptypause_timer:
-                        try:
-                            await lavalink.get_player(sid).pause()
-                        except Exception as exc:
-                            if "No such player for that guild" in str(exc):
-                                pause_times.pop(sid, None)
-                            log.debug(
-                                "Exception raised in Audio's pausing for %s.", sid, exc_info=exc
-                            )
-            await asyncio.sleep(5)
+    def _on_empty_channel_setting_change(self, change: ConfigChange) -> None:
+        if not any(
+            change.overlaps(Config.GUILD, *change.primary_key[:1], setting)
+            for setting in _EMPTY_CHANNEL_SETTINGS
+        ):
+            return
+        self._empty_channel_settings_generation += 1
+        if change.primary_key:
+            guild_ids = [int(change.primary_key[0])]
+            self._empty_channel_settings.pop(guild_ids[0], None)
+        else:
+            guild_ids = list(self._empty_channel_since)
+            self._empty_channel_settings.clear()
+        for guild_id in guild_ids:
+            if guild_id in self._empty_channel_since:
+                self._wake_empty_channel_timer(guild_id)
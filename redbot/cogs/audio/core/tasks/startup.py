@@ -1,5 +1,4 @@
 import asyncio
-import itertools
 from pathlib import Path
 
 from typing import Optional
@@ -11,7 +10,7 @@ from red_commons.logging import getLogger
 from redbot.core.data_manager import cog_data_path
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
-from redbot.core.utils.dbtools import APSWConnectionWrapper
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
 
 from ...apis.interface import AudioAPIInterface
 from ...apis.playlist_wrapper import PlaylistWrapper
@@ -35,11 +34,11 @@ class StartUpTasks(MixinMeta, metaclass=CompositeMetaClass):
         await self.bot.wait_until_red_ready()
         # Unlike most cases, we want the cache to exit before migration.
         try:
-            self.db_conn = APSWConnectionWrapper(
+            self.db_conn = ThreadedAPSWConnection(
                 str(cog_data_path(self.bot.get_cog("Audio")) / "Audio.db")
             )
             self.api_interface = AudioAPIInterface(
-                self.bot, self.config, self.session, self.db_conn, self.bot.get_cog("Audio")
+                self.bot, self.config, self.http_client, self.db_conn, self.bot.get_cog("Audio")
             )
             self.playlist_api = PlaylistWrapper(self.bot, self.config, self.db_conn)
             await self.playlist_api.init()
@@ -53,6 +52,7 @@ class StartUpTasks(MixinMeta, metaclass=CompositeMetaClass):
             await self._build_bundled_playlist()
             self.lavalink_restart_connect()
             self.player_automated_timer_task = asyncio.create_task(self.player_automated_timer())
+            self.cache_maintenance_task = asyncio.create_task(self.cache_maintenance())
         except Exception as exc:
             log.critical("Audio failed to start up, please report this issue.", exc_info=exc)
             return
@@ -62,7 +62,6 @@ class StartUpTasks(MixinMeta, metaclass=CompositeMetaClass):
     async def restore_players(self):
         log.debug("Starting new restore player task")
         tries = 0
-        tracks_to_restore = await self.api_interface.persistent_queue_api.fetch_all()
         while not lavalink.get_all_nodes():
             await asyncio.sleep(1)
             log.trace("Waiting for node to be available")
@@ -91,12 +90,10 @@ class StartUpTasks(MixinMeta, metaclass=CompositeMetaClass):
         if self.lavalink_connection_aborted:
             log.warning("Aborting player restore due to Lavalink connection being aborted.")
             return
-        for guild_id, track_data in itertools.groupby(tracks_to_restore, key=lambda x: x.guild_id):
-            await asyncio.sleep(0)
+        async for guild_id, track_data in self.api_interface.persistent_queue_api.fetch_by_guild():
             tries = 0
             try:
                 player: Optional[lavalink.Player] = None
-                track_data = list(track_data)
                 guild = self.bot.get_guild(guild_id)
                 if not guild:
                     log.verbose(
@@ -1,16 +1,18 @@
 import contextlib
+import os
 
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Union
+from typing import List, Optional, Union
 
 import discord
 import lavalink
 from red_commons.logging import getLogger
 
-from fuzzywuzzy import process
 from redbot.core import commands
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
+from redbot.core.utils._internal_utils import FuzzyIndex
 
 from ...audio_dataclasses import LocalPath, Query
 from ...errors import TrackEnqueueError
@@ -29,6 +31,9 @@ class LocalTrackUtilities(MixinMeta, metaclass=CompositeMetaClass):
         if not await self.localtracks_folder_exists(ctx):
             return []
 
+        indexed = await self._get_indexed_local_folders(audio_data, search_subfolders)
+        if indexed is not None:
+            return indexed
         return (
             await audio_data.subfolders_in_tree()
             if search_subfolders
@@ -44,6 +49,11 @@ class LocalTrackUtilities(MixinMeta, metaclass=CompositeMetaClass):
             return []
         if not query.local_track_path.exists():
             return []
+        indexed = await self._get_indexed_local_tracks(
+            query.local_track_path, query.search_subfolders
+        )
+        if indexed is not None:
+            return indexed
         return (
             await query.local_track_path.tracks_in_tree()
             if query.search_subfolders
@@ -92,6 +102,11 @@ class LocalTrackUtilities(MixinMeta, metaclass=CompositeMetaClass):
     ) -> List[Query]:
         if not await self.localtracks_folder_exists(ctx) or query.local_track_path is None:
             return []
+        indexed = await self._get_indexed_local_tracks(
+            query.local_track_path, query.search_subfolders
+        )
+        if indexed is not None:
+            return indexed
         return (
             await query.local_track_path.tracks_in_tree()
             if query.search_subfolders
@@ -110,22 +125,63 @@ class LocalTrackUtilities(MixinMeta, metaclass=CompositeMetaClass):
             )
         return False
 
+    async def _get_indexed_local_tracks(
+        self, local_path: LocalPath, recursive: bool
+    ) -> Optional[List[Query]]:
+        """Return the tracks in the given folder from the local tracks index.
+
+        Returns ``None`` if the index isn't available yet.
+        """
+        if self.api_interface is None:
+            return None
+        index = self.api_interface.local_tracks_api
+        root = str(local_path.localtrack_folder.absolute())
+        await index.refresh(root)
+        tracks = []
+        async for path in AsyncIter(
+            await index.fetch_tracks(local_path.absolute(), recursive), steps=500
+        ):
+            # Tracks in the root of the localtracks folder can't be played.
+            if os.path.dirname(path) == root:
+                continue
+            tracks.append(
+                Query.process_input(
+                    LocalPath(path, self.local_folder_current_path),
+                    self.local_folder_current_path,
+                )
+            )
+        return sorted(tracks, key=lambda x: x.to_string_user().lower())
+
+    async def _get_indexed_local_folders(
+        self, local_path: LocalPath, recursive: bool
+    ) -> Optional[List[LocalPath]]:
+        """Return the subfolders of the given folder from the local tracks index.
+
+        Returns ``None`` if the index isn't available yet.
+        """
+        if self.api_interface is None:
+            return None
+        index = self.api_interface.local_tracks_api
+        await index.refresh(local_path.localtrack_folder.absolute())
+        folders = [
+            LocalPath(path, self.local_folder_current_path)
+            for path in await index.fetch_folders(local_path.absolute(), recursive)
+        ]
+        return sorted(folders, key=lambda x: x.to_string_user().lower())
+
     async def _build_local_search_list(
         self, to_search: List[Query], search_words: str
     ) -> List[str]:
-        to_search_string = {
-            i.local_track_path.name for i in to_search if i.local_track_path is not None
-        }
-        search_results = process.extract(search_words, to_search_string, limit=50)
+        by_name = defaultdict(list)
+        for i in to_search:
+            if i.local_track_path is not None:
+                by_name[i.local_track_path.name].append(i)
+        search_results = await FuzzyIndex.extract(
+            search_words, ((name, name) for name in by_name), limit=50, score_cutoff=86
+        )
         search_list = []
         async for track_match, percent_match in AsyncIter(search_results):
-            if percent_match > 85:
-                search_list.extend(
-                    [
-                        discord.utils.escape_markdown(i.to_string_user())
-                        for i in to_search
-                        if i.local_track_path is not None
-                        and i.local_track_path.name == track_match
-                    ]
-                )
+            search_list.extend(
+                [discord.utils.escape_markdown(i.to_string_user()) for i in by_name[track_match]]
+            )
         return search_list
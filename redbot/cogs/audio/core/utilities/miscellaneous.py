@@ -110,6 +110,7 @@ class MiscellaneousUtilities(MixinMeta, metaclass=CompositeMetaClass):
     async def _close_database(self) -> None:
         if self.api_interface is not None:
             await self.api_interface.run_all_pending_tasks()
+            await self.api_interface.persistent_queue_api.flush()
             self.api_interface.close()
 
     async def _check_api_tokens(self) -> MutableMapping:
@@ -209,13 +210,7 @@ class MiscellaneousUtilities(MixinMeta, metaclass=CompositeMetaClass):
 
     async def queue_duration(self, ctx: commands.Context) -> int:
         player = lavalink.get_player(ctx.guild.id)
-        dur = [
-            i.length
-            async for i in AsyncIter(player.queue, steps=50).filter(lambda x: not x.is_stream)
-        ]
-        queue_dur = sum(dur)
-        if not player.queue:
-            queue_dur = 0
+        queue_dur = self._get_queue(player).duration
         try:
             if not player.current.is_stream:
                 remain = player.current.length - player.position
@@ -338,6 +333,11 @@ class MiscellaneousUtilities(MixinMeta, metaclass=CompositeMetaClass):
                     await p.save()
                 await self.config.custom(scope).clear()
             await self.config.schema_version.set(3)
+        if from_version < 4 <= to_version:
+            # Tracks are moved out of the playlists table a few playlists at a time,
+            # so other queries aren't held up by one long transaction.
+            await self.playlist_api.migrate_legacy_tracks()
+            await self.config.schema_version.set(4)
 
         if database_entries:
             await self.api_interface.local_cache_api.lavalink.insert(database_entries)
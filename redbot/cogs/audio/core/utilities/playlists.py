@@ -9,7 +9,6 @@ from pathlib import Path
 
 from typing import List, MutableMapping, Optional, Tuple, Union
 
-import aiohttp
 import discord
 import lavalink
 from lavalink import NodeNotFound
@@ -144,7 +143,8 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
         Returns
         -------
         Tuple[Optional[Playlist], str, str]
-            Tuple of Playlist or None if none found, original user input and scope.
+            Tuple of Playlist (with its tracks loaded) or None if none found,
+            original user input and scope.
         Raises
         ------
         `TooManyMatches`
@@ -227,7 +227,8 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
                     ).format(match_count=match_count, original_input=original_input)
                 )
         elif match_count == 1:
-            return correct_scope_matches[0], original_input, correct_scope_matches[0].scope
+            playlist = await correct_scope_matches[0].load_tracks()
+            return playlist, original_input, playlist.scope
         elif match_count == 0:
             return None, original_input, scope or PlaylistScope.GUILD.value
 
@@ -249,7 +250,7 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
                 number=number,
                 playlist=playlist,
                 scope=self.humanize_scope(playlist.scope),
-                tracks=len(playlist.tracks),
+                tracks=playlist.track_count,
                 author=author,
             )
             playlists += line
@@ -284,11 +285,8 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
             )
         with contextlib.suppress(discord.HTTPException):
             await msg.delete()
-        return (
-            correct_scope_matches[pred.result],
-            original_input,
-            correct_scope_matches[pred.result].scope,
-        )
+        playlist = await correct_scope_matches[pred.result].load_tracks()
+        return playlist, original_input, playlist.scope
 
     async def _build_playlist_list_page(
         self, ctx: commands.Context, page_num: int, abc_names: List, scope: Optional[str]
@@ -412,6 +410,7 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
         embed1 = discord.Embed(title=_("Please wait, adding tracks..."))
         playlist_msg = await self.send_embed_msg(ctx, embed=embed1)
         notifier = Notifier(ctx, playlist_msg, {"playlist": _("Loading track {num}/{total}...")})
+        await self.api_interface.prefetch_tracks(ctx, uploaded_track_list)
         async for track_count, song_url in AsyncIter(uploaded_track_list).enumerate(start=1):
             try:
                 try:
@@ -684,24 +683,21 @@ class PlaylistUtilities(MixinMeta, metaclass=CompositeMetaClass):
             return str(ctx) if ctx else _("the User") if the else _("User")
 
     async def _get_bundled_playlist_tracks(self):
-        async with aiohttp.ClientSession(json_serialize=json.dumps) as session:
-            async with session.get(
-                CURRATED_DATA + f"?timestamp={int(time.time())}",
-                headers={"content-type": "application/json"},
-            ) as response:
-                if response.status != 200:
-                    return 0, []
-                try:
-                    data = json.loads(await response.read())
-                except Exception as exc:
-                    log.error(
-                        "Curated playlist couldn't be parsed, report this error.", exc_info=exc
-                    )
-                    data = {}
-                web_version = data.get("version", 0)
-                entries = data.get("entries", [])
-                if entries:
-                    random.shuffle(entries)
+        async with self.session.get(
+            CURRATED_DATA + f"?timestamp={int(time.time())}",
+            headers={"content-type": "application/json"},
+        ) as response:
+            if response.status != 200:
+                return 0, []
+            try:
+                data = json.loads(await response.read())
+            except Exception as exc:
+                log.error("Curated playlist couldn't be parsed, report this error.", exc_info=exc)
+                data = {}
+            web_version = data.get("version", 0)
+            entries = data.get("entries", [])
+            if entries:
+                random.shuffle(entries)
         tracks = []
         async for entry in AsyncIter(entries, steps=25):
             with contextlib.suppress(Exception):
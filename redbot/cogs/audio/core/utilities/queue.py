@@ -1,19 +1,20 @@
 import math
 from pathlib import Path
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import discord
 import lavalink
 from red_commons.logging import getLogger
 
-from fuzzywuzzy import process
 from redbot.core import commands
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
+from redbot.core.utils._internal_utils import FuzzyIndex
 from redbot.core.utils.chat_formatting import humanize_number
 
 from ...audio_dataclasses import LocalPath, Query
+from ...utils import IndexedQueue
 from ..abc import MixinMeta
 from ..cog_utils import CompositeMetaClass
 
@@ -22,6 +23,12 @@ _ = Translator("Audio", Path(__file__))
 
 
 class QueueUtilities(MixinMeta, metaclass=CompositeMetaClass):
+    def _get_queue(self, player: lavalink.player.Player) -> IndexedQueue:
+        # Red-Lavalink replaces the queue with a plain list when it stops or shuffles.
+        if not isinstance(player.queue, IndexedQueue):
+            player.queue = IndexedQueue(player.queue)
+        return player.queue
+
     async def _build_queue_page(
         self,
         ctx: commands.Context,
@@ -114,32 +121,41 @@ class QueueUtilities(MixinMeta, metaclass=CompositeMetaClass):
         return embed
 
     async def _build_queue_search_list(
-        self, queue_list: List[lavalink.Track], search_words: str
+        self,
+        queue_list: List[lavalink.Track],
+        search_words: str,
+        player: Optional[lavalink.player.Player] = None,
     ) -> List[Tuple[int, str]]:
-        track_list = []
-        async for queue_idx, track in AsyncIter(queue_list).enumerate(start=1):
-            if not self.match_url(track.uri):
-                query = Query.process_input(track, self.local_folder_current_path)
-                if (
-                    query.is_local
-                    and query.local_track_path is not None
-                    and track.title == "Unknown title"
-                ):
-                    track_title = query.local_track_path.to_string_user()
+        snapshot = tuple(queue_list)
+        version = getattr(queue_list, "version", None)
+        index = None
+        if player is not None and version is not None:
+            # The index is only rebuilt when the queue was changed since the last search.
+            cached = player.fetch("queue_search_index")
+            if cached is not None and cached[0] is queue_list and cached[1] == version:
+                index = cached[2]
+        if index is None:
+            track_list = []
+            async for queue_idx, track in AsyncIter(snapshot, steps=100).enumerate(start=1):
+                if not self.match_url(track.uri):
+                    query = Query.process_input(track, self.local_folder_current_path)
+                    if (
+                        query.is_local
+                        and query.local_track_path is not None
+                        and track.title == "Unknown title"
+                    ):
+                        track_title = query.local_track_path.to_string_user()
+                    else:
+                        track_title = "{} - {}".format(track.author, track.title)
                 else:
-                    track_title = "{} - {}".format(track.author, track.title)
-            else:
-                track_title = track.title
-
-            song_info = {str(queue_idx): track_title}
-            track_list.append(song_info)
-        search_results = process.extract(search_words, track_list, limit=50)
-        search_list = []
-        async for search, percent_match in AsyncIter(search_results):
-            async for queue_position, title in AsyncIter(search.items()):
-                if percent_match > 89:
-                    search_list.append((queue_position, title))
-        return search_list
+                    track_title = track.title
+
+                track_list.append(((str(queue_idx), track_title), track_title))
+            index = FuzzyIndex(track_list)
+            if player is not None and version is not None:
+                player.store("queue_search_index", (queue_list, version, index))
+        search_results = await index.search_async(search_words, limit=50, score_cutoff=90)
+        return [song_info for song_info, percent_match in search_results]
 
     async def _build_queue_search_page(
         self, ctx: commands.Context, page_num: int, search_list: List[Tuple[int, str]]
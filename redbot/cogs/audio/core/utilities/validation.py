@@ -1,6 +1,6 @@
 import re
 
-from typing import Final, List, Optional, Pattern, Set, Union
+from typing import Dict, Final, Iterable, Optional, Pattern, Tuple, Union
 from urllib.parse import urlparse
 
 import discord
@@ -8,6 +8,7 @@ from red_commons.logging import getLogger
 
 from redbot.core import Config
 from redbot.core.commands import Context
+from redbot.core.config import ConfigChange
 
 from ...audio_dataclasses import Query
 from ..abc import MixinMeta
@@ -19,6 +20,37 @@ _RE_YT_LIST_PLAYLIST: Final[Pattern] = re.compile(
     r"^(https?://)?(www\.)?(youtube\.com|youtu\.?be)(/playlist\?).*(list=)(.*)(&|$)"
 )
 
+# The compiled whitelist and blacklist of URL keywords, None when a list is empty.
+_KeywordFilter = Tuple[Optional[Pattern], Optional[Pattern]]
+
+
+def _compile_keywords(keywords: Iterable[str]) -> Optional[Pattern]:
+    """Compile keywords into a pattern matching a string containing any of them.
+
+    The pattern follows a trie of the keywords, so a search only tries
+    the keywords sharing a prefix with the text at each position,
+    instead of trying every keyword in turn.
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}
+    if not trie:
+        return None
+
+    def to_pattern(node: Dict[str, dict]) -> str:
+        if "" in node:
+            # A keyword ends here, so longer keywords don't need to be matched.
+            return ""
+        branches = [re.escape(char) + to_pattern(child) for char, child in sorted(node.items())]
+        if len(branches) == 1:
+            return branches[0]
+        return f"(?:{'|'.join(branches)})"
+
+    return re.compile(to_pattern(trie))
+
 
 class ValidationUtilities(MixinMeta, metaclass=CompositeMetaClass):
     def match_url(self, url: str) -> bool:
@@ -77,20 +109,45 @@ class ValidationUtilities(MixinMeta, metaclass=CompositeMetaClass):
             query = query_obj.lavalink_query.replace("ytsearch:", "youtubesearch").replace(
                 "scsearch:", "soundcloudsearch"
             )
-        global_whitelist = set(await config.url_keyword_whitelist())
-        global_whitelist = [i.lower() for i in global_whitelist]
-        if global_whitelist:
-            return any(i in query for i in global_whitelist)
-        global_blacklist = set(await config.url_keyword_blacklist())
-        global_blacklist = [i.lower() for i in global_blacklist]
-        if any(i in query for i in global_blacklist):
+        global_whitelist, global_blacklist = await self._get_url_keyword_filter(config, None)
+        if global_whitelist is not None:
+            return global_whitelist.search(query) is not None
+        if global_blacklist is not None and global_blacklist.search(query):
             return False
         if guild is not None:
-            whitelist_unique: Set[str] = set(await config.guild(guild).url_keyword_whitelist())
-            whitelist: List[str] = [i.lower() for i in whitelist_unique]
-            if whitelist:
-                return any(i in query for i in whitelist)
-            blacklist_unique: Set[str] = set(await config.guild(guild).url_keyword_blacklist())
-            blacklist: List[str] = [i.lower() for i in blacklist_unique]
-            return not any(i in query for i in blacklist)
+            whitelist, blacklist = await self._get_url_keyword_filter(config, guild)
+            if whitelist is not None:
+                return whitelist.search(query) is not None
+            return blacklist is None or blacklist.search(query) is None
         return True
+
+    async def _get_url_keyword_filter(
+        self, config: Config, guild: Optional[discord.Guild]
+    ) -> _KeywordFilter:
+        key = guild.id if guild is not None else None
+        try:
+            return self._url_keyword_filters[key]
+        except KeyError:
+            pass
+        generation = self._url_keyword_filters_generation
+        group = config if guild is None else config.guild(guild)
+        keyword_filter = (
+            _compile_keywords(await group.url_keyword_whitelist()),
+            _compile_keywords(await group.url_keyword_blacklist()),
+        )
+        # Don't cache what might have been changed while reading it.
+        if generation == self._url_keyword_filters_generation:
+            self._url_keyword_filters[key] = keyword_filter
+        return keyword_filter
+
+    def _on_url_keyword_change(self, change: ConfigChange) -> None:
+        for keywords in ("url_keyword_whitelist", "url_keyword_blacklist"):
+            if change.overlaps(Config.GLOBAL, keywords):
+                self._url_keyword_filters_generation += 1
+                self._url_keyword_filters.pop(None, None)
+            if change.overlaps(Config.GUILD, *change.primary_key[:1], keywords):
+                self._url_keyword_filters_generation += 1
+                if change.primary_key:
+                    self._url_keyword_filters.pop(int(change.primary_key[0]), None)
+                else:
+                    self._url_keyword_filters.clear()
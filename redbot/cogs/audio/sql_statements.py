@@ -10,6 +10,10 @@ __all__ = [
     "PRAGMA_SET_read_uncommitted",
     "PRAGMA_FETCH_user_version",
     "PRAGMA_SET_user_version",
+    "PRAGMA_FETCH_auto_vacuum",
+    "PRAGMA_SET_auto_vacuum",
+    "PRAGMA_incremental_vacuum",
+    "VACUUM",
     # Data Deletion statement
     "HANDLE_DISCORD_DATA_DELETION_QUERY",
     # Playlist table statements
@@ -23,19 +27,38 @@ __all__ = [
     "PLAYLIST_FETCH",
     "PLAYLIST_UPSERT",
     "PLAYLIST_CREATE_INDEX",
+    "PLAYLIST_FETCH_LEGACY_TRACKS",
+    "PLAYLIST_MIGRATE_LEGACY_TRACKS",
+    "PLAYLIST_CLEAR_LEGACY_TRACKS",
+    # Playlist tracks table statements
+    "PLAYLIST_TRACKS_CREATE_TABLE",
+    "PLAYLIST_TRACKS_DELETE",
+    "PLAYLIST_TRACKS_DELETE_PLAYLIST",
+    "PLAYLIST_TRACKS_DELETE_SCOPE",
+    "PLAYLIST_TRACKS_DELETE_SCHEDULED",
+    "PLAYLIST_TRACKS_FETCH",
+    "PLAYLIST_TRACKS_FETCH_LAST_POSITION",
+    "PLAYLIST_TRACKS_INSERT",
     # YouTube table statements
     "YOUTUBE_DROP_TABLE",
     "YOUTUBE_CREATE_TABLE",
     "YOUTUBE_CREATE_INDEX",
+    "YOUTUBE_CREATE_INDEX_LAST_FETCHED",
+    "YOUTUBE_COUNT",
+    "YOUTUBE_DELETE_LEAST_RECENTLY_FETCHED",
     "YOUTUBE_UPSERT",
     "YOUTUBE_UPDATE",
     "YOUTUBE_QUERY",
+    "YOUTUBE_QUERY_MANY",
     "YOUTUBE_QUERY_ALL",
     "YOUTUBE_DELETE_OLD_ENTRIES",
     "YOUTUBE_QUERY_LAST_FETCHED_RANDOM",
     # Spotify table statements
     "SPOTIFY_DROP_TABLE",
     "SPOTIFY_CREATE_INDEX",
+    "SPOTIFY_CREATE_INDEX_LAST_FETCHED",
+    "SPOTIFY_COUNT",
+    "SPOTIFY_DELETE_LEAST_RECENTLY_FETCHED",
     "SPOTIFY_CREATE_TABLE",
     "SPOTIFY_UPSERT",
     "SPOTIFY_QUERY",
@@ -47,11 +70,16 @@ __all__ = [
     "LAVALINK_DROP_TABLE",
     "LAVALINK_CREATE_TABLE",
     "LAVALINK_CREATE_INDEX",
+    "LAVALINK_COUNT",
+    "LAVALINK_DELETE_LEAST_RECENTLY_FETCHED",
+    "LAVALINK_CREATE_INDEX_LAST_FETCHED",
     "LAVALINK_UPSERT",
     "LAVALINK_UPDATE",
     "LAVALINK_QUERY",
+    "LAVALINK_QUERY_MANY",
     "LAVALINK_QUERY_ALL",
-    "LAVALINK_QUERY_LAST_FETCHED_RANDOM",
+    "LAVALINK_QUERY_BY_ID",
+    "LAVALINK_QUERY_LAST_FETCHED_RANDOM_IDS",
     "LAVALINK_DELETE_OLD_ENTRIES",
     "LAVALINK_FETCH_ALL_ENTRIES_GLOBAL",
     # Persisting Queue statements
@@ -61,8 +89,24 @@ __all__ = [
     "PERSIST_QUEUE_PLAYED",
     "PERSIST_QUEUE_DELETE_SCHEDULED",
     "PERSIST_QUEUE_FETCH_ALL",
+    "PERSIST_QUEUE_FETCH_GUILD_IDS",
+    "PERSIST_QUEUE_FETCH_GUILD",
     "PERSIST_QUEUE_UPSERT",
     "PERSIST_QUEUE_BULK_PLAYED",
+    # Local Tracks Index
+    "LOCAL_TRACKS_CREATE_TABLE",
+    "LOCAL_TRACKS_CREATE_INDEX",
+    "LOCAL_TRACKS_INSERT",
+    "LOCAL_TRACKS_DELETE_FOLDER",
+    "LOCAL_TRACKS_FETCH_FOLDER",
+    "LOCAL_TRACKS_FETCH_TREE",
+    "LOCAL_TRACKS_FOLDERS_CREATE_TABLE",
+    "LOCAL_TRACKS_FOLDERS_CREATE_INDEX",
+    "LOCAL_TRACKS_FOLDERS_UPSERT",
+    "LOCAL_TRACKS_FOLDERS_DELETE",
+    "LOCAL_TRACKS_FOLDERS_FETCH_ALL",
+    "LOCAL_TRACKS_FOLDERS_FETCH_CHILDREN",
+    "LOCAL_TRACKS_FOLDERS_FETCH_TREE",
 ]
 
 # PRAGMA Statements
@@ -92,6 +136,26 @@ PRAGMA_SET_user_version: Final[
 ] = """
 pragma user_version=3;
 """
+PRAGMA_FETCH_auto_vacuum: Final[
+    str
+] = """
+PRAGMA auto_vacuum;
+"""
+PRAGMA_SET_auto_vacuum: Final[
+    str
+] = """
+PRAGMA auto_vacuum = 2;
+"""
+PRAGMA_incremental_vacuum: Final[
+    str
+] = """
+PRAGMA incremental_vacuum;
+"""
+VACUUM: Final[
+    str
+] = """
+VACUUM;
+"""
 
 # Data Deletion
 # This is intentionally 2 seperate transactions due to concerns
@@ -114,6 +178,13 @@ COMMIT TRANSACTION;
 
 BEGIN TRANSACTION;
 
+DELETE FROM playlist_tracks
+WHERE (scope_type, playlist_id, scope_id) IN (
+    SELECT scope_type, playlist_id, scope_id
+    FROM playlists
+    WHERE deleted=true
+);
+
 DELETE FROM PLAYLISTS
 WHERE deleted=true;
 
@@ -132,6 +203,7 @@ CREATE TABLE IF NOT EXISTS playlists (
     author_id INTEGER NOT NULL,
     deleted BOOLEAN DEFAULT false,
     playlist_url TEXT,
+    -- Tracks are stored in playlist_tracks, this is only read to migrate older databases.
     tracks JSON,
     PRIMARY KEY (playlist_id, scope_id, scope_type)
 );
@@ -177,7 +249,16 @@ SELECT
     scope_id,
     author_id,
     playlist_url,
-    tracks
+    (
+        SELECT
+            COUNT(*)
+        FROM
+            playlist_tracks
+        WHERE
+            playlist_tracks.scope_type = playlists.scope_type
+            AND playlist_tracks.playlist_id = playlists.playlist_id
+            AND playlist_tracks.scope_id = playlists.scope_id
+    ) AS track_count
 FROM
     playlists
 WHERE
@@ -195,7 +276,16 @@ SELECT
     scope_id,
     author_id,
     playlist_url,
-    tracks
+    (
+        SELECT
+            COUNT(*)
+        FROM
+            playlist_tracks
+        WHERE
+            playlist_tracks.scope_type = playlists.scope_type
+            AND playlist_tracks.playlist_id = playlists.playlist_id
+            AND playlist_tracks.scope_id = playlists.scope_id
+    ) AS track_count
 FROM
     playlists
 WHERE
@@ -216,7 +306,16 @@ SELECT
     scope_id,
     author_id,
     playlist_url,
-    tracks
+    (
+        SELECT
+            COUNT(*)
+        FROM
+            playlist_tracks
+        WHERE
+            playlist_tracks.scope_type = playlists.scope_type
+            AND playlist_tracks.playlist_id = playlists.playlist_id
+            AND playlist_tracks.scope_id = playlists.scope_id
+    ) AS track_count
 FROM
     playlists
 WHERE
@@ -241,7 +340,16 @@ SELECT
     scope_id,
     author_id,
     playlist_url,
-    tracks
+    (
+        SELECT
+            COUNT(*)
+        FROM
+            playlist_tracks
+        WHERE
+            playlist_tracks.scope_type = playlists.scope_type
+            AND playlist_tracks.playlist_id = playlists.playlist_id
+            AND playlist_tracks.scope_id = playlists.scope_id
+    ) AS track_count
 FROM
     playlists
 WHERE
@@ -257,17 +365,16 @@ PLAYLIST_UPSERT: Final[
     str
 ] = """
 INSERT INTO
-    playlists ( scope_type, playlist_id, playlist_name, scope_id, author_id, playlist_url, tracks )
+    playlists ( scope_type, playlist_id, playlist_name, scope_id, author_id, playlist_url )
 VALUES
     (
-        :scope_type, :playlist_id, :playlist_name, :scope_id, :author_id, :playlist_url, :tracks
+        :scope_type, :playlist_id, :playlist_name, :scope_id, :author_id, :playlist_url
     )
     ON CONFLICT (scope_type, playlist_id, scope_id) DO
     UPDATE
     SET
         playlist_name = excluded.playlist_name,
-        playlist_url = excluded.playlist_url,
-        tracks = excluded.tracks;
+        playlist_url = excluded.playlist_url;
 """
 PLAYLIST_CREATE_INDEX: Final[
     str
@@ -276,6 +383,169 @@ CREATE INDEX IF NOT EXISTS name_index ON playlists (
 scope_type, playlist_id, playlist_name, scope_id
 );
 """
+PLAYLIST_FETCH_LEGACY_TRACKS: Final[
+    str
+] = """
+SELECT
+    scope_type,
+    playlist_id,
+    scope_id
+FROM
+    playlists
+WHERE
+    tracks IS NOT NULL
+LIMIT :limit;
+"""
+PLAYLIST_MIGRATE_LEGACY_TRACKS: Final[
+    str
+] = """
+INSERT INTO
+    playlist_tracks ( scope_type, playlist_id, scope_id, position, track )
+SELECT
+    playlists.scope_type,
+    playlists.playlist_id,
+    playlists.scope_id,
+    json_each.key,
+    json_each.value
+FROM
+    playlists,
+    json_each(playlists.tracks)
+WHERE
+    (
+        playlists.scope_type = :scope_type
+        AND playlists.playlist_id = :playlist_id
+        AND playlists.scope_id = :scope_id
+        AND json_valid(playlists.tracks)
+    )
+    ON CONFLICT (scope_type, playlist_id, scope_id, position) DO NOTHING;
+"""
+PLAYLIST_CLEAR_LEGACY_TRACKS: Final[
+    str
+] = """
+UPDATE playlists
+    SET
+        tracks = NULL
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+;
+"""
+
+# Playlist tracks table statements
+PLAYLIST_TRACKS_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS playlist_tracks (
+    scope_type INTEGER NOT NULL,
+    playlist_id INTEGER NOT NULL,
+    scope_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    track JSON NOT NULL,
+    PRIMARY KEY (scope_type, playlist_id, scope_id, position)
+);
+"""
+PLAYLIST_TRACKS_DELETE: Final[
+    str
+] = """
+DELETE
+FROM
+    playlist_tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+        AND position = :position
+    )
+;
+"""
+PLAYLIST_TRACKS_DELETE_PLAYLIST: Final[
+    str
+] = """
+DELETE
+FROM
+    playlist_tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+;
+"""
+PLAYLIST_TRACKS_DELETE_SCOPE: Final[
+    str
+] = """
+DELETE
+FROM
+    playlist_tracks
+WHERE
+    scope_type = :scope_type ;
+"""
+PLAYLIST_TRACKS_DELETE_SCHEDULED: Final[
+    str
+] = """
+DELETE
+FROM
+    playlist_tracks
+WHERE
+    (scope_type, playlist_id, scope_id) IN (
+        SELECT
+            scope_type,
+            playlist_id,
+            scope_id
+        FROM
+            playlists
+        WHERE
+            deleted = true
+    )
+;
+"""
+PLAYLIST_TRACKS_FETCH: Final[
+    str
+] = """
+SELECT
+    position,
+    track
+FROM
+    playlist_tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+ORDER BY position ;
+"""
+PLAYLIST_TRACKS_FETCH_LAST_POSITION: Final[
+    str
+] = """
+SELECT
+    MAX(position)
+FROM
+    playlist_tracks
+WHERE
+    (
+        scope_type = :scope_type
+        AND playlist_id = :playlist_id
+        AND scope_id = :scope_id
+    )
+;
+"""
+PLAYLIST_TRACKS_INSERT: Final[
+    str
+] = """
+INSERT INTO
+    playlist_tracks ( scope_type, playlist_id, scope_id, position, track )
+VALUES
+    (
+        :scope_type, :playlist_id, :scope_id, :position, :track
+    )
+;
+"""
 
 # YouTube table statements
 YOUTUBE_DROP_TABLE: Final[
@@ -344,6 +614,15 @@ WHERE
     AND last_updated > :maxage
 LIMIT 1;
 """
+YOUTUBE_QUERY_MANY: Final[
+    str
+] = """
+SELECT track_info, youtube_url, last_updated
+FROM youtube
+WHERE
+    track_info IN (SELECT value FROM json_each(:tracks))
+    AND last_updated > :maxage;
+"""
 YOUTUBE_QUERY_ALL: Final[
     str
 ] = """
@@ -358,6 +637,29 @@ WHERE
     last_updated < :maxage
     ;
 """
+YOUTUBE_CREATE_INDEX_LAST_FETCHED: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_youtube_last_fetched
+ON youtube (last_fetched);
+"""
+YOUTUBE_COUNT: Final[
+    str
+] = """
+SELECT COUNT(*)
+FROM youtube;
+"""
+YOUTUBE_DELETE_LEAST_RECENTLY_FETCHED: Final[
+    str
+] = """
+DELETE FROM youtube
+WHERE rowid IN (
+    SELECT rowid
+    FROM youtube
+    ORDER BY last_fetched
+    LIMIT :count
+);
+"""
 YOUTUBE_QUERY_LAST_FETCHED_RANDOM: Final[
     str
 ] = """
@@ -455,6 +757,29 @@ WHERE
     last_updated < :maxage
     ;
 """
+SPOTIFY_CREATE_INDEX_LAST_FETCHED: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_spotify_last_fetched
+ON spotify (last_fetched);
+"""
+SPOTIFY_COUNT: Final[
+    str
+] = """
+SELECT COUNT(*)
+FROM spotify;
+"""
+SPOTIFY_DELETE_LEAST_RECENTLY_FETCHED: Final[
+    str
+] = """
+DELETE FROM spotify
+WHERE rowid IN (
+    SELECT rowid
+    FROM spotify
+    ORDER BY last_fetched
+    LIMIT :count
+);
+"""
 SPOTIFY_QUERY_LAST_FETCHED_RANDOM: Final[
     str
 ] = """
@@ -490,6 +815,12 @@ LAVALINK_CREATE_INDEX: Final[
 CREATE UNIQUE INDEX IF NOT EXISTS idx_lavalink_query
 ON lavalink (query);
 """
+LAVALINK_CREATE_INDEX_LAST_FETCHED: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS idx_lavalink_last_fetched
+ON lavalink (last_fetched, last_updated);
+"""
 LAVALINK_UPSERT: Final[
     str
 ] = """INSERT INTO
@@ -533,21 +864,41 @@ WHERE
     AND last_updated > :maxage
 LIMIT 1;
 """
+LAVALINK_QUERY_MANY: Final[
+    str
+] = """
+SELECT query, data, last_updated
+FROM lavalink
+WHERE
+    query IN (SELECT value FROM json_each(:queries))
+    AND last_updated > :maxage;
+"""
 LAVALINK_QUERY_ALL: Final[
     str
 ] = """
 SELECT data, last_updated
 FROM lavalink
 """
-LAVALINK_QUERY_LAST_FETCHED_RANDOM: Final[
+LAVALINK_QUERY_BY_ID: Final[
     str
 ] = """
 SELECT data, last_updated
 FROM lavalink
+WHERE
+    rowid=:id
+    AND last_updated > :maxage
+LIMIT 1;
+"""
+LAVALINK_QUERY_LAST_FETCHED_RANDOM_IDS: Final[
+    str
+] = """
+SELECT rowid
+FROM lavalink
 WHERE
     last_fetched > :day
     AND last_updated > :maxage
-LIMIT 100
+ORDER BY RANDOM()
+LIMIT :limit
 ;
 """
 LAVALINK_DELETE_OLD_ENTRIES: Final[
@@ -558,6 +909,23 @@ WHERE
     last_updated < :maxage
     ;
 """
+LAVALINK_COUNT: Final[
+    str
+] = """
+SELECT COUNT(*)
+FROM lavalink;
+"""
+LAVALINK_DELETE_LEAST_RECENTLY_FETCHED: Final[
+    str
+] = """
+DELETE FROM lavalink
+WHERE rowid IN (
+    SELECT rowid
+    FROM lavalink
+    ORDER BY last_fetched
+    LIMIT :count
+);
+"""
 LAVALINK_FETCH_ALL_ENTRIES_GLOBAL: Final[
     str
 ] = """
@@ -630,6 +998,27 @@ FROM
 WHERE played = false
 ORDER BY time ASC;
 """
+PERSIST_QUEUE_FETCH_GUILD_IDS: Final[
+    str
+] = """
+SELECT DISTINCT
+    guild_id
+FROM
+    persist_queue
+WHERE played = false;
+"""
+PERSIST_QUEUE_FETCH_GUILD: Final[
+    str
+] = """
+SELECT
+    guild_id, room_id, track
+FROM
+    persist_queue
+WHERE
+    guild_id = :guild_id
+    AND played = false
+ORDER BY time ASC;
+"""
 PERSIST_QUEUE_UPSERT: Final[
     str
 ] = """
@@ -644,3 +1033,134 @@ UPDATE
     SET
         time = excluded.time
 """
+
+# Local Tracks Index
+LOCAL_TRACKS_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS local_tracks(
+    path TEXT PRIMARY KEY,
+    folder TEXT NOT NULL
+);
+"""
+LOCAL_TRACKS_CREATE_INDEX: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS local_tracks_folder_index ON local_tracks (folder);
+"""
+LOCAL_TRACKS_INSERT: Final[
+    str
+] = """
+INSERT OR REPLACE INTO
+    local_tracks (path, folder)
+VALUES
+    (
+        :path, :folder
+    )
+;
+"""
+LOCAL_TRACKS_DELETE_FOLDER: Final[
+    str
+] = """
+DELETE
+FROM
+    local_tracks
+WHERE
+    folder = :folder
+;
+"""
+LOCAL_TRACKS_FETCH_FOLDER: Final[
+    str
+] = """
+SELECT
+    path
+FROM
+    local_tracks
+WHERE
+    folder = :folder
+;
+"""
+LOCAL_TRACKS_FETCH_TREE: Final[
+    str
+] = """
+SELECT
+    path
+FROM
+    local_tracks
+WHERE
+    path > :start
+    AND path < :end
+;
+"""
+LOCAL_TRACKS_FOLDERS_CREATE_TABLE: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS local_tracks_folders(
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime INTEGER NOT NULL
+);
+"""
+LOCAL_TRACKS_FOLDERS_CREATE_INDEX: Final[
+    str
+] = """
+CREATE INDEX IF NOT EXISTS local_tracks_folders_parent_index ON local_tracks_folders (parent);
+"""
+LOCAL_TRACKS_FOLDERS_UPSERT: Final[
+    str
+] = """
+INSERT INTO
+    local_tracks_folders (path, parent, mtime)
+VALUES
+    (
+        :path, :parent, :mtime
+    )
+ON CONFLICT (path) DO
+UPDATE
+    SET
+        parent = excluded.parent,
+        mtime = excluded.mtime
+;
+"""
+LOCAL_TRACKS_FOLDERS_DELETE: Final[
+    str
+] = """
+DELETE
+FROM
+    local_tracks_folders
+WHERE
+    path = :path
+;
+"""
+LOCAL_TRACKS_FOLDERS_FETCH_ALL: Final[
+    str
+] = """
+SELECT
+    path, parent, mtime
+FROM
+    local_tracks_folders
+;
+"""
+LOCAL_TRACKS_FOLDERS_FETCH_CHILDREN: Final[
+    str
+] = """
+SELECT
+    path
+FROM
+    local_tracks_folders
+WHERE
+    parent = :parent
+;
+"""
+LOCAL_TRACKS_FOLDERS_FETCH_TREE: Final[
+    str
+] = """
+SELECT
+    path
+FROM
+    local_tracks_folders
+WHERE
+    path > :start
+    AND path < :end
+;
+"""
@@ -6,11 +6,23 @@ import re
 import sys
 import time
 
+from collections import Counter
 from enum import Enum, unique
 from pathlib import Path
-from typing import MutableMapping, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Hashable,
+    Iterable,
+    List,
+    MutableMapping,
+    Tuple,
+    Union,
+)
 
 import discord
+import lavalink
 import psutil
 from red_commons.logging import getLogger
 
@@ -309,6 +321,164 @@ class Notifier:
             pass
 
 
+def _requester_id(track: lavalink.Track) -> Any:
+    return getattr(track.requester, "id", track.requester)
+
+
+def _count(counter: Counter, key: Hashable, change: int) -> None:
+    count = counter[key] + change
+    if count:
+        counter[key] = count
+    else:
+        del counter[key]
+
+
+class IndexedQueue(list):
+    """A player queue which keeps count of the tracks it holds.
+
+    This is a drop-in replacement for the list Red-Lavalink uses as ``Player.queue``.
+    It counts the queued tracks by requester, URI and identifier, and keeps their total length,
+    so that the queue commands can tell whether any track matches without scanning the queue.
+    Red-Lavalink puts a plain list back when the player is stopped or shuffled,
+    use ``QueueUtilities._get_queue`` to get a player's queue as an `IndexedQueue`.
+
+    Attributes
+    ----------
+    requesters : collections.Counter
+        The number of queued tracks by requester ID.
+    uris : collections.Counter
+        The number of queued tracks by URI.
+    identifiers : collections.Counter
+        The number of queued tracks by track identifier.
+    duration : int
+        The total length (in milliseconds) of the queued tracks, streams excluded.
+    version : int
+        A number which is increased on every change of the queue.
+    """
+
+    __slots__ = ("requesters", "uris", "identifiers", "duration", "version")
+
+    def __init__(self, tracks: Iterable[lavalink.Track] = ()):
+        super().__init__(tracks)
+        self.requesters: Counter = Counter()
+        self.uris: Counter = Counter()
+        self.identifiers: Counter = Counter()
+        self.duration = 0
+        self.version = 0
+        self._index(self, 1)
+
+    def _index(self, tracks: Iterable[lavalink.Track], change: int) -> None:
+        for track in tracks:
+            _count(self.requesters, _requester_id(track), change)
+            _count(self.uris, track.uri, change)
+            _count(self.identifiers, track.track_identifier, change)
+            if not track.is_stream:
+                self.duration += change * (track.length or 0)
+        self.version += 1
+
+    def __contains__(self, item: Any) -> bool:
+        # Tracks are equal when their identifiers are.
+        if isinstance(item, lavalink.Track):
+            return item.track_identifier in self.identifiers
+        return super().__contains__(item)
+
+    def __setitem__(self, key, value) -> None:
+        removed = self[key] if isinstance(key, slice) else [self[key]]
+        if isinstance(key, slice):
+            value = list(value)
+            added = value
+        else:
+            added = [value]
+        super().__setitem__(key, value)
+        self._index(removed, -1)
+        self._index(added, 1)
+
+    def __delitem__(self, key) -> None:
+        removed = self[key] if isinstance(key, slice) else [self[key]]
+        super().__delitem__(key)
+        self._index(removed, -1)
+
+    def __iadd__(self, tracks: Iterable[lavalink.Track]) -> "IndexedQueue":
+        self.extend(tracks)
+        return self
+
+    def __imul__(self, n: int) -> "IndexedQueue":
+        self[:] = list(self) * n
+        return self
+
+    def append(self, track: lavalink.Track) -> None:
+        super().append(track)
+        self._index((track,), 1)
+
+    def extend(self, tracks: Iterable[lavalink.Track]) -> None:
+        tracks = list(tracks)
+        super().extend(tracks)
+        self._index(tracks, 1)
+
+    def insert(self, index: int, track: lavalink.Track) -> None:
+        super().insert(index, track)
+        self._index((track,), 1)
+
+    def pop(self, index: int = -1) -> lavalink.Track:
+        track = super().pop(index)
+        self._index((track,), -1)
+        return track
+
+    def remove(self, track: lavalink.Track) -> None:
+        # The queued track is the one to unindex, it may only be equal to the given one.
+        removed = super().pop(self.index(track))
+        self._index((removed,), -1)
+
+    def clear(self) -> None:
+        super().clear()
+        self.requesters.clear()
+        self.uris.clear()
+        self.identifiers.clear()
+        self.duration = 0
+        self.version += 1
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self.version += 1
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.version += 1
+
+    def remove_where(self, predicate: Callable[[lavalink.Track], bool]) -> List[lavalink.Track]:
+        """Remove all tracks matching the predicate, in a single pass.
+
+        Returns the removed tracks.
+        """
+        kept = []
+        removed = []
+        for track in self:
+            (removed if predicate(track) else kept).append(track)
+        if removed:
+            super().__setitem__(slice(None), kept)
+            self._index(removed, -1)
+        return removed
+
+    def remove_requesters(self, requester_ids: Collection[Any]) -> List[lavalink.Track]:
+        """Remove all tracks requested by the given users."""
+        requester_ids = {i for i in requester_ids if i in self.requesters}
+        if not requester_ids:
+            return []
+        return self.remove_where(lambda track: _requester_id(track) in requester_ids)
+
+    def remove_uri(self, uri: str) -> List[lavalink.Track]:
+        """Remove all tracks with the given URI."""
+        if uri not in self.uris:
+            return []
+        return self.remove_where(lambda track: track.uri == uri)
+
+    def remove_identifier(self, identifier: str) -> List[lavalink.Track]:
+        """Remove all tracks with the given track identifier."""
+        if identifier not in self.identifiers:
+            return []
+        return self.remove_where(lambda track: track.track_identifier == identifier)
+
+
 @unique
 class PlaylistScope(Enum):
     GLOBAL = "GLOBALPLAYLIST"
@@ -1,7 +1,10 @@
+import asyncio
 import contextlib
+import hashlib
+import json
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Callable, List, Optional, Set, Union
+from typing import AsyncIterator, Callable, Iterable, List, Optional, Set, Union
 
 import discord
 
@@ -97,6 +100,36 @@ class Cleanup(commands.Cog):
         If you need to accomplish this, you should filter messages on
         the entire applicable range, rather than use this utility.
         """
+        return [
+            message
+            async for message in Cleanup.iter_messages_for_deletion(
+                channel=channel,
+                number=number,
+                check=check,
+                limit=limit,
+                before=before,
+                after=after,
+                delete_pinned=delete_pinned,
+            )
+        ]
+
+    @staticmethod
+    async def iter_messages_for_deletion(
+        *,
+        channel: Union[discord.TextChannel, discord.DMChannel, discord.Thread],
+        number: Optional[PositiveInt] = None,
+        check: Callable[[discord.Message], bool] = lambda x: True,
+        limit: Optional[PositiveInt] = None,
+        before: Union[discord.Message, datetime] = None,
+        after: Union[discord.Message, datetime] = None,
+        delete_pinned: bool = False,
+    ) -> AsyncIterator[discord.Message]:
+        """
+        Iterates over messages meeting the requirements to be deleted
+        as they're fetched from the channel's history.
+
+        See `get_messages_for_deletion` for the requirements.
+        """
 
         # This isn't actually two weeks ago to allow some wiggle room on API limits
         two_weeks_ago = datetime.now(timezone.utc) - timedelta(days=14, minutes=-5)
@@ -113,18 +146,93 @@ class Cleanup(commands.Cog):
                 after = after.created_at
             after = max(after, two_weeks_ago)
 
-        collected = []
+        collected = 0
         async for message in channel.history(
             limit=limit, before=before, after=after, oldest_first=False
         ):
             if message.created_at < two_weeks_ago:
                 break
             if message_filter(message):
-                collected.append(message)
-                if number is not None and number <= len(collected):
+                yield message
+                collected += 1
+                if number is not None and number <= collected:
                     break
 
-        return collected
+    @staticmethod
+    def message_fingerprint(message: discord.Message) -> bytes:
+        """
+        Gets a stable fingerprint of the message's author and contents,
+        used to detect duplicate messages.
+        """
+        payload = json.dumps(
+            [
+                message.author.id,
+                message.content,
+                [embed.to_dict() for embed in message.embeds],
+                [sticker.id for sticker in message.stickers],
+            ],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+    @staticmethod
+    async def purge_messages(
+        channel: Union[discord.TextChannel, discord.Thread],
+        messages: AsyncIterator[discord.Message],
+        *,
+        extra: Iterable[discord.Message] = (),
+    ) -> int:
+        """
+        Bulk deletes messages as they're produced by the given async iterator.
+
+        A bulk delete starts as soon as 100 messages have been collected,
+        while the next batch is being collected from the channel's history.
+        At most one bulk delete is in flight at a time, which applies back-pressure
+        to the history iteration. Pacing between deletes is left to discord.py's
+        rate limit handling, which follows the rate limit headers sent by Discord.
+
+        Parameters
+        ----------
+        channel : Union[discord.TextChannel, discord.Thread]
+            The channel to delete messages from.
+        messages : AsyncIterator[discord.Message]
+            The messages to delete, usually from `iter_messages_for_deletion`.
+        extra : Iterable[discord.Message]
+            Additional messages to delete, such as the invoking message.
+
+        Returns
+        -------
+        int
+            The number of messages that were passed for deletion.
+        """
+
+        async def bulk_delete(batch: List[discord.Message]) -> None:
+            # discord.NotFound can be raised when `len(batch) == 1` and the message
+            # does not exist, so errors are ignored the same way `mass_purge` does.
+            with contextlib.suppress(discord.HTTPException):
+                await channel.delete_messages(batch)
+
+        batch = list(extra)
+        count = 0
+        pending: Optional[asyncio.Task] = None
+        try:
+            async for message in messages:
+                batch.append(message)
+                if len(batch) >= 100:
+                    if pending is not None:
+                        await pending
+                    pending = asyncio.create_task(bulk_delete(batch))
+                    count += len(batch)
+                    batch = []
+        finally:
+            if pending is not None:
+                await pending
+        if batch:
+            await bulk_delete(batch)
+            count += len(batch)
+        return count
 
     async def send_optional_notification(
         self,
@@ -204,26 +312,25 @@ class Cleanup(commands.Cog):
             else:
                 return False
 
-        to_delete = await self.get_messages_for_deletion(
+        messages = self.iter_messages_for_deletion(
             channel=channel,
             number=number,
             check=check,
             before=ctx.message,
             delete_pinned=delete_pinned,
         )
-        to_delete.append(ctx.message)
+        deleted = await self.purge_messages(channel, messages, extra=(ctx.message,))
 
         reason = "{}({}) deleted {} messages containing '{}' in channel #{}.".format(
             author.name,
             author.id,
-            humanize_number(len(to_delete), override_locale="en_us"),
+            humanize_number(deleted, override_locale="en_us"),
             text,
             channel.id,
         )
         log.info(reason)
 
-        await mass_purge(to_delete, channel)
-        await self.send_optional_notification(len(to_delete), channel, subtract_invoking=True)
+        await self.send_optional_notification(deleted, channel, subtract_invoking=True)
 
     @cleanup.command()
     @commands.guild_only()
@@ -270,14 +377,14 @@ class Cleanup(commands.Cog):
             else:
                 return False
 
-        to_delete = await self.get_messages_for_deletion(
+        messages = self.iter_messages_for_deletion(
             channel=channel,
             number=number,
             check=check,
             before=ctx.message,
             delete_pinned=delete_pinned,
         )
-        to_delete.append(ctx.message)
+        deleted = await self.purge_messages(channel, messages, extra=(ctx.message,))
 
         reason = (
             "{}({}) deleted {} messages"
@@ -285,7 +392,7 @@ class Cleanup(commands.Cog):
             "".format(
                 author.name,
                 author.id,
-                humanize_number(len(to_delete), override_locale="en_US"),
+                humanize_number(deleted, override_locale="en_US"),
                 member or "???",
                 _id,
                 channel.name,
@@ -293,8 +400,7 @@ class Cleanup(commands.Cog):
         )
         log.info(reason)
 
-        await mass_purge(to_delete, channel)
-        await self.send_optional_notification(len(to_delete), channel, subtract_invoking=True)
+        await self.send_optional_notification(deleted, channel, subtract_invoking=True)
 
     @cleanup.command()
     @commands.guild_only()
@@ -334,20 +440,20 @@ class Cleanup(commands.Cog):
         if after is None:
             raise commands.BadArgument
 
-        to_delete = await self.get_messages_for_deletion(
+        messages = self.iter_messages_for_deletion(
             channel=channel, number=None, after=after, delete_pinned=delete_pinned
         )
+        deleted = await self.purge_messages(channel, messages)
 
         reason = "{}({}) deleted {} messages in channel #{}.".format(
             author.name,
             author.id,
-            humanize_number(len(to_delete), override_locale="en_US"),
+            humanize_number(deleted, override_locale="en_US"),
             channel.name,
         )
         log.info(reason)
 
-        await mass_purge(to_delete, channel)
-        await self.send_optional_notification(len(to_delete), channel)
+        await self.send_optional_notification(deleted, channel)
 
     @cleanup.command()
     @commands.guild_only()
@@ -389,21 +495,20 @@ class Cleanup(commands.Cog):
         if before is None:
             raise commands.BadArgument
 
-        to_delete = await self.get_messages_for_deletion(
+        messages = self.iter_messages_for_deletion(
             channel=channel, number=number, before=before, delete_pinned=delete_pinned
         )
-        to_delete.append(ctx.message)
+        deleted = await self.purge_messages(channel, messages, extra=(ctx.message,))
 
         reason = "{}({}) deleted {} messages in channel #{}.".format(
             author.name,
             author.id,
-            humanize_number(len(to_delete), override_locale="en_US"),
+            humanize_number(deleted, override_locale="en_US"),
             channel.name,
         )
         log.info(reason)
 
-        await mass_purge(to_delete, channel)
-        await self.send_optional_notification(len(to_delete), channel, subtract_invoking=True)
+        await self.send_optional_notification(deleted, channel, subtract_invoking=True)
 
     @cleanup.command()
     @commands.guild_only()
@@ -443,20 +548,19 @@ class Cleanup(commands.Cog):
             return await ctx.send(
                 _("Could not find a message with the ID of {id}.".format(id=two))
             )
-        to_delete = await self.get_messages_for_deletion(
+        messages = self.iter_messages_for_deletion(
             channel=channel, before=mtwo, after=mone, delete_pinned=delete_pinned
         )
-        to_delete.append(ctx.message)
+        deleted = await self.purge_messages(channel, messages, extra=(ctx.message,))
         reason = "{}({}) deleted {} messages in channel #{}.".format(
             author.name,
             author.id,
-            humanize_number(len(to_delete), override_locale="en_US"),
+            humanize_number(deleted, override_locale="en_US"),
             channel.name,
         )
         log.info(reason)
 
-        await mass_purge(to_delete, channel)
-        await self.send_optional_notification(len(to_delete), channel, subtract_invoking=True)
+        await self.send_optional_notification(deleted, channel, subtract_invoking=True)
 
     @cleanup.command()
     @commands.guild_only()
@@ -484,18 +588,17 @@ class Cleanup(commands.Cog):
             if not cont:
                 return
 
-        to_delete = await self.get_messages_for_deletion(
+        messages = self.iter_messages_for_deletion(
             channel=channel, number=number, before=ctx.message, delete_pinned=delete_pinned
         )
-        to_delete.append(ctx.message)
+        deleted = await self.purge_messages(channel, messages, extra=(ctx.message,))
 
         reason = "{}({}) deleted {} messages in channel #{}.".format(
-            author.name, author.id, len(to_delete), channel.name
+            author.name, author.id, deleted, channel.name
         )
         log.info(reason)
 
-        await mass_purge(to_delete, channel)
-        await self.send_optional_notification(len(to_delete), channel, subtract_invoking=True)
+        await self.send_optional_notification(deleted, channel, subtract_invoking=True)
 
     @cleanup.command(name="bot")
     @commands.guild_only()
@@ -560,14 +663,14 @@ class Cleanup(commands.Cog):
                 )
             return False
 
-        to_delete = await self.get_messages_for_deletion(
+        messages = self.iter_messages_for_deletion(
             channel=channel,
             number=number,
             check=check,
             before=ctx.message,
             delete_pinned=delete_pinned,
         )
-        to_delete.append(ctx.message)
+        deleted = await self.purge_messages(channel, messages, extra=(ctx.message,))
 
         reason = (
             "{}({}) deleted {}"
@@ -575,14 +678,13 @@ class Cleanup(commands.Cog):
             "".format(
                 author.name,
                 author.id,
-                humanize_number(len(to_delete), override_locale="en_US"),
+                humanize_number(deleted, override_locale="en_US"),
                 channel.name,
             )
         )
         log.info(reason)
 
-        await mass_purge(to_delete, channel)
-        await self.send_optional_notification(len(to_delete), channel, subtract_invoking=True)
+        await self.send_optional_notification(deleted, channel, subtract_invoking=True)
 
     @cleanup.command(name="self")
     @check_self_permissions()
@@ -690,24 +792,16 @@ class Cleanup(commands.Cog):
 
         - `<number>` The number of messages to check for duplicates. Must be a positive integer.
         """
-        msgs = []
-        spam = []
+        seen = set()
 
         def check(m):
             if m.attachments:
                 return False
-            c = (
-                m.author.id,
-                m.content,
-                [embed.to_dict() for embed in m.embeds],
-                [sticker.id for sticker in m.stickers],
-            )
-            if c in msgs:
-                spam.append(m)
+            fingerprint = self.message_fingerprint(m)
+            if fingerprint in seen:
                 return True
-            else:
-                msgs.append(c)
-                return False
+            seen.add(fingerprint)
+            return False
 
         to_delete = await self.get_messages_for_deletion(
             channel=ctx.channel, limit=number, check=check, before=ctx.message
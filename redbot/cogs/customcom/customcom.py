@@ -7,11 +7,11 @@ from typing import Iterable, List, Mapping, Tuple, Dict, Set, Literal, Union
 from urllib.parse import quote_plus
 
 import discord
-from fuzzywuzzy import process
 
 from redbot.core import Config, checks, commands
 from redbot.core.i18n import Translator, cog_i18n
 from redbot.core.utils import menus, AsyncIter
+from redbot.core.utils._internal_utils import FuzzyIndex
 from redbot.core.utils.chat_formatting import box, pagify, escape, humanize_list
 from redbot.core.utils.predicates import MessagePredicate
 
@@ -324,15 +324,11 @@ class CustomCommands(commands.Cog):
         - `<query>` The query to search for. Can be multiple words.
         """
         cc_commands = await CommandObj.get_commands(self.config.guild(ctx.guild))
-        extracted = process.extract(query, list(cc_commands.keys()))
-        accepted = []
-        for entry in extracted:
-            if entry[1] > 60:
-                # Match was decently strong
-                accepted.append((entry[0], cc_commands[entry[0]]))
-            else:
-                # Match wasn't strong enough
-                pass
+        # Only decently strong matches are accepted.
+        extracted = await FuzzyIndex.extract(
+            query, ((name, name) for name in cc_commands), score_cutoff=61
+        )
+        accepted = [(name, cc_commands[name]) for name, score in extracted]
         if len(accepted) == 0:
             return await ctx.send(_("No close matches were found."))
         results = self.prepare_command_list(ctx, accepted)
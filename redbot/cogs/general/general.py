@@ -474,11 +474,12 @@ class General(commands.Cog):
 
             headers = {"content-type": "application/json"}
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    data = await response.json()
+            response = await ctx.bot.http_client.get(
+                url, headers=headers, params=params, cache_ttl=300
+            )
+            data = response.json()
 
-        except aiohttp.ClientError:
+        except (aiohttp.ClientError, ValueError):
             await ctx.send(
                 _("No Urban Dictionary entries were found, or there was an error in the process.")
             )
@@ -1,14 +1,15 @@
 from random import shuffle
 from typing import Optional
 
-import aiohttp
-
 from redbot.core.i18n import Translator, cog_i18n
 from redbot.core import checks, Config, commands
 from redbot.core.commands import UserInputOptional
 
 _ = Translator("Image", __file__)
 
+# How long (in seconds) search results are reused for identical searches.
+CACHE_TTL = 300
+
 
 @cog_i18n(_)
 class Image(commands.Cog):
@@ -21,7 +22,6 @@ class Image(commands.Cog):
         self.bot = bot
         self.config = Config.get_conf(self, identifier=2652104208, force_registration=True)
         self.config.register_global(**self.default_global)
-        self.session = aiohttp.ClientSession()
         self.imgur_base_url = "https://api.imgur.com/3/"
 
     async def cog_load(self) -> None:
@@ -32,9 +32,6 @@ class Image(commands.Cog):
                 await self.bot.set_shared_api_tokens("imgur", client_id=imgur_token)
             await self.config.imgur_client_id.clear()
 
-    async def cog_unload(self):
-        await self.session.close()
-
     async def red_delete_data_for_user(self, **kwargs):
         """Nothing to delete"""
         return
@@ -68,8 +65,10 @@ class Image(commands.Cog):
             )
             return
         headers = {"Authorization": "Client-ID {}".format(imgur_client_id)}
-        async with self.session.get(url, headers=headers, params=params) as search_get:
-            data = await search_get.json()
+        search_get = await self.bot.http_client.get(
+            url, headers=headers, params=params, cache_ttl=CACHE_TTL
+        )
+        data = search_get.json()
 
         if data["success"]:
             results = data["data"]
@@ -134,8 +133,8 @@ class Image(commands.Cog):
         headers = {"Authorization": "Client-ID {}".format(imgur_client_id)}
         url = self.imgur_base_url + "gallery/r/{}/{}/{}/0".format(subreddit, sort, window)
 
-        async with self.session.get(url, headers=headers) as sub_get:
-            data = await sub_get.json()
+        sub_get = await self.bot.http_client.get(url, headers=headers, cache_ttl=CACHE_TTL)
+        data = sub_get.json()
 
         if data["success"]:
             items = data["data"]
@@ -191,15 +190,17 @@ class Image(commands.Cog):
             return
 
         url = "http://api.giphy.com/v1/gifs/search"
-        async with self.session.get(url, params={"api_key": giphy_api_key, "q": keywords}) as r:
-            result = await r.json()
-            if r.status == 200:
-                if result["data"]:
-                    await ctx.send(result["data"][0]["url"])
-                else:
-                    await ctx.send(_("No results found."))
+        r = await self.bot.http_client.get(
+            url, params={"api_key": giphy_api_key, "q": keywords}, cache_ttl=CACHE_TTL
+        )
+        result = r.json()
+        if r.status == 200:
+            if result["data"]:
+                await ctx.send(result["data"][0]["url"])
             else:
-                await ctx.send(_("Error contacting the Giphy API."))
+                await ctx.send(_("No results found."))
+        else:
+            await ctx.send(_("Error contacting the Giphy API."))
 
     @commands.guild_only()
     @commands.command(usage="<keywords...>")
@@ -218,15 +219,16 @@ class Image(commands.Cog):
             return
 
         url = "http://api.giphy.com/v1/gifs/random"
-        async with self.session.get(url, params={"api_key": giphy_api_key, "tag": keywords}) as r:
-            result = await r.json()
-            if r.status == 200:
-                if result["data"]:
-                    await ctx.send(result["data"]["url"])
-                else:
-                    await ctx.send(_("No results found."))
+        # Random results must not be cached.
+        r = await self.bot.http_client.get(url, params={"api_key": giphy_api_key, "tag": keywords})
+        result = r.json()
+        if r.status == 200:
+            if result["data"]:
+                await ctx.send(result["data"]["url"])
             else:
-                await ctx.send(_("Error contacting the API."))
+                await ctx.send(_("No results found."))
+        else:
+            await ctx.send(_("Error contacting the API."))
 
     @checks.is_owner()
     @commands.command()
@@ -1,6 +1,8 @@
 import asyncio
 import io
+import logging
 import textwrap
+import time
 from copy import copy
 from typing import Union, Optional, Dict, List, Tuple, Any, Iterator, ItemsView, Literal, cast
 
@@ -25,6 +27,8 @@ from .converters import (
 
 _ = Translator("Permissions", __file__)
 
+log = logging.getLogger("red.permissions")
+
 COG = "COG"
 COMMAND = "COMMAND"
 GLOBAL = 0
@@ -667,20 +671,52 @@ class Permissions(commands.Cog):
         if rules is None:
             rules = {}
         YAML_SCHEMA.validate(rules)
+        await self._set_acl(rules, guild_id=guild_id, update=update)
+
+    async def _set_acl(
+        self,
+        rules: Dict[str, Dict[Union[str, int], Dict[Union[str, int], bool]]],
+        guild_id: int,
+        update: bool,
+    ) -> None:
+        """Set rules from an already validated ACL.
+
+        Each category is written to config in a single transaction,
+        and rules are then loaded into cogs and commands in one pass.
+
+        Guild ID should be 0 for global rules.
+        """
+        start = time.perf_counter()
+        str_guild_id = str(guild_id)
+        to_load = []
         if update is False:
-            await self._clear_rules(guild_id)
+            self.bot.clear_permission_rules(guild_id, preserve_default_rule=False)
 
         for category, getter in ((COG, self.bot.get_cog), (COMMAND, self.bot.get_command)):
-            rules_dict = rules.get(category)
-            if not rules_dict:
+            rules_dict = rules.get(category) or {}
+            if update is True and not rules_dict:
                 continue
-            conf = self.config.custom(category)
-            for cmd_name, cmd_rules in rules_dict.items():
-                cmd_rules = {str(model_id): rule for model_id, rule in cmd_rules.items()}
-                await conf.set_raw(cmd_name, str(guild_id), value=cmd_rules)
-                cmd_obj = getter(str(cmd_name))
-                if cmd_obj is not None:
-                    self._load_rules_for(cmd_obj, {guild_id: cmd_rules})
+            async with self.config.custom(category).all() as all_rules:
+                if update is False:
+                    for cmd_rules in all_rules.values():
+                        cmd_rules.pop(str_guild_id, None)
+                for cmd_name, cmd_rules in rules_dict.items():
+                    cmd_name = str(cmd_name)
+                    cmd_rules = {str(model_id): rule for model_id, rule in cmd_rules.items()}
+                    all_rules.setdefault(cmd_name, {})[str_guild_id] = cmd_rules
+                    cmd_obj = getter(cmd_name)
+                    if cmd_obj is not None:
+                        to_load.append((cmd_obj, cmd_rules))
+
+        for cmd_obj, cmd_rules in to_load:
+            self._load_rules_for(cmd_obj, {guild_id: cmd_rules})
+
+        log.debug(
+            "Applied ACL with rules for %s cogs/commands (guild ID: %s) in %.3fs.",
+            sum(len(rules.get(category) or {}) for category in (COG, COMMAND)),
+            guild_id,
+            time.perf_counter() - start,
+        )
 
     async def _yaml_get_acl(self, guild_id: int) -> discord.File:
         """Get a YAML file for all rules set in a guild."""
@@ -801,6 +837,8 @@ class Permissions(commands.Cog):
 
     async def _load_all_rules(self):
         """Load all of this cog's rules into loaded commands and cogs."""
+        start = time.perf_counter()
+        loaded = 0
         for category, getter in ((COG, self.bot.get_cog), (COMMAND, self.bot.get_command)):
             all_rules = await self.config.custom(category).all()
             for name, rules in all_rules.items():
@@ -808,6 +846,10 @@ class Permissions(commands.Cog):
                 if obj is None:
                     continue
                 self._load_rules_for(obj, rules)
+                loaded += 1
+        log.debug(
+            "Loaded rules for %s cogs/commands in %.3fs.", loaded, time.perf_counter() - start
+        )
 
     @staticmethod
     def _load_rules_for(
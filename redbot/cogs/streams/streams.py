@@ -156,42 +156,39 @@ class Streams(commands.Cog):
             except KeyError:
                 if notified_owner_missing_twitch_secret is False:
                     asyncio.create_task(self._notify_owner_about_missing_twitch_secret())
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "https://id.twitch.tv/oauth2/token",
-                params={
-                    "client_id": tokens.get("client_id", ""),
-                    "client_secret": tokens.get("client_secret", ""),
-                    "grant_type": "client_credentials",
-                },
-            ) as req:
-                try:
-                    data = await req.json()
-                except aiohttp.ContentTypeError:
-                    data = {}
-
-                if req.status == 200:
-                    pass
-                elif req.status == 400 and data.get("message") == "invalid client":
-                    log.error(
-                        "Twitch API request failed authentication: set Client ID is invalid."
-                    )
-                elif req.status == 403 and data.get("message") == "invalid client secret":
-                    log.error(
-                        "Twitch API request failed authentication: set Client Secret is invalid."
-                    )
-                elif "message" in data:
-                    log.error(
-                        "Twitch OAuth2 API request failed with status code %s"
-                        " and error message: %s",
-                        req.status,
-                        data["message"],
-                    )
-                else:
-                    log.error("Twitch OAuth2 API request failed with status code %s", req.status)
+        async with self.bot.http_client.session.post(
+            "https://id.twitch.tv/oauth2/token",
+            params={
+                "client_id": tokens.get("client_id", ""),
+                "client_secret": tokens.get("client_secret", ""),
+                "grant_type": "client_credentials",
+            },
+        ) as req:
+            try:
+                data = await req.json()
+            except aiohttp.ContentTypeError:
+                data = {}
+
+            if req.status == 200:
+                pass
+            elif req.status == 400 and data.get("message") == "invalid client":
+                log.error("Twitch API request failed authentication: set Client ID is invalid.")
+            elif req.status == 403 and data.get("message") == "invalid client secret":
+                log.error(
+                    "Twitch API request failed authentication: set Client Secret is invalid."
+                )
+            elif "message" in data:
+                log.error(
+                    "Twitch OAuth2 API request failed with status code %s"
+                    " and error message: %s",
+                    req.status,
+                    data["message"],
+                )
+            else:
+                log.error("Twitch OAuth2 API request failed with status code %s", req.status)
 
-                if req.status != 200:
-                    return
+            if req.status != 200:
+                return
 
         self.ttv_bearer_cache = data
         self.ttv_bearer_cache["expires_at"] = datetime.now().timestamp() + data.get("expires_in")
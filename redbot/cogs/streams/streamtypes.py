@@ -128,11 +128,12 @@ class YoutubeStream(Stream):
         elif not self.name:
             self.name = await self.fetch_name()
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(YOUTUBE_CHANNEL_RSS.format(channel_id=self.id)) as r:
-                if r.status == 404:
-                    raise StreamNotFound()
-                rssdata = await r.text()
+        async with self._bot.http_client.session.get(
+            YOUTUBE_CHANNEL_RSS.format(channel_id=self.id)
+        ) as r:
+            if r.status == 404:
+                raise StreamNotFound()
+            rssdata = await r.text()
 
         # Reset the retry count since we successfully got information about this
         # channel's streams
@@ -154,47 +155,48 @@ class YoutubeStream(Stream):
                 "id": video_id,
                 "part": "id,liveStreamingDetails",
             }
-            async with aiohttp.ClientSession() as session:
-                async with session.get(YOUTUBE_VIDEOS_ENDPOINT, params=params) as r:
-                    data = await r.json()
-                    try:
-                        self._check_api_errors(data)
-                    except InvalidYoutubeCredentials:
-                        log.error("The YouTube API key is either invalid or has not been set.")
-                        break
-                    except YoutubeQuotaExceeded:
-                        log.error("YouTube quota has been exceeded.")
-                        break
-                    except APIError as e:
-                        log.error(
-                            "Something went wrong whilst trying to"
-                            " contact the stream service's API.\n"
-                            "Raw response data:\n%r",
-                            e,
-                        )
-                        continue
-                    video_data = data.get("items", [{}])[0]
-                    stream_data = video_data.get("liveStreamingDetails", {})
-                    log.debug(f"stream_data for {video_id}: {stream_data}")
-                    if (
-                        stream_data
-                        and stream_data != "None"
-                        and stream_data.get("actualEndTime", None) is None
-                    ):
-                        actual_start_time = stream_data.get("actualStartTime", None)
-                        scheduled = stream_data.get("scheduledStartTime", None)
-                        if scheduled is not None and actual_start_time is None:
-                            scheduled = parse_time(scheduled)
-                            if (scheduled - datetime.now(timezone.utc)).total_seconds() < -3600:
-                                continue
-                        elif actual_start_time is None:
+            async with self._bot.http_client.session.get(
+                YOUTUBE_VIDEOS_ENDPOINT, params=params
+            ) as r:
+                data = await r.json()
+                try:
+                    self._check_api_errors(data)
+                except InvalidYoutubeCredentials:
+                    log.error("The YouTube API key is either invalid or has not been set.")
+                    break
+                except YoutubeQuotaExceeded:
+                    log.error("YouTube quota has been exceeded.")
+                    break
+                except APIError as e:
+                    log.error(
+                        "Something went wrong whilst trying to"
+                        " contact the stream service's API.\n"
+                        "Raw response data:\n%r",
+                        e,
+                    )
+                    continue
+                video_data = data.get("items", [{}])[0]
+                stream_data = video_data.get("liveStreamingDetails", {})
+                log.debug(f"stream_data for {video_id}: {stream_data}")
+                if (
+                    stream_data
+                    and stream_data != "None"
+                    and stream_data.get("actualEndTime", None) is None
+                ):
+                    actual_start_time = stream_data.get("actualStartTime", None)
+                    scheduled = stream_data.get("scheduledStartTime", None)
+                    if scheduled is not None and actual_start_time is None:
+                        scheduled = parse_time(scheduled)
+                        if (scheduled - datetime.now(timezone.utc)).total_seconds() < -3600:
                             continue
-                        if video_id not in self.livestreams:
-                            self.livestreams.append(video_id)
-                    else:
-                        self.not_livestreams.append(video_id)
-                        if video_id in self.livestreams:
-                            self.livestreams.remove(video_id)
+                    elif actual_start_time is None:
+                        continue
+                    if video_id not in self.livestreams:
+                        self.livestreams.append(video_id)
+                else:
+                    self.not_livestreams.append(video_id)
+                    if video_id in self.livestreams:
+                        self.livestreams.remove(video_id)
         log.debug(f"livestreams for {self.name}: {self.livestreams}")
         log.debug(f"not_livestreams for {self.name}: {self.not_livestreams}")
         # This is technically redundant since we have the
@@ -206,9 +208,10 @@ class YoutubeStream(Stream):
                 "id": self.livestreams[-1],
                 "part": "snippet,liveStreamingDetails",
             }
-            async with aiohttp.ClientSession() as session:
-                async with session.get(YOUTUBE_VIDEOS_ENDPOINT, params=params) as r:
-                    data = await r.json()
+            async with self._bot.http_client.session.get(
+                YOUTUBE_VIDEOS_ENDPOINT, params=params
+            ) as r:
+                data = await r.json()
             return await self.make_embed(data)
         raise OfflineStream()
 
@@ -271,9 +274,10 @@ class YoutubeStream(Stream):
         else:
             params["id"] = self.id
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(YOUTUBE_CHANNELS_ENDPOINT, params=params) as r:
-                data = await r.json()
+        async with self._bot.http_client.session.get(
+            YOUTUBE_CHANNELS_ENDPOINT, params=params
+        ) as r:
+            data = await r.json()
 
         self._check_api_errors(data)
         if "items" in data and len(data["items"]) == 0:
@@ -350,30 +354,31 @@ class TwitchStream(Stream):
         if self._bearer is not None:
             header["Authorization"] = f"Bearer {self._bearer}"
         await self.wait_for_rate_limit_reset()
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=header, params=params, timeout=60) as resp:
-                    remaining = resp.headers.get("Ratelimit-Remaining")
-                    if remaining:
-                        self._rate_limit_remaining = int(remaining)
-                    reset = resp.headers.get("Ratelimit-Reset")
-                    if reset:
-                        self._rate_limit_resets.add(int(reset))
-
-                    if resp.status == 429:
-                        log.info(
-                            "Ratelimited. Trying again at %s.", datetime.fromtimestamp(int(reset))
-                        )
-                        resp.release()
-                        return await self.get_data(url)
-
-                    if resp.status != 200:
-                        return resp.status, {}
-
-                    return resp.status, await resp.json(encoding="utf-8")
-            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
-                log.warning("Connection error occurred when fetching Twitch stream", exc_info=exc)
-                return None, {}
+        try:
+            async with self._bot.http_client.session.get(
+                url, headers=header, params=params, timeout=60
+            ) as resp:
+                remaining = resp.headers.get("Ratelimit-Remaining")
+                if remaining:
+                    self._rate_limit_remaining = int(remaining)
+                reset = resp.headers.get("Ratelimit-Reset")
+                if reset:
+                    self._rate_limit_resets.add(int(reset))
+
+                if resp.status == 429:
+                    log.info(
+                        "Ratelimited. Trying again at %s.", datetime.fromtimestamp(int(reset))
+                    )
+                    resp.release()
+                    return await self.get_data(url)
+
+                if resp.status != 200:
+                    return resp.status, {}
+
+                return resp.status, await resp.json(encoding="utf-8")
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+            log.warning("Connection error occurred when fetching Twitch stream", exc_info=exc)
+            return None, {}
 
     async def is_online(self):
         user_profile_data = None
@@ -471,9 +476,8 @@ class PicartoStream(Stream):
     async def is_online(self):
         url = "https://api.picarto.tv/api/v1/channel/name/" + self.name
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as r:
-                data = await r.text(encoding="utf-8")
+        async with self._bot.http_client.session.get(url) as r:
+            data = await r.text(encoding="utf-8")
         if r.status == 200:
             data = json.loads(data)
             # Reset the retry count since we successfully got information about this
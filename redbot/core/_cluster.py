@@ -0,0 +1,243 @@
+"""
+Cluster mode: running a single bot as several processes, each owning a range of shards.
+
+The supervisor (``redbot <instance> --cluster-workers N``) starts a local message hub
+and N worker processes. Every worker is a regular Red process started with
+``--shard-ids``/``--shard-count`` and connects to the hub through `ClusterBus`,
+which relays the events published by one worker to all the other ones.
+"""
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import secrets
+import signal
+import sys
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set
+
+log = logging.getLogger("red.cluster")
+
+__all__ = ["ClusterBus", "run_cluster"]
+
+_ENV_ID = "RED_CLUSTER_ID"
+_ENV_ADDRESS = "RED_CLUSTER_ADDRESS"
+_ENV_TOKEN = "RED_CLUSTER_TOKEN"
+# The maximum size of an event, larger ones are skipped.
+_LINE_LIMIT = 2**24
+
+# Set while handling an event received from another worker,
+# so that handlers don't echo their own side effects back to the cluster.
+_handling_remote_event = contextvars.ContextVar("_handling_remote_event", default=False)
+
+
+class ClusterBus:
+    """The connection of a worker to the cluster's message hub.
+
+    Events are JSON-serializable payloads with a name. Listeners of an event are awaited
+    one after the other, in the order the events were received, so that e.g. a cog unload
+    followed by a load are applied in the same order on every worker.
+    """
+
+    def __init__(self, cluster_id: int, host: str, port: int, token: str):
+        self.cluster_id = cluster_id
+        self._host = host
+        self._port = port
+        self._token = token
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional["asyncio.Task[None]"] = None
+        self._listeners: Dict[str, List[Callable[[Any], Awaitable[None]]]] = {}
+
+    @classmethod
+    def from_env(cls) -> Optional["ClusterBus"]:
+        """Get the bus of this worker, or ``None`` when not running in cluster mode."""
+        cluster_id = os.environ.get(_ENV_ID)
+        if cluster_id is None:
+            return None
+        host, __, port = os.environ[_ENV_ADDRESS].rpartition(":")
+        return cls(int(cluster_id), host, int(port), os.environ[_ENV_TOKEN])
+
+    async def connect(self) -> None:
+        reader, self._writer = await asyncio.open_connection(
+            self._host, self._port, limit=_LINE_LIMIT
+        )
+        self._writer.write(self._token.encode() + b"\n")
+        await self._writer.drain()
+        self._reader_task = asyncio.create_task(self._read_events(reader))
+
+    async def close(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def add_listener(self, event: str, listener: Callable[[Any], Awaitable[None]]) -> None:
+        self._listeners.setdefault(event, []).append(listener)
+
+    def publish(self, event: str, data: Any = None) -> None:
+        """Send an event to every other worker.
+
+        Nothing is sent when called while handling an event from another worker.
+        """
+        if self._writer is None or _handling_remote_event.get():
+            return
+        payload = {"event": event, "data": data, "cluster_id": self.cluster_id}
+        self._writer.write(json.dumps(payload).encode() + b"\n")
+
+    async def _read_events(self, reader: asyncio.StreamReader) -> None:
+        _handling_remote_event.set(True)
+        while line := await _readline(reader):
+            try:
+                payload = json.loads(line)
+                listeners = self._listeners.get(payload["event"], ())
+            except (ValueError, KeyError):
+                log.warning("Received a malformed cluster event: %r", line)
+                continue
+            for listener in listeners:
+                try:
+                    await listener(payload["data"])
+                except Exception:
+                    log.exception(
+                        "Error in listener of the cluster event %r from cluster %s",
+                        payload["event"],
+                        payload.get("cluster_id"),
+                    )
+        log.critical("Lost the connection to the cluster's message hub.")
+
+
+async def _readline(reader: asyncio.StreamReader) -> bytes:
+    oversized = False
+    while True:
+        try:
+            try:
+                line = await reader.readuntil(b"\n")
+            except asyncio.LimitOverrunError as exc:
+                if not oversized:
+                    log.warning("Skipped a cluster event larger than %s bytes.", _LINE_LIMIT)
+                    oversized = True
+                await reader.readexactly(exc.consumed)
+                continue
+        except asyncio.IncompleteReadError as exc:
+            return b"" if oversized else exc.partial
+        except ConnectionError:
+            return b""
+        if not oversized:
+            return line
+        # This was the end of the skipped event.
+        oversized = False
+
+
+class _ClusterHub:
+    """Relays the events of every worker to all the other workers."""
+
+    def __init__(self, token: str):
+        self._token = token
+        self._writers: Set[asyncio.StreamWriter] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0, limit=_LINE_LIMIT)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"{host}:{port}"
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for writer in self._writers:
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        token = (await _readline(reader)).rstrip(b"\n").decode(errors="replace")
+        if not secrets.compare_digest(token, self._token):
+            writer.close()
+            return
+        self._writers.add(writer)
+        try:
+            while line := await _readline(reader):
+                for other in self._writers:
+                    if other is not writer:
+                        other.write(line)
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+
+def _shard_ranges(shard_count: int, workers: int) -> List[List[int]]:
+    per_worker, remainder = divmod(shard_count, workers)
+    ranges = []
+    start = 0
+    for i in range(workers):
+        end = start + per_worker + (i < remainder)
+        ranges.append(list(range(start, end)))
+        start = end
+    return ranges
+
+
+def _strip_cluster_args(argv: Sequence[str]) -> List[str]:
+    stripped = []
+    args = iter(argv)
+    for arg in args:
+        if arg in ("--cluster-workers", "--shard-count"):
+            next(args, None)
+        elif not arg.startswith(("--cluster-workers=", "--shard-count=")):
+            stripped.append(arg)
+    return stripped
+
+
+async def _run_cluster(cli_flags, argv: Sequence[str]) -> int:
+    workers = cli_flags.cluster_workers
+    shard_count = cli_flags.shard_count or workers
+    token = secrets.token_hex(32)
+    hub = _ClusterHub(token)
+    address = await hub.start()
+    base_args = [sys.executable, "-m", "redbot", *_strip_cluster_args(argv)]
+
+    processes = []
+    for cluster_id, shard_ids in enumerate(_shard_ranges(shard_count, workers)):
+        args = [
+            *base_args,
+            "--shard-count",
+            str(shard_count),
+            "--shard-ids",
+            *map(str, shard_ids),
+        ]
+        if cli_flags.rpc:
+            args += ["--rpc-port", str(cli_flags.rpc_port + cluster_id)]
+        env = {**os.environ, _ENV_ID: str(cluster_id), _ENV_ADDRESS: address, _ENV_TOKEN: token}
+        log.info("Starting cluster %s with shards %s", cluster_id, shard_ids)
+        processes.append(await asyncio.create_subprocess_exec(*args, env=env))
+
+    def terminate(*args):
+        for process in processes:
+            if process.returncode is None:
+                process.terminate()
+
+    if os.name != "nt":
+        for s in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+            asyncio.get_running_loop().add_signal_handler(s, terminate)
+
+    # The cluster lives and dies as a whole: once a worker exits
+    # (e.g. because of `[p]shutdown` or `[p]restart`), the other ones are stopped too
+    # and the supervisor exits with the same code, for the process manager to act on it.
+    waits = [asyncio.create_task(process.wait()) for process in processes]
+    done, __ = await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+    exit_code = next(iter(done)).result()
+    terminate()
+    await asyncio.gather(*waits)
+    await hub.close()
+    return exit_code
+
+
+def run_cluster(cli_flags, argv: Sequence[str]) -> int:
+    """Run the given instance as a cluster of worker processes.
+
+    Returns
+    -------
+    int
+        The exit code of the first worker which exited.
+
+    """
+    return asyncio.run(_run_cluster(cli_flags, argv))
@@ -0,0 +1,216 @@
+"""
+Opt-in instrumentation of the bot's hot paths.
+
+While enabled (with ``[p]perf enable``), the bot records timings of its event listeners,
+``process_commands`` and every invoked command, counts dispatched events and Config
+operations, and samples the event loop's lag. While disabled, the instrumented code paths
+only pay for checking `PerfMonitor.enabled`.
+"""
+import asyncio
+import bisect
+import time
+import types
+from collections import Counter
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, Tuple
+
+__all__ = ["PerfMonitor", "TimingStats", "perf"]
+
+#: The upper bounds (in seconds) of the histogram buckets, the last bucket is unbounded.
+BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+LOOP_LAG_INTERVAL = 0.5
+
+
+class TimingStats:
+    """Latency histogram of a listener, command or other timed code.
+
+    Attributes
+    ----------
+    count : int
+        The number of recorded calls.
+    total : float
+        The total time (in seconds) the calls took.
+    max : float
+        The longest call (in seconds).
+    busy_total : float
+        The total time (in seconds) the calls spent running, as opposed to
+        awaiting, i.e. the time they blocked the event loop.
+    busy_max : float
+        The longest time (in seconds) a single call blocked the event loop.
+    buckets : List[int]
+        The call counts per bucket of `BUCKETS`.
+
+    """
+
+    __slots__ = ("count", "total", "max", "busy_total", "busy_max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.busy_total = 0.0
+        self.busy_max = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def record(self, elapsed: float, busy: float = 0.0) -> None:
+        self.count += 1
+        self.total += elapsed
+        self.busy_total += busy
+        if elapsed > self.max:
+            self.max = elapsed
+        if busy > self.busy_max:
+            self.busy_max = busy
+        self.buckets[bisect.bisect_left(BUCKETS, elapsed)] += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Get an upper bound of the given percentile (from 0 to 100) of the call times."""
+        threshold = self.count * q / 100
+        seen = 0
+        for bound, count in zip(BUCKETS, self.buckets):
+            seen += count
+            if seen >= threshold:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "busy_total": self.busy_total,
+            "busy_max": self.busy_max,
+            "buckets": dict(zip(map(str, (*BUCKETS, "inf")), self.buckets)),
+        }
+
+
+@types.coroutine
+def _measure_busy(coro: Coroutine[Any, Any, Any], busy: List[float]):
+    # Drives the coroutine the way the task running it would,
+    # timing every step between two suspensions.
+    value: Any = None
+    exc: Optional[BaseException] = None
+    while True:
+        start = time.perf_counter()
+        try:
+            if exc is not None:
+                yielded = coro.throw(exc)
+            else:
+                yielded = coro.send(value)
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            busy[0] += time.perf_counter() - start
+        value, exc = None, None
+        try:
+            value = yield yielded
+        except BaseException as e:
+            exc = e
+
+
+class PerfMonitor:
+    """Collects the bot's performance metrics.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether metrics are being collected.
+    listeners : Dict[str, TimingStats]
+        Timings of event listeners, by qualified name.
+    commands : Dict[str, TimingStats]
+        Timings of invoked commands, by qualified name.
+    process_commands : TimingStats
+        Timings of `Red.process_commands`, for every message.
+    events : collections.Counter
+        Dispatched events, by name.
+    config_ops : collections.Counter
+        Config reads and writes, by operation (``get``, ``set`` and ``clear``).
+    loop_lag : TimingStats
+        How late the event loop was to run a callback, sampled twice per second.
+
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lag_task: Optional["asyncio.Task[None]"] = None
+        self._started_at = 0.0
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all collected metrics."""
+        self.listeners: Dict[str, TimingStats] = {}
+        self.commands: Dict[str, TimingStats] = {}
+        self.process_commands = TimingStats()
+        self.events: Counter = Counter()
+        self.config_ops: Counter = Counter()
+        self.loop_lag = TimingStats()
+        self._started_at = time.monotonic()
+
+    def enable(self) -> None:
+        """Start collecting metrics. This needs a running event loop."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.reset()
+        self._lag_task = asyncio.create_task(self._sample_loop_lag())
+
+    def disable(self) -> None:
+        """Stop collecting metrics. The metrics collected so far are kept."""
+        self.enabled = False
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            self._lag_task = None
+
+    @property
+    def duration(self) -> float:
+        """float: How long (in seconds) metrics have been collected for."""
+        return time.monotonic() - self._started_at
+
+    async def _sample_loop_lag(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(LOOP_LAG_INTERVAL)
+            self.loop_lag.record(max(time.perf_counter() - start - LOOP_LAG_INTERVAL, 0.0))
+
+    async def timed(
+        self, stats: Dict[str, TimingStats], name: str, coro: Coroutine[Any, Any, Any]
+    ) -> Any:
+        """Await the coroutine, recording its timings under the given name."""
+        try:
+            entry = stats[name]
+        except KeyError:
+            entry = stats[name] = TimingStats()
+        busy = [0.0]
+        start = time.perf_counter()
+        try:
+            return await _measure_busy(coro, busy)
+        finally:
+            entry.record(time.perf_counter() - start, busy[0])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "duration": self.duration,
+            "listeners": {name: stats.to_dict() for name, stats in self.listeners.items()},
+            "commands": {name: stats.to_dict() for name, stats in self.commands.items()},
+            "process_commands": self.process_commands.to_dict(),
+            "events": dict(self.events),
+            "config_ops": dict(self.config_ops),
+            "loop_lag": self.loop_lag.to_dict(),
+        }
+
+
+def listener_name(listener: Callable[..., Awaitable[Any]]) -> str:
+    """Get a readable name of an event listener, e.g. ``Audio.on_message``."""
+    owner = getattr(listener, "__self__", None)
+    if owner is not None:
+        return f"{type(owner).__name__}.{listener.__name__}"
+    return getattr(listener, "__qualname__", repr(listener))
+
+
+perf = PerfMonitor()
@@ -6,6 +6,7 @@ import platform
 import shutil
 import sys
 import contextlib
+import time
 import weakref
 import functools
 from collections import namedtuple, OrderedDict
@@ -37,12 +38,16 @@ from discord.ext import commands as dpy_commands
 from discord.ext.commands import when_mentioned_or
 
 from . import Config, i18n, commands, errors, drivers, modlog, bank
+from ._cluster import ClusterBus
+from ._perf import listener_name, perf
 from .cog_manager import CogManager, CogManagerUI
+from .config import ConfigChange
 from .core_commands import Core
 from .data_manager import cog_data_path
 from .dev_commands import Dev
 from .events import init_events
 from .global_checks import init_global_checks
+from .http_client import HTTPClient
 from .settings_caches import (
     PrefixManager,
     IgnoreManager,
@@ -52,7 +57,7 @@ from .settings_caches import (
 )
 from .rpc import RPCMixin
 from .utils import can_user_send_messages_in, common_filters, AsyncIter
-from .utils._internal_utils import send_to_owners_with_prefix_replaced
+from .utils._internal_utils import FuzzyIndex, send_to_owners_with_prefix_replaced
 
 CUSTOM_GROUPS = "CUSTOM_GROUPS"
 COMMAND_SCOPE = "COMMAND"
@@ -92,6 +97,8 @@ class Red(
         self._shutdown_mode = ExitCodes.CRITICAL
         self._cli_flags = cli_flags
         self._config = Config.get_core_conf(force_registration=False)
+        # Core settings are read on every message and only ever written through this Config.
+        self._config.enable_cache()
         self.rpc_enabled = cli_flags.rpc
         self.rpc_port = cli_flags.rpc_port
         self._last_exception = None
@@ -208,6 +215,10 @@ class Red(
         if "allowed_mentions" not in kwargs:
             kwargs["allowed_mentions"] = discord.AllowedMentions(everyone=False, roles=False)
 
+        if cli_flags.shard_count is not None and "shard_count" not in kwargs:
+            kwargs["shard_count"] = cli_flags.shard_count
+            kwargs["shard_ids"] = cli_flags.shard_ids
+
         message_cache_size = cli_flags.message_cache_size
         if cli_flags.no_message_cache:
             message_cache_size = None
@@ -226,6 +237,10 @@ class Red(
         # Do not manually use the help formatter attribute here, see `send_help_for`,
         # for a documented API. The internals of this object are still subject to change.
         self._help_formatter = commands.help.RedHelpFormatter()
+        self._help_cache = commands.help._HelpCache()
+        self._command_fuzzy_index: Optional[FuzzyIndex[commands.Command]] = None
+        self._http_client = HTTPClient()
+        self._cluster: Optional[ClusterBus] = None
         self.add_command(commands.help.red_help)
 
         self._permissions_hooks: List[commands.CheckPredicate] = []
@@ -487,6 +502,15 @@ class Red(
     def cog_mgr(self) -> NoReturn:
         raise AttributeError("Please don't mess with the cog manager internals.")
 
+    @property
+    def http_client(self) -> HTTPClient:
+        """HTTPClient: The bot-wide HTTP client.
+
+        Cogs should use this rather than creating their own
+        :class:`aiohttp.ClientSession`.
+        """
+        return self._http_client
+
     @property
     def uptime(self) -> datetime:
         """Allow access to the value, but we don't want cog creators setting it"""
@@ -728,7 +752,6 @@ class Red(
             `True` if user is allowed to run things, `False` otherwise
         """
         # Contributor Note:
-        # All config calls are delayed until needed in this section
         # All changes should be made keeping in mind that this is also used as a global check
 
         mocked = False  # used for an accurate delayed role id expansion later.
@@ -740,42 +763,49 @@ class Red(
         else:
             guild = getattr(who, "guild", None)
 
+        # The lists are compiled per guild and cached, so that the common case
+        # (lists cached, or all of them empty) doesn't await anything else.
+        guild_id = guild.id if guild else None
+        access_lists = self._whiteblacklist_cache.get_cached_access_lists(guild_id)
+        if access_lists is None:
+            access_lists = await self._whiteblacklist_cache.get_access_lists(guild_id)
+        if access_lists.unrestricted:
+            return True
+
         if await self.is_owner(who):
             return True
 
-        global_whitelist = await self.get_whitelist()
-        if global_whitelist:
-            if who.id not in global_whitelist:
+        if access_lists.global_whitelist:
+            if who.id not in access_lists.global_whitelist:
                 return False
-        else:
+        elif who.id in access_lists.global_blacklist:
             # blacklist is only used when whitelist doesn't exist.
-            global_blacklist = await self.get_blacklist()
-            if who.id in global_blacklist:
-                return False
+            return False
 
         if guild:
             if guild.owner_id == who.id:
                 return True
 
-            # The delayed expansion of ids to check saves time in the DM case.
-            # Converting to a set reduces the total lookup time in section
+            # The guild lists don't contain the guild's ID (the default role),
+            # so the role IDs can be checked as they are, without building a set.
             if mocked:
-                ids = {i for i in (who.id, *(role_ids or [])) if i != guild.id}
+                role_ids = role_ids or ()
             else:
                 # DEP-WARN
                 # This uses member._roles (getattr is for the user case)
                 # If this is removed upstream (undocumented)
                 # there is a silent failure potential, and role blacklist/whitelists will break.
-                ids = {i for i in (who.id, *(getattr(who, "_roles", []))) if i != guild.id}
+                role_ids = getattr(who, "_roles", ())
 
-            guild_whitelist = await self.get_whitelist(guild)
-            if guild_whitelist:
-                if ids.isdisjoint(guild_whitelist):
-                    return False
-            else:
-                guild_blacklist = await self.get_blacklist(guild)
-                if not ids.isdisjoint(guild_blacklist):
+            if access_lists.guild_whitelist is not None:
+                if who.id not in access_lists.guild_whitelist and (
+                    access_lists.guild_whitelist.isdisjoint(role_ids)
+                ):
                     return False
+            elif who.id in access_lists.guild_blacklist or not (
+                access_lists.guild_blacklist.isdisjoint(role_ids)
+            ):
+                return False
 
         return True
 
@@ -1547,6 +1577,26 @@ class Red(
     async def get_context(self, message, /, *, cls=commands.Context):
         return await super().get_context(message, cls=cls)
 
+    def dispatch(self, event_name: str, /, *args, **kwargs) -> None:
+        if perf.enabled:
+            perf.events[event_name] += 1
+        super().dispatch(event_name, *args, **kwargs)
+
+    async def _run_event(self, coro, event_name: str, *args, **kwargs) -> None:
+        # DEP-WARN: This is called by discord.py for every listener of every dispatched event.
+        if not perf.enabled:
+            return await super()._run_event(coro, event_name, *args, **kwargs)
+        await perf.timed(
+            perf.listeners,
+            listener_name(coro),
+            super()._run_event(coro, event_name, *args, **kwargs),
+        )
+
+    async def invoke(self, ctx: commands.Context, /) -> None:
+        if not perf.enabled or ctx.command is None:
+            return await super().invoke(ctx)
+        await perf.timed(perf.commands, ctx.command.qualified_name, super().invoke(ctx))
+
     async def process_commands(self, message: discord.Message, /):
         """
         Same as base method, but dispatches an additional event for cogs
@@ -1554,6 +1604,15 @@ class Red(
         messages,  without the overhead of additional get_context calls
         per cog.
         """
+        if perf.enabled:
+            start = time.perf_counter()
+            try:
+                return await self._process_commands(message)
+            finally:
+                perf.process_commands.record(time.perf_counter() - start)
+        await self._process_commands(message)
+
+    async def _process_commands(self, message: discord.Message, /):
         if not message.author.bot:
             ctx = await self.get_context(message)
             if ctx.invoked_with and isinstance(message.channel, discord.PartialMessageable):
@@ -1632,6 +1691,8 @@ class Red(
         await super().remove_cog(cogname, guild=guild, guilds=guilds)
 
         cog.requires.reset()
+        self._help_cache.invalidate()
+        self._command_fuzzy_index = None
 
         for meth in self.rpc_handlers.pop(cogname.upper(), ()):
             self.unregister_rpc_handler(meth)
@@ -1757,6 +1818,8 @@ class Red(
                     added_hooks.append(hook)
 
             await super().add_cog(cog, guild=guild, guilds=guilds)
+            self._help_cache.invalidate()
+            self._command_fuzzy_index = None
             self.dispatch("cog_add", cog)
             if "permissions" not in self.extensions:
                 cog.requires.ready_event.set()
@@ -1778,6 +1841,8 @@ class Red(
             raise RuntimeError("Commands must be instances of `redbot.core.commands.Command`")
 
         super().add_command(command)
+        self._help_cache.invalidate()
+        self._command_fuzzy_index = None
 
         permissions_not_loaded = "permissions" not in self.extensions
         self.dispatch("command_add", command)
@@ -1793,6 +1858,8 @@ class Red(
         command = super().remove_command(name)
         if command is None:
             return None
+        self._help_cache.invalidate()
+        self._command_fuzzy_index = None
         command.requires.reset()
         if isinstance(command, commands.Group):
             for subcommand in command.walk_commands():
@@ -1904,7 +1971,8 @@ class Red(
             channel = self.get_channel(channel_id)
             if channel:
                 destinations.append(channel)
-            else:
+            elif self._cluster is None:
+                # In cluster mode, the channel may belong to another worker's guild.
                 log.warning(
                     "Channel with ID %s is not available,"
                     " ignoring owner notification destination.",
@@ -1935,8 +2003,82 @@ class Red(
                 )
 
         sends = [wrapped_send(d, content, **kwargs) for d in destinations]
+        if self._cluster is not None:
+            embed = kwargs.get("embed")
+            if kwargs.keys() <= {"embed"}:
+                self._cluster.publish(
+                    "send_to_owners",
+                    {"content": content, "embed": embed and embed.to_dict()},
+                )
+            else:
+                log.debug(
+                    "Owner notification with %s can't be sent to other clusters.", list(kwargs)
+                )
         await asyncio.gather(*sends)
 
+    async def _connect_cluster(self, cluster: ClusterBus) -> None:
+        """Connect this worker to the rest of the cluster."""
+        self._cluster = cluster
+        self._config.add_change_listener(
+            lambda change: cluster.publish(
+                "core_config_change",
+                {
+                    "category": change.category,
+                    "primary_key": change.primary_key,
+                    "identifiers": change.identifiers,
+                },
+            )
+        )
+        cluster.add_listener("core_config_change", self._on_cluster_config_change)
+        cluster.add_listener("send_to_owners", self._on_cluster_send_to_owners)
+        cluster.add_listener("load_packages", self._on_cluster_load_packages)
+        cluster.add_listener("unload_packages", self._on_cluster_unload_packages)
+        await cluster.connect()
+
+    async def _on_cluster_config_change(self, data: Dict[str, Any]) -> None:
+        # Replay the change locally, for caches to drop what another worker changed.
+        change = ConfigChange(
+            self._config,
+            data["category"],
+            tuple(data["primary_key"]),
+            tuple(data["identifiers"]),
+        )
+        if self._config.cache is not None:
+            self._config.cache._invalidate_key(
+                tuple(filter(None, (change.category, *change.primary_key, *change.identifiers)))
+            )
+        self._config._dispatch_change(change)
+
+    async def _on_cluster_send_to_owners(self, data: Dict[str, Any]) -> None:
+        async def send():
+            await self.wait_until_red_ready()
+            embed = data["embed"] and discord.Embed.from_dict(data["embed"])
+            for channel_id in await self._config.extra_owner_destinations():
+                channel = self.get_channel(channel_id)
+                if channel is None:
+                    continue
+                try:
+                    await channel.send(data["content"], embed=embed)
+                except Exception as _exc:
+                    log.error(
+                        "I could not send an owner notification to %s (%s)",
+                        channel,
+                        channel.id,
+                        exc_info=_exc,
+                    )
+
+        # Don't hold up the following cluster events until this worker is ready.
+        asyncio.create_task(send())
+
+    async def _on_cluster_load_packages(self, pkg_names: List[str]) -> None:
+        # Before that, the packages are loaded from Config by the startup.
+        if self._red_ready.is_set():
+            await self.get_cog("Core")._load(pkg_names)
+
+    async def _on_cluster_unload_packages(self, pkg_names: List[str]) -> None:
+        if self._red_ready.is_set():
+            await self.get_cog("Core")._unload(pkg_names)
+
     async def wait_until_red_ready(self):
         """Wait until our post connection startup is done."""
         await self._red_ready.wait()
@@ -1966,6 +2108,9 @@ class Red(
     async def close(self):
         """Logs out of Discord and closes all connections."""
         await super().close()
+        if self._cluster is not None:
+            await self._cluster.close()
+        await self._http_client.close()
         await drivers.get_driver_class().teardown()
         try:
             if self.rpc_enabled:
@@ -95,6 +95,13 @@ def non_negative_int(arg: str) -> int:
     return x
 
 
+def positive_int(arg: str) -> int:
+    x = non_negative_int(arg)
+    if x < 1:
+        raise argparse.ArgumentTypeError("The argument has to be a positive integer.")
+    return x
+
+
 def message_cache_size_int(arg: str) -> int:
     x = non_negative_int(arg)
     if x < 1000:
@@ -295,6 +302,32 @@ def parse_cli_flags(args):
         help="Enable showing local variables in tracebacks generated by Rich.\n"
         "Useful for development.",
     )
+    parser.add_argument(
+        "--json-logs",
+        action="store_true",
+        help="Write the log files as JSON lines instead of plain text.",
+    )
+    parser.add_argument(
+        "--shard-count",
+        type=positive_int,
+        default=None,
+        help="The total number of shards of the bot. Defaults to the number recommended"
+        " by Discord or, in cluster mode, to the number of workers.",
+    )
+    parser.add_argument(
+        "--shard-ids",
+        type=non_negative_int,
+        nargs="+",
+        default=None,
+        help="The IDs of the shards run by this process. Requires --shard-count.",
+    )
+    parser.add_argument(
+        "--cluster-workers",
+        type=positive_int,
+        default=None,
+        help="Run the bot as this many worker processes, each running a part of the shards."
+        " Requires a storage backend which can be shared between processes (PostgreSQL).",
+    )
 
     args = parser.parse_args(args)
 
@@ -304,4 +337,17 @@ def parse_cli_flags(args):
         args.prefix = []
     args.logging_level = cli_level_to_log_level(args.logging_level)
 
+    if args.shard_ids is not None and args.shard_count is None:
+        parser.error("--shard-ids requires --shard-count")
+    if args.shard_ids is not None and args.cluster_workers is not None:
+        parser.error("--shard-ids can't be used with --cluster-workers")
+    if args.shard_ids is not None and max(args.shard_ids) >= args.shard_count:
+        parser.error("shard IDs must be lower than --shard-count")
+    if (
+        args.cluster_workers is not None
+        and args.shard_count is not None
+        and args.shard_count < args.cluster_workers
+    ):
+        parser.error("--shard-count can't be lower than --cluster-workers")
+
     return args
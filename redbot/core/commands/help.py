@@ -29,15 +29,19 @@
 
 import abc
 import asyncio
-from collections import namedtuple
+import copy
+import itertools
+import time
+from collections import namedtuple, OrderedDict
 from dataclasses import dataclass, asdict as dc_asdict
-from typing import Union, List, AsyncIterator, Iterable, cast
+from typing import Any, Hashable, Optional, Union, List, AsyncIterator, Iterable, cast
 
 import discord
 from discord.ext import commands as dpy_commands
 
 from . import commands
 from .context import Context
+from .requires import PrivilegeLevel, Requires
 from ..i18n import Translator
 from ..utils import can_user_react_in, menus
 from ..utils.mod import mass_purge
@@ -64,6 +68,10 @@ SupportsCanSee = Union[commands.Command, commands.Group, dpy_commands.bot.BotBas
 EmbedField = namedtuple("EmbedField", "name value inline")
 EMPTY_STRING = "\N{ZERO WIDTH SPACE}"
 
+# Upper bound on the number of `can_see` / `can_run` checks awaited at once
+# while filtering commands for help.
+HELP_FILTER_CONCURRENCY = 32
+
 
 @dataclass(frozen=True)
 class HelpSettings:
@@ -145,6 +153,44 @@ class HelpSettings:
         ).format_map(data)
 
 
+class _HelpCache:
+    """
+    A small LRU cache for the results of filtering commands for help.
+
+    Keys are built by the formatter and include everything a result depends on
+    which doesn't have an explicit invalidation point (help settings, the viewer,
+    their privilege level and the permission rule revision).
+    Loading or unloading cogs and commands, as well as enabling or disabling them,
+    clears the cache entirely. Entries additionally expire after ``ttl`` seconds,
+    as third party checks may depend on state we know nothing about.
+    """
+
+    def __init__(self, *, max_size: int = 256, ttl: float = 120.0):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        try:
+            expires_at, value = self._entries[key]
+        except KeyError:
+            return None
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        self._entries.clear()
+
+
 class NoCommand(Exception):
     pass
 
@@ -272,13 +318,42 @@ class RedHelpFormatter(HelpFormatterABC):
         }
 
     async def get_bot_help_mapping(self, ctx, help_settings: HelpSettings):
+        cache: Optional[_HelpCache] = getattr(ctx.bot, "_help_cache", None)
+        if cache is not None:
+            cache_key = await self._get_help_cache_key(ctx, help_settings)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         sorted_iterable = []
         for cogname, cog in (*sorted(ctx.bot.cogs.items()), (None, None)):
             cm = await self.get_cog_help_mapping(ctx, cog, help_settings=help_settings)
             if cm:
                 sorted_iterable.append((cogname, cm))
+
+        if cache is not None:
+            cache.set(cache_key, sorted_iterable)
         return sorted_iterable
 
+    @staticmethod
+    async def _get_help_cache_key(ctx: Context, help_settings: HelpSettings) -> tuple:
+        """
+        Builds the cache key for the help mapping visible in this context.
+        """
+        author = ctx.author
+        voice = getattr(author, "voice", None)
+        return (
+            ctx.guild.id if ctx.guild is not None else None,
+            ctx.channel.id,
+            voice.channel.id if voice is not None and voice.channel is not None else None,
+            author.id,
+            frozenset(getattr(author, "_roles", ())),
+            await PrivilegeLevel.from_ctx(ctx),
+            Requires._rules_revision,
+            frozenset(ctx.bot.cogs),
+            help_settings,
+        )
+
     @staticmethod
     def get_default_tagline(ctx: Context):
         return _(
@@ -694,23 +769,31 @@ class RedHelpFormatter(HelpFormatterABC):
         verify_checks = help_settings.verify_checks
 
         # TODO: Settings for this in core bot db
-        for obj in objects:
-            if verify_checks and not show_hidden:
-                # Default Red behavior, can_see includes a can_run check.
-                if await obj.can_see(ctx) and getattr(obj, "enabled", True):
-                    yield obj
-            elif verify_checks:
-                try:
-                    can_run = await obj.can_run(ctx)
-                except discord.DiscordException:
-                    can_run = False
-                if can_run and getattr(obj, "enabled", True):
+        if not verify_checks:
+            for obj in objects:
+                if show_hidden or not getattr(obj, "hidden", False):  # Cog compatibility
                     yield obj
-            elif not show_hidden:
-                if not getattr(obj, "hidden", False):  # Cog compatibility
+            return
+
+        async def is_visible(obj: SupportsCanSee) -> bool:
+            # Checks temporarily modify the context they are given,
+            # so each concurrently running check needs its own copy.
+            obj_ctx = copy.copy(ctx)
+            if not show_hidden:
+                # Default Red behavior, can_see includes a can_run check.
+                return await obj.can_see(obj_ctx) and getattr(obj, "enabled", True)
+            try:
+                can_run = await obj.can_run(obj_ctx)
+            except discord.DiscordException:
+                can_run = False
+            return can_run and getattr(obj, "enabled", True)
+
+        iterator = iter(objects)
+        while batch := list(itertools.islice(iterator, HELP_FILTER_CONCURRENCY)):
+            results = await asyncio.gather(*map(is_visible, batch))
+            for obj, visible in zip(batch, results):
+                if visible:
                     yield obj
-            else:
-                yield obj
 
     async def embed_requested(self, ctx: Context) -> bool:
         return await ctx.bot.embed_requested(channel=ctx, command=red_help)
@@ -20,6 +20,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Set,
     Tuple,
     TypeVar,
     Union,
@@ -330,6 +331,10 @@ class Requires:
     global rules.
     """
 
+    # Incremented whenever rules of any Requires object change,
+    # so that caches depending on rules (e.g. help) can detect stale entries.
+    _rules_revision: ClassVar[int] = 0
+
     def __init__(
         self,
         privilege_level: Optional[PrivilegeLevel],
@@ -356,6 +361,12 @@ class Requires:
             self.bot_perms = bot_perms
         self._global_rules: _RulesDict = _RulesDict()
         self._guild_rules: _IntKeyDict[_RulesDict] = _IntKeyDict[_RulesDict]()
+        # Compiled rule tables: IDs of the models with a rule set in each scope,
+        # excluding the default rule. These are kept in sync by `set_rule`,
+        # `clear_all_rules` and `reset`, and let `_get_rule_from_ctx` resolve rules
+        # with a set intersection rather than walking every model in the context.
+        self._global_rule_ids: Set[int] = set()
+        self._guild_rule_ids: Dict[int, Set[int]] = {}
 
     @staticmethod
     def get_decorator(
@@ -440,6 +451,13 @@ class Requires:
             rules.pop(model_id, None)
         else:
             rules[model_id] = rule
+        if model_id != self.DEFAULT:
+            rule_ids = self._get_rule_ids(guild_id)
+            if rule is PermState.NORMAL:
+                rule_ids.discard(model_id)
+            else:
+                rule_ids.add(model_id)
+        Requires._rules_revision += 1
 
     def clear_all_rules(self, guild_id: int, *, preserve_default_rule: bool = True) -> None:
         """Clear all rules of a particular scope.
@@ -466,6 +484,13 @@ class Requires:
         rules.clear()
         if default is not None and preserve_default_rule:
             rules[self.DEFAULT] = default
+        self._get_rule_ids(guild_id).clear()
+        Requires._rules_revision += 1
+
+    def _get_rule_ids(self, guild_id: int) -> Set[int]:
+        if guild_id:
+            return self._guild_rule_ids.setdefault(guild_id, set())
+        return self._global_rule_ids
 
     def reset(self) -> None:
         """Reset this Requires object to its original state.
@@ -475,7 +500,10 @@ class Requires:
         """
         self._guild_rules.clear()  # pylint: disable=no-member
         self._global_rules.clear()  # pylint: disable=no-member
+        self._guild_rule_ids.clear()
+        self._global_rule_ids.clear()
         self.ready_event.clear()
+        Requires._rules_revision += 1
 
     async def verify(self, ctx: "Context") -> bool:
         """Check if the given context passes the requirements.
@@ -595,33 +623,45 @@ class Requires:
                 return rule
             return self.get_rule(self.DEFAULT, self.GLOBAL)
 
-        rules_chain = [self._global_rules]
-        guild_rules = self._guild_rules.get(ctx.guild.id)
-        if guild_rules:
-            rules_chain.append(guild_rules)
-
-        channels = []
-        if author.voice is not None:
-            channels.append(author.voice.channel)
-        if isinstance(ctx.channel, discord.Thread):
-            channels.append(ctx.channel.parent)
-        else:
-            channels.append(ctx.channel)
-        category = ctx.channel.category
-        if category is not None:
-            channels.append(category)
-
-        # We want author roles sorted highest to lowest, and exclude the @everyone role
-        author_roles = reversed(author.roles[1:])
-
-        model_chain = [author, *channels, *author_roles, guild]
-
-        for rules in rules_chain:
-            for model in model_chain:
-                rule = rules.get(model.id)
-                if rule is not None:
-                    return rule
-            del model_chain[-1]  # We don't check for the guild in guild rules
+        global_rule_ids = self._global_rule_ids
+        guild_rule_ids = self._guild_rule_ids.get(guild.id)
+        if global_rule_ids or guild_rule_ids:
+            channel_ids = []
+            if author.voice is not None and author.voice.channel is not None:
+                channel_ids.append(author.voice.channel.id)
+            if isinstance(ctx.channel, discord.Thread):
+                channel_ids.append(ctx.channel.parent_id)
+            else:
+                channel_ids.append(ctx.channel.id)
+            category = ctx.channel.category
+            if category is not None:
+                channel_ids.append(category.id)
+
+            # The @everyone role is not included in `Member._roles`
+            role_ids = getattr(author, "_roles", ())
+
+            for rules, rule_ids, check_guild in (
+                (self._global_rules, global_rule_ids, True),
+                (self._guild_rules.get(guild.id), guild_rule_ids, False),
+            ):
+                if not rule_ids:
+                    continue
+                # Models are checked in the order: author, channels,
+                # roles from highest to lowest, guild (global rules only).
+                if author.id in rule_ids:
+                    return rules[author.id]
+                for channel_id in channel_ids:
+                    if channel_id in rule_ids:
+                        return rules[channel_id]
+                matched_roles = [
+                    role
+                    for role_id in rule_ids.intersection(role_ids)
+                    if (role := guild.get_role(role_id)) is not None
+                ]
+                if matched_roles:
+                    return rules[max(matched_roles).id]
+                if check_guild and guild.id in rule_ids:
+                    return rules[guild.id]
 
         default_rule = self.get_rule(self.DEFAULT, guild.id)
         if default_rule is PermState.NORMAL:
@@ -1,16 +1,22 @@
 import asyncio
 import collections.abc
+import functools
+import inspect
 import json
 import logging
 import pickle
 import weakref
+from collections import OrderedDict
 from typing import (
     Any,
     AsyncContextManager,
     Awaitable,
+    Callable,
     Dict,
+    List,
     MutableMapping,
     Optional,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -19,9 +25,10 @@ from typing import (
 
 import discord
 
+from ._perf import perf
 from .drivers import IdentifierData, get_driver, ConfigCategory, BaseDriver
 
-__all__ = ["Config", "get_latest_confs", "migrate"]
+__all__ = ["Config", "ConfigCache", "ConfigChange", "get_latest_confs", "migrate"]
 
 log = logging.getLogger("red.config")
 
@@ -66,6 +73,219 @@ def get_latest_confs() -> Tuple["Config"]:
     return tuple(ret)
 
 
+_MISSING = object()
+
+
+class ConfigCache:
+    """An in-process read-through cache of a `Config`'s driver reads.
+
+    Reads are cached by their identifier data, including reads of values
+    which aren't set. Cached values are stored pickled, so every read returns
+    a fresh copy, and the cache is bounded by the total size of these pickles,
+    evicting the least recently used values first.
+
+    Setting or clearing a value invalidates the cached reads of the value itself,
+    of every group containing it and of everything it contains.
+
+    Writes made without going through `Config` (e.g. by other processes
+    sharing the same database) are not seen until the value gets evicted,
+    which is why the cache is opt-in, see `Config.enable_cache`.
+
+    Attributes
+    ----------
+    max_size : int
+        The maximum total size (in bytes) of the cached values.
+    hits : int
+        The amount of reads served from the cache.
+    misses : int
+        The amount of reads which had to go to the driver.
+
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._size = 0
+        self._entries: "OrderedDict[Tuple[str, ...], Tuple[Any, int]]" = OrderedDict()
+        self._descendants: Dict[Tuple[str, ...], Set[Tuple[str, ...]]] = {}
+        # Bumped on every invalidation, so that reads racing with a write
+        # don't put a stale value in the cache.
+        self._generation = 0
+
+    @property
+    def size(self) -> int:
+        """int: The total size (in bytes) of the cached values."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(identifier_data: IdentifierData) -> Tuple[str, ...]:
+        return tuple(
+            filter(
+                None,
+                (
+                    identifier_data.category,
+                    *identifier_data.primary_key,
+                    *identifier_data.identifiers,
+                ),
+            )
+        )
+
+    async def get(self, identifier_data: IdentifierData, driver: BaseDriver) -> Any:
+        key = self._key(identifier_data)
+        try:
+            stored, __ = self._entries[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            if stored is _MISSING:
+                raise KeyError(key)
+            return pickle.loads(stored) if isinstance(stored, bytes) else stored
+
+        self.misses += 1
+        generation = self._generation
+        try:
+            value = await driver.get(identifier_data)
+        except KeyError:
+            if generation == self._generation:
+                self._store(key, _MISSING, 0)
+            raise
+        if generation == self._generation:
+            if isinstance(value, str):
+                # Strings are immutable, but can be as large as any other value.
+                self._store(key, value, len(value))
+            elif isinstance(value, (int, float, bool, type(None))):
+                self._store(key, value, 0)
+            else:
+                stored = pickle.dumps(value, -1)
+                self._store(key, stored, len(stored))
+        return value
+
+    def _store(self, key: Tuple[str, ...], stored: Any, size: int) -> None:
+        # Everything takes at least some space, so that the entry count stays bounded.
+        size += 64
+        if size > self.max_size // 4:
+            return
+        self._remove(key)
+        self._entries[key] = (stored, size)
+        self._size += size
+        for i in range(len(key)):
+            self._descendants.setdefault(key[:i], set()).add(key)
+        while self._size > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Tuple[str, ...]) -> None:
+        try:
+            __, size = self._entries.pop(key)
+        except KeyError:
+            return
+        self._size -= size
+        for i in range(len(key)):
+            prefix = key[:i]
+            descendants = self._descendants[prefix]
+            descendants.discard(key)
+            if not descendants:
+                del self._descendants[prefix]
+
+    def invalidate(self, identifier_data: IdentifierData) -> None:
+        """Drop the cached reads affected by a write to the given identifier data."""
+        self._invalidate_key(self._key(identifier_data))
+
+    def _invalidate_key(self, key: Tuple[str, ...]) -> None:
+        self._generation += 1
+        for i in range(len(key) + 1):
+            self._remove(key[:i])
+        for descendant in tuple(self._descendants.get(key, ())):
+            self._remove(descendant)
+
+    def clear(self) -> None:
+        """Drop all cached reads."""
+        self._generation += 1
+        self._entries.clear()
+        self._descendants.clear()
+        self._size = 0
+
+
+class ConfigChange:
+    """A write made through a `Config`, as passed to its change listeners.
+
+    See `Config.add_change_listener`.
+
+    Attributes
+    ----------
+    config : Config
+        The Config the write was made through.
+    category : str
+        The category of the written data, e.g. ``"GUILD"`` or a custom group's name.
+        This is empty when all of the Config's data was written, e.g. by `Config.clear_all`.
+    primary_key : Tuple[str, ...]
+        The primary keys of the written data, e.g. the guild ID. This may be shorter
+        than the category's primary key length (or empty) when a whole category,
+        or a part of it, was written.
+    identifiers : Tuple[str, ...]
+        The identifiers of the written data, below the primary keys.
+        This is empty when a whole scope (e.g. all of a guild's data) was written.
+
+    """
+
+    __slots__ = ("config", "category", "primary_key", "identifiers")
+
+    def __init__(
+        self,
+        config: "Config",
+        category: str,
+        primary_key: Tuple[str, ...],
+        identifiers: Tuple[str, ...],
+    ):
+        self.config = config
+        self.category = category
+        self.primary_key = primary_key
+        self.identifiers = identifiers
+
+    def overlaps(self, category: str, *path: Union[str, int]) -> bool:
+        """Check whether this write may have changed the data at the given path.
+
+        That is the case when this write is to that data, to data containing it,
+        or to data it contains.
+
+        Parameters
+        ----------
+        category : str
+            The category of the data, e.g. `Config.GUILD`.
+        *path : Union[str, int]
+            The primary keys of the data followed by its identifiers,
+            e.g. ``(guild.id, "prefix")``.
+
+        Examples
+        --------
+        ::
+
+            def on_config_change(change):
+                if change.overlaps(Config.GUILD, guild_id, "prefix"):
+                    cached_prefixes.pop(guild_id, None)
+
+        """
+        if not self.category:
+            # All of the Config's data was written.
+            return True
+        if category != self.category:
+            return False
+        changed = (*self.primary_key, *self.identifiers)
+        common = min(len(changed), len(path))
+        return changed[:common] == tuple(map(str, path[:common]))
+
+    def __repr__(self) -> str:
+        return (
+            f"<ConfigChange cog_name={self.config.cog_name!r} category={self.category!r}"
+            f" primary_key={self.primary_key!r} identifiers={self.identifiers!r}>"
+        )
+
+
 class _ValueCtxManager(Awaitable[_T], AsyncContextManager[_T]):  # pylint: disable=duplicate-bases
     """Context manager implementation of config values.
 
@@ -174,7 +394,7 @@ class Value:
 
     async def _get(self, default=...):
         try:
-            ret = await self.driver.get(self.identifier_data)
+            ret = await self._config._driver_get(self.identifier_data)
         except KeyError:
             return default if default is not ... else self.default
         return ret
@@ -255,13 +475,13 @@ class Value:
         """
         if isinstance(value, dict):
             value = _str_key_dict(value)
-        await self.driver.set(self.identifier_data, value=value)
+        await self._config._driver_set(self.identifier_data, value)
 
     async def clear(self):
         """
         Clears the value from record for the data element pointed to by `identifiers`.
         """
-        await self.driver.clear(self.identifier_data)
+        await self._config._driver_clear(self.identifier_data)
 
 
 class Group(Value):
@@ -383,7 +603,7 @@ class Group(Value):
         """
         path = tuple(str(p) for p in nested_path)
         identifier_data = self.identifier_data.get_child(*path)
-        await self.driver.clear(identifier_data)
+        await self._config._driver_clear(identifier_data)
 
     def is_group(self, item: Any) -> bool:
         """A helper method for `__getattr__`. Most developers will have no need
@@ -502,7 +722,7 @@ class Group(Value):
 
         identifier_data = self.identifier_data.get_child(*path)
         try:
-            raw = await self.driver.get(identifier_data)
+            raw = await self._config._driver_get(identifier_data)
         except KeyError:
             if default is not ...:
                 return default
@@ -587,7 +807,7 @@ class Group(Value):
         identifier_data = self.identifier_data.get_child(*path)
         if isinstance(value, dict):
             value = _str_key_dict(value)
-        await self.driver.set(identifier_data, value=value)
+        await self._config._driver_set(identifier_data, value)
 
 
 class Config(metaclass=ConfigMeta):
@@ -652,11 +872,132 @@ class Config(metaclass=ConfigMeta):
         self._lock_cache: MutableMapping[
             IdentifierData, asyncio.Lock
         ] = weakref.WeakValueDictionary()
+        self.cache: Optional[ConfigCache] = None
+        self._change_listeners: List[Callable[[ConfigChange], Any]] = []
+        # Keeps the tasks of coroutine listeners alive until they're done.
+        self._listener_tasks: Set["asyncio.Future[Any]"] = set()
 
     @property
     def defaults(self):
         return pickle.loads(pickle.dumps(self._defaults, -1))
 
+    def enable_cache(self, max_size: int = 1_000_000) -> ConfigCache:
+        """Enable an in-process cache of this Config's reads.
+
+        This mostly helps with drivers which need a round trip to a database
+        for each read, such as the PostgreSQL driver. Only enable it if this Config's
+        data is never modified without going through this Config instance.
+        See `ConfigCache` for details.
+
+        Parameters
+        ----------
+        max_size : int
+            The maximum total size (in bytes) of the cached values.
+            If the cache is already enabled, it's resized.
+
+        Returns
+        -------
+        ConfigCache
+            The cache, which also holds its hit and miss counters.
+
+        """
+        if self.cache is None:
+            self.cache = ConfigCache(max_size)
+        else:
+            self.cache.max_size = max_size
+            self.cache.clear()
+        return self.cache
+
+    def disable_cache(self) -> None:
+        """Disable the cache enabled with `enable_cache`."""
+        self.cache = None
+
+    async def _driver_get(self, identifier_data: IdentifierData) -> Any:
+        if perf.enabled:
+            perf.config_ops["get"] += 1
+        if self.cache is None:
+            return await self.driver.get(identifier_data)
+        return await self.cache.get(identifier_data, self.driver)
+
+    async def _driver_set(self, identifier_data: IdentifierData, value: Any) -> None:
+        if perf.enabled:
+            perf.config_ops["set"] += 1
+        try:
+            await self.driver.set(identifier_data, value=value)
+        finally:
+            self._after_write(identifier_data)
+
+    async def _driver_clear(self, identifier_data: IdentifierData) -> None:
+        if perf.enabled:
+            perf.config_ops["clear"] += 1
+        try:
+            await self.driver.clear(identifier_data)
+        finally:
+            self._after_write(identifier_data)
+
+    def _after_write(self, identifier_data: IdentifierData) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(identifier_data)
+        if self._change_listeners:
+            self._dispatch_change(
+                ConfigChange(
+                    self,
+                    identifier_data.category,
+                    identifier_data.primary_key,
+                    identifier_data.identifiers,
+                )
+            )
+
+    def _dispatch_change(self, change: ConfigChange) -> None:
+        for listener in self._change_listeners.copy():
+            try:
+                result = listener(change)
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result)
+                    self._listener_tasks.add(task)
+                    task.add_done_callback(functools.partial(self._on_listener_done, listener))
+            except Exception:
+                log.exception("Error in Config change listener %r", listener)
+
+    def _on_listener_done(
+        self, listener: Callable[[ConfigChange], Any], task: "asyncio.Future[Any]"
+    ) -> None:
+        self._listener_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.error("Error in Config change listener %r", listener, exc_info=task.exception())
+
+    def add_change_listener(self, listener: Callable[[ConfigChange], Any]) -> None:
+        """Register a function to call after every write made through this Config.
+
+        The listener is called with a `ConfigChange` once the write is done,
+        whether it succeeded or not. It can be a coroutine function, in which case
+        it's scheduled as a task. Errors raised by listeners are logged.
+
+        This is meant for keeping caches of Config data up to date, e.g. when the data is
+        changed by another cog, by a data import, or by another process in cluster mode.
+        Writes made through the Config's driver directly are not seen.
+
+        Cogs should remove their listeners with `remove_change_listener` when unloaded.
+
+        Parameters
+        ----------
+        listener : Callable[[ConfigChange], Any]
+            The function to call.
+
+        """
+        self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[[ConfigChange], Any]) -> None:
+        """Remove a listener added with `add_change_listener`.
+
+        Raises
+        ------
+        ValueError
+            The listener wasn't registered.
+
+        """
+        self._change_listeners.remove(listener)
+
     @classmethod
     def get_conf(
         cls,
@@ -1184,7 +1525,7 @@ class Config(metaclass=ConfigMeta):
         defaults = self.defaults.get(scope, {})
 
         try:
-            dict_ = await self.driver.get(group.identifier_data)
+            dict_ = await self._driver_get(group.identifier_data)
         except KeyError:
             pass
         else:
@@ -1301,7 +1642,7 @@ class Config(metaclass=ConfigMeta):
         if guild is None:
             group = self._get_base_group(self.MEMBER)
             try:
-                dict_ = await self.driver.get(group.identifier_data)
+                dict_ = await self._driver_get(group.identifier_data)
             except KeyError:
                 pass
             else:
@@ -1310,7 +1651,7 @@ class Config(metaclass=ConfigMeta):
         else:
             group = self._get_base_group(self.MEMBER, str(guild.id))
             try:
-                guild_data = await self.driver.get(group.identifier_data)
+                guild_data = await self._driver_get(group.identifier_data)
             except KeyError:
                 pass
             else:
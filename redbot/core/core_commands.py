@@ -40,6 +40,7 @@ from . import (
     modlog,
 )
 from ._diagnoser import IssueDiagnoser
+from ._perf import perf
 from .utils import AsyncIter, can_user_send_messages_in
 from .utils._internal_utils import fetch_latest_red_version_info
 from .utils.predicates import MessagePredicate
@@ -216,6 +217,9 @@ class CoreLogic:
                 if maybe_repo is not None:
                     repos_with_shared_libs.add(maybe_repo.name)
 
+        if loaded_packages and bot._cluster is not None:
+            bot._cluster.publish("load_packages", loaded_packages)
+
         return {
             "loaded_packages": loaded_packages,
             "failed_packages": failed_packages,
@@ -282,6 +286,9 @@ class CoreLogic:
             else:
                 notloaded_packages.append(name)
 
+        if unloaded_packages and bot._cluster is not None:
+            bot._cluster.publish("unload_packages", unloaded_packages)
+
         return {"unloaded_packages": unloaded_packages, "notloaded_packages": notloaded_packages}
 
     async def _reload(
@@ -4126,6 +4133,101 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
 
         await ctx.send(await DebugInfo(self.bot).get_text())
 
+    @commands.is_owner()
+    @commands.group(invoke_without_command=True)
+    async def perf(self, ctx: commands.Context, top: int = 10):
+        """
+        Show the performance metrics collected since `[p]perf enable`.
+
+        Listeners are sorted by the time they blocked the event loop, which is where
+        slow cogs usually show up. Times are in milliseconds.
+
+        **Arguments:**
+            - `[top]` - How many listeners and commands to show. Defaults to 10.
+        """
+        top = max(1, min(top, 50))
+        if not perf.enabled and not perf.process_commands.count:
+            await ctx.send(
+                _("Performance metrics aren't being collected. Use `{command}` first.").format(
+                    command=f"{ctx.clean_prefix}perf enable"
+                )
+            )
+            return
+
+        def row(name: str, stats) -> str:
+            return (
+                f"{name[:40]:<40} {stats.count:>8} {stats.mean * 1000:>9.2f}"
+                f" {stats.percentile(99) * 1000:>9.2f} {stats.max * 1000:>9.2f}"
+                f" {stats.busy_total * 1000:>10.1f}"
+            )
+
+        header = f"{'':<40} {'calls':>8} {'mean':>9} {'p99':>9} {'max':>9} {'blocking':>10}"
+        listeners = sorted(perf.listeners.items(), key=lambda i: i[1].busy_total, reverse=True)
+        command_stats = sorted(perf.commands.items(), key=lambda i: i[1].total, reverse=True)
+        lines = [
+            _("Collected for {duration}.").format(
+                duration=humanize_timedelta(seconds=perf.duration) or _("less than a second")
+            ),
+            "",
+            header,
+            row("process_commands", perf.process_commands),
+            row("event loop lag", perf.loop_lag),
+            "",
+            _("Listeners:"),
+            *(row(name, stats) for name, stats in listeners[:top]),
+            "",
+            _("Commands:"),
+            *(row(name, stats) for name, stats in command_stats[:top]),
+            "",
+            _("Events: {events}").format(
+                events=", ".join(
+                    f"{name} ({humanize_number(count)})"
+                    for name, count in perf.events.most_common(top)
+                )
+            ),
+            _("Config operations: {ops}").format(
+                ops=", ".join(
+                    f"{op} ({humanize_number(count)})"
+                    for op, count in sorted(perf.config_ops.items())
+                )
+            ),
+        ]
+        cache = self.bot._config.cache
+        if cache is not None:
+            lines.append(
+                _("Core Config cache: {hits} hits, {misses} misses").format(
+                    hits=humanize_number(cache.hits), misses=humanize_number(cache.misses)
+                )
+            )
+        for page in pagify("\n".join(lines), shorten_by=10):
+            await ctx.send(box(page))
+
+    @perf.command(name="enable")
+    async def perf_enable(self, ctx: commands.Context):
+        """
+        Start collecting performance metrics.
+
+        Any previously collected metrics are dropped.
+        """
+        perf.enable()
+        await ctx.send(_("Performance metrics are now being collected."))
+
+    @perf.command(name="disable")
+    async def perf_disable(self, ctx: commands.Context):
+        """
+        Stop collecting performance metrics.
+
+        The metrics collected so far can still be shown with `[p]perf`.
+        """
+        perf.disable()
+        await ctx.send(_("Performance metrics are no longer being collected."))
+
+    @perf.command(name="reset")
+    async def perf_reset(self, ctx: commands.Context):
+        """Drop the performance metrics collected so far."""
+        perf.reset()
+        await ctx.send(_("Performance metrics have been reset."))
+
     # You may ask why this command is owner-only,
     # cause after all it could be quite useful to guild owners!
     # Truth to be told, that would require us to make some part of this
@@ -4629,6 +4731,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         if isinstance(cog, commands.commands._RuleDropper):
             return await ctx.send(_("You can't disable this cog by default."))
         await self.bot._disabled_cog_cache.default_disable(cogname)
+        self.bot._help_cache.invalidate()
         await ctx.send(_("{cogname} has been set as disabled by default.").format(cogname=cogname))
 
     @checks.is_owner()
@@ -4650,6 +4753,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         """
         cogname = cog.qualified_name
         await self.bot._disabled_cog_cache.default_enable(cogname)
+        self.bot._help_cache.invalidate()
         await ctx.send(_("{cogname} has been set as enabled by default.").format(cogname=cogname))
 
     @commands.guild_only()
@@ -4670,6 +4774,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         if isinstance(cog, commands.commands._RuleDropper):
             return await ctx.send(_("You can't disable this cog as you would lock yourself out."))
         if await self.bot._disabled_cog_cache.disable_cog_in_guild(cogname, ctx.guild.id):
+            self.bot._help_cache.invalidate()
             await ctx.send(_("{cogname} has been disabled in this guild.").format(cogname=cogname))
         else:
             await ctx.send(
@@ -4691,6 +4796,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             - `<cog>` - The name of the cog to enable on this server. Must be title-case.
         """
         if await self.bot._disabled_cog_cache.enable_cog_in_guild(cogname, ctx.guild.id):
+            self.bot._help_cache.invalidate()
             await ctx.send(_("{cogname} has been enabled in this guild.").format(cogname=cogname))
         else:
             # putting this here allows enabling a cog that isn't loaded but was disabled.
@@ -4840,6 +4946,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             await ctx.send(_("That command is already disabled globally."))
             return
         command.enabled = False
+        ctx.bot._help_cache.invalidate()
 
         await ctx.tick()
 
@@ -4878,6 +4985,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
                 disabled_commands.append(command.qualified_name)
 
         done = command.disable_in(ctx.guild)
+        ctx.bot._help_cache.invalidate()
 
         if not done:
             await ctx.send(_("That command is already disabled in this server."))
@@ -4925,6 +5033,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             return
 
         command.enabled = True
+        ctx.bot._help_cache.invalidate()
         await ctx.tick()
 
     @commands.guild_only()
@@ -4950,6 +5059,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
                 disabled_commands.remove(command.qualified_name)
 
         done = command.enable_in(ctx.guild)
+        ctx.bot._help_cache.invalidate()
 
         if not done:
             await ctx.send(_("That command is already enabled in this server."))
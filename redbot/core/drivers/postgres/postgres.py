@@ -1,8 +1,11 @@
+import asyncio
 import getpass
+import itertools
 import json
 import sys
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, Any, AsyncIterator, Tuple, Union, Callable, List
+from typing import Optional, Any, AsyncIterator, Tuple, Union, Callable, List, Set
 
 try:
     # pylint: disable=import-error
@@ -35,9 +38,38 @@ def encode_identifier_data(
     )
 
 
+def _prompt_pool_size(prompt: str) -> Optional[int]:
+    print(prompt)
+    while True:
+        size = input("> ") or None
+        if size is None:
+            return None
+        try:
+            size = int(size)
+        except ValueError:
+            print("Pool size must be a number")
+        else:
+            if size > 0:
+                return size
+            print("Pool size must be a positive number")
+
+
 class PostgresDriver(BaseDriver):
+    """PostgreSQL driver.
+
+    Every query is run through a connection pool. asyncpg prepares the statements
+    used by this driver once per connection and keeps them in the connection's
+    statement cache, so repeated queries skip the parse/plan step.
+
+    Writes (``set`` and ``clear``) issued in the same iteration of the event loop
+    are pipelined: they're queued, then sent together with a single
+    :meth:`asyncpg.Connection.executemany` call, which costs one round trip
+    instead of one per write.
+    """
 
     _pool: Optional["asyncpg.pool.Pool"] = None
+    _write_queue: List[Tuple[str, tuple, "asyncio.Future[None]"]] = []
+    _flush_tasks: Set["asyncio.Task[None]"] = set()
 
     @classmethod
     async def initialize(cls, **storage_details) -> None:
@@ -51,6 +83,8 @@ class PostgresDriver(BaseDriver):
 
     @classmethod
     async def teardown(cls) -> None:
+        if cls._flush_tasks:
+            await asyncio.gather(*cls._flush_tasks, return_exceptions=True)
         if cls._pool is not None:
             await cls._pool.close()
 
@@ -128,7 +162,7 @@ class PostgresDriver(BaseDriver):
             or None
         )
 
-        return {
+        details = {
             "host": host,
             "port": port,
             "user": user,
@@ -136,6 +170,22 @@ class PostgresDriver(BaseDriver):
             "database": database,
         }
 
+        min_size = _prompt_pool_size(
+            "Enter the minimum number of connections kept open to the PostgreSQL server.\n"
+            "If left blank, this will default to 10."
+        )
+        if min_size is not None:
+            details["min_size"] = min_size
+        max_size = _prompt_pool_size(
+            "Enter the maximum number of simultaneous connections to the PostgreSQL server.\n"
+            "If left blank, this will default to the minimum number of connections or 10,"
+            " whichever is greater."
+        )
+        if max_size is not None or min_size is not None:
+            details["max_size"] = max(max_size or 10, min_size or 0)
+
+        return details
+
     async def get(self, identifier_data: IdentifierData):
         try:
             result = await self._execute(
@@ -154,7 +204,7 @@ class PostgresDriver(BaseDriver):
 
     async def set(self, identifier_data: IdentifierData, value=None):
         try:
-            await self._execute(
+            await self._execute_pipelined(
                 "SELECT red_config.set($1, $2::jsonb)",
                 encode_identifier_data(identifier_data),
                 json.dumps(value),
@@ -164,7 +214,7 @@ class PostgresDriver(BaseDriver):
 
     async def clear(self, identifier_data: IdentifierData):
         try:
-            await self._execute(
+            await self._execute_pipelined(
                 "SELECT red_config.clear($1)", encode_identifier_data(identifier_data)
             )
         except asyncpg.UndefinedTableError:
@@ -235,3 +285,58 @@ class PostgresDriver(BaseDriver):
         if args:
             log.invisible("Args: %s", args)
         return await method(query, *args)
+
+    @classmethod
+    async def _execute_pipelined(cls, query: str, *args) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        cls._write_queue.append((query, args, future))
+        if len(cls._write_queue) == 1:
+            # Callbacks scheduled now run after every task that's already ready to run
+            # in this iteration, so their writes end up in the same batch.
+            loop.call_soon(cls._start_flush)
+        await future
+
+    @classmethod
+    def _start_flush(cls) -> None:
+        batch, cls._write_queue = cls._write_queue, []
+        task = asyncio.create_task(cls._flush(batch))
+        cls._flush_tasks.add(task)
+        task.add_done_callback(cls._flush_tasks.discard)
+
+    @classmethod
+    async def _flush(cls, batch: List[Tuple[str, tuple, "asyncio.Future[None]"]]) -> None:
+        # Only consecutive writes using the same query are sent together,
+        # so that writes are still applied in the order they were issued.
+        for query, group in itertools.groupby(batch, key=itemgetter(0)):
+            group = [(args, future) for __, args, future in group if not future.done()]
+            if not group:
+                continue
+            if len(group) > 1:
+                log.invisible("Pipelined query (%s times): %s", len(group), query)
+                try:
+                    await cls._pool.executemany(query, [args for args, __ in group])
+                except asyncpg.PostgresError:
+                    # The batch is atomic, so nothing was written. Retry the writes one
+                    # by one, so that only the failing ones get the error.
+                    pass
+                except Exception as exc:
+                    for __, future in group:
+                        if not future.done():
+                            future.set_exception(exc)
+                    continue
+                else:
+                    for __, future in group:
+                        if not future.done():
+                            future.set_result(None)
+                    continue
+
+            for args, future in group:
+                try:
+                    await cls._execute(query, *args)
+                except Exception as exc:
+                    if not future.done():
+                        future.set_exception(exc)
+                else:
+                    if not future.done():
+                        future.set_result(None)
@@ -0,0 +1,248 @@
+"""
+Bot-wide HTTP client.
+
+Cogs should use `Red.http_client` instead of creating their own
+:class:`aiohttp.ClientSession`, so that connections are pooled across the bot.
+"""
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Mapping, Optional, Tuple
+
+import aiohttp
+
+__all__ = ("HTTPClient", "HTTPResponse")
+
+
+class HTTPResponse:
+    """A fully read HTTP response, as returned by `HTTPClient.request`.
+
+    Attributes
+    ----------
+    status : int
+        The HTTP status code.
+    headers : Mapping[str, str]
+        The (case-insensitive) response headers.
+    body : bytes
+        The raw response body.
+    url : str
+        The final URL of the response.
+
+    """
+
+    __slots__ = ("status", "headers", "body", "url", "charset")
+
+    def __init__(
+        self,
+        *,
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+        url: str,
+        charset: Optional[str] = None,
+    ):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.url = url
+        self.charset = charset
+
+    @property
+    def ok(self) -> bool:
+        """``True`` if the status code is lower than 400."""
+        return self.status < 400
+
+    def text(self, encoding: Optional[str] = None) -> str:
+        """Decode the response body.
+
+        Parameters
+        ----------
+        encoding : Optional[str]
+            The encoding to use. Defaults to the charset of the response,
+            or UTF-8 if there is none.
+
+        """
+        return self.body.decode(encoding or self.charset or "utf-8", errors="replace")
+
+    def json(self, *, loads: Callable[[str], Any] = json.loads) -> Any:
+        """Decode the response body as JSON.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            The body isn't valid JSON.
+
+        """
+        return loads(self.text())
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} status={self.status} url={self.url!r}>"
+
+
+def _freeze(value: Any) -> Hashable:
+    if value is None:
+        return None
+    if isinstance(value, Mapping):
+        value = value.items()
+    elif isinstance(value, str):
+        return value
+    return tuple(sorted((str(k), str(v)) for k, v in value))
+
+
+class HTTPClient:
+    """A shared HTTP client with pooled connections and an optional response cache.
+
+    The underlying :class:`aiohttp.ClientSession` is created lazily and shared
+    by everything using this client. It limits the number of concurrent connections
+    in total and per host.
+
+    Responses to ``GET`` requests may be cached by passing ``cache_ttl``
+    to `request`/`get`. The cache is bounded by the total size of cached bodies,
+    evicting the least recently used responses first.
+
+    Parameters
+    ----------
+    limit : int
+        The maximum number of simultaneous connections.
+    limit_per_host : int
+        The maximum number of simultaneous connections to a single host.
+    cache_max_size : int
+        The maximum total size (in bytes) of cached response bodies.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        cache_max_size: int = 16 * 1024 * 1024,
+    ):
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._cache: "OrderedDict[Hashable, Tuple[float, HTTPResponse]]" = OrderedDict()
+        self._cache_size = 0
+        self.cache_max_size = cache_max_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """aiohttp.ClientSession: The shared session.
+
+        Use this for requests needing more than `request` offers (e.g. streaming).
+        This session must **not** be closed by cogs.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit, limit_per_host=self._limit_per_host
+            )
+            self._session = aiohttp.ClientSession(connector=connector, json_serialize=json.dumps)
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Any = None,
+        headers: Optional[Mapping[str, str]] = None,
+        cache_ttl: Optional[float] = None,
+        **kwargs: Any,
+    ) -> HTTPResponse:
+        """Make a request and read the whole response.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method.
+        url : str
+            The URL to request.
+        params
+            Query string parameters.
+        headers : Optional[Mapping[str, str]]
+            Request headers.
+        cache_ttl : Optional[float]
+            If set, successful responses to ``GET`` requests are cached
+            for this many seconds, keyed by the URL, parameters and headers.
+        **kwargs
+            Passed to :meth:`aiohttp.ClientSession.request`.
+            Requests with extra keyword arguments (e.g. a body) are never cached.
+
+        Returns
+        -------
+        HTTPResponse
+            The response.
+
+        Raises
+        ------
+        aiohttp.ClientError
+            The request failed.
+
+        """
+        cache_key = None
+        if cache_ttl and method.upper() == "GET" and not kwargs:
+            cache_key = (url, _freeze(params), _freeze(headers))
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                self.cache_hits += 1
+                return cached
+            self.cache_misses += 1
+
+        async with self.session.request(
+            method, url, params=params, headers=headers, **kwargs
+        ) as resp:
+            response = HTTPResponse(
+                status=resp.status,
+                headers=resp.headers,
+                body=await resp.read(),
+                url=str(resp.url),
+                charset=resp.charset,
+            )
+
+        if cache_key is not None and response.status == 200:
+            self._set_cached(cache_key, response, cache_ttl)
+        return response
+
+    async def get(self, url: str, **kwargs: Any) -> HTTPResponse:
+        """Shorthand for ``request("GET", url, **kwargs)``."""
+        return await self.request("GET", url, **kwargs)
+
+    def _get_cached(self, key: Hashable) -> Optional[HTTPResponse]:
+        try:
+            expires_at, response = self._cache[key]
+        except KeyError:
+            return None
+        if expires_at < time.monotonic():
+            self._evict(key)
+            return None
+        self._cache.move_to_end(key)
+        return response
+
+    def _set_cached(self, key: Hashable, response: HTTPResponse, ttl: float) -> None:
+        size = len(response.body)
+        if size > self.cache_max_size // 4:
+            return
+        if key in self._cache:
+            self._evict(key)
+        self._cache[key] = (time.monotonic() + ttl, response)
+        self._cache_size += size
+        while self._cache_size > self.cache_max_size:
+            self._evict(next(iter(self._cache)))
+
+    def _evict(self, key: Hashable) -> None:
+        __, response = self._cache.pop(key)
+        self._cache_size -= len(response.body)
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        self._cache.clear()
+        self._cache_size = 0
+
+    async def close(self) -> None:
+        """Close the shared session and drop all cached responses."""
+        self.clear_cache()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -8,6 +8,8 @@ from aiohttp_json_rpc.rpc import JsonRpcMethod
 
 import logging
 
+from ._perf import perf
+
 log = logging.getLogger("red.rpc")
 
 __all__ = ["RPC", "RPCMixin", "get_name"]
@@ -24,7 +26,7 @@ def get_name(func, prefix=""):
 class RedRpc(JsonRpc):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.add_methods(("", self.get_method_info))
+        self.add_methods(("", self.get_method_info), ("", self.perf_stats))
 
     def _add_method(self, method, name="", prefix=""):
         if not asyncio.iscoroutinefunction(method):
@@ -56,6 +58,12 @@ class RedRpc(JsonRpc):
             return self.methods[method_name].__doc__
         return "No docstring available."
 
+    async def perf_stats(self, request):
+        """
+        Returns the performance metrics collected while ``[p]perf`` is enabled.
+        """
+        return perf.to_dict()
+
 
 class RPC:
     """
@@ -1,16 +1,40 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Union, Set, Iterable, Tuple, overload
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+    Set,
+    Iterable,
+    Tuple,
+    overload,
+)
 import asyncio
 from argparse import Namespace
 from collections import defaultdict
 
 import discord
 
-from .config import Config
+from .config import Config, ConfigChange
 from .utils import AsyncIter
 
 
+def _drop_changed(
+    cache: Dict[Any, Any], change: ConfigChange, category: str, *identifiers: str
+) -> None:
+    """Drop the values cached by guild/channel ID that the given change may have modified."""
+    if not change.overlaps(category, *change.primary_key[:1], *identifiers):
+        return
+    if change.primary_key:
+        cache.pop(int(change.primary_key[0]), None)
+    else:
+        cache.clear()
+
+
 class PrefixManager:
     def __init__(self, config: Config, cli_flags: Namespace):
         self._config: Config = config
@@ -18,6 +42,18 @@ class PrefixManager:
             sorted(cli_flags.prefix, reverse=True) or None
         )
         self._cached: Dict[Optional[int], List[str]] = {}
+        config.add_change_listener(self._on_config_change)
+
+    def clear_cache(self) -> None:
+        """Drop every cached setting, so that it gets read from Config again."""
+        self._cached.clear()
+
+    def _on_config_change(self, change: ConfigChange) -> None:
+        if change.overlaps(Config.GLOBAL, "prefix"):
+            # Guilds without prefixes use the global ones.
+            self._cached.clear()
+        else:
+            _drop_changed(self._cached, change, Config.GUILD, "prefix")
 
     async def get_prefixes(self, guild: Optional[discord.Guild] = None) -> List[str]:
         ret: List[str]
@@ -65,6 +101,20 @@ class I18nManager:
         self._config: Config = config
         self._guild_locale: Dict[Union[int, None], Union[str, None]] = {}
         self._guild_regional_format: Dict[Union[int, None], Union[str, None]] = {}
+        config.add_change_listener(self._on_config_change)
+
+    def clear_cache(self) -> None:
+        """Drop every cached setting, so that it gets read from Config again."""
+        self._guild_locale.clear()
+        self._guild_regional_format.clear()
+
+    def _on_config_change(self, change: ConfigChange) -> None:
+        if change.overlaps(Config.GLOBAL, "locale"):
+            self._guild_locale.pop(None, None)
+        if change.overlaps(Config.GLOBAL, "regional_format"):
+            self._guild_regional_format.pop(None, None)
+        _drop_changed(self._guild_locale, change, Config.GUILD, "locale")
+        _drop_changed(self._guild_regional_format, change, Config.GUILD, "regional_format")
 
     async def get_locale(self, guild: Union[discord.Guild, None]) -> str:
         """Get the guild locale from the cache"""
@@ -152,6 +202,16 @@ class IgnoreManager:
         self._config: Config = config
         self._cached_channels: Dict[int, bool] = {}
         self._cached_guilds: Dict[int, bool] = {}
+        config.add_change_listener(self._on_config_change)
+
+    def clear_cache(self) -> None:
+        """Drop every cached setting, so that it gets read from Config again."""
+        self._cached_channels.clear()
+        self._cached_guilds.clear()
+
+    def _on_config_change(self, change: ConfigChange) -> None:
+        _drop_changed(self._cached_channels, change, Config.CHANNEL, "ignored")
+        _drop_changed(self._cached_guilds, change, Config.GUILD, "ignored")
 
     async def get_ignored_channel(
         self, channel: Union[discord.TextChannel, discord.Thread], check_category: bool = True
@@ -213,16 +273,95 @@ class IgnoreManager:
             await self._config.guild_from_id(gid).ignored.clear()
 
 
+class AccessLists(NamedTuple):
+    """The allowlists and blocklists applying in a guild (or in DMs), ready to be checked.
+
+    The guild lists never contain the guild's ID (the ID of its default role),
+    so a guild whitelist may be empty while still being in use.
+    """
+
+    global_whitelist: FrozenSet[int]
+    global_blacklist: FrozenSet[int]
+    #: ``None`` if the guild doesn't use a whitelist.
+    guild_whitelist: Optional[FrozenSet[int]]
+    guild_blacklist: FrozenSet[int]
+    #: Whether all of the lists are empty, i.e. everyone is allowed.
+    unrestricted: bool
+
+
 class WhitelistBlacklistManager:
     def __init__(self, config: Config):
         self._config: Config = config
         self._cached_whitelist: Dict[Optional[int], Set[int]] = {}
         self._cached_blacklist: Dict[Optional[int], Set[int]] = {}
+        self._access_lists: Dict[Optional[int], AccessLists] = {}
+        # Bumped whenever the lists change, so that lists compiled
+        # while a change happens don't get cached.
+        self._generation = 0
         # because of discord deletion
         # we now have sync and async access that may need to happen at the
         # same time.
         # blame discord for this.
         self._access_lock = asyncio.Lock()
+        config.add_change_listener(self._on_config_change)
+
+    def clear_cache(self) -> None:
+        """Drop every cached setting, so that it gets read from Config again."""
+        self._cached_whitelist.clear()
+        self._cached_blacklist.clear()
+        self._access_lists.clear()
+        self._generation += 1
+
+    def _on_config_change(self, change: ConfigChange) -> None:
+        if change.overlaps(Config.GLOBAL, "whitelist") or change.overlaps(
+            Config.GLOBAL, "blacklist"
+        ):
+            self._cached_whitelist.pop(None, None)
+            self._cached_blacklist.pop(None, None)
+            self._access_lists.clear()
+            self._generation += 1
+        elif change.overlaps(
+            Config.GUILD, *change.primary_key[:1], "whitelist"
+        ) or change.overlaps(Config.GUILD, *change.primary_key[:1], "blacklist"):
+            _drop_changed(self._cached_whitelist, change, Config.GUILD, "whitelist")
+            _drop_changed(self._cached_blacklist, change, Config.GUILD, "blacklist")
+            _drop_changed(self._access_lists, change, Config.GUILD)
+            self._generation += 1
+
+    def get_cached_access_lists(self, guild_id: Optional[int]) -> Optional[AccessLists]:
+        """Get the compiled lists for the given guild (or DMs), if they're cached.
+
+        This doesn't need awaiting, which makes it cheap enough to check every message.
+        Use `get_access_lists` if this returns ``None``.
+        """
+        return self._access_lists.get(guild_id)
+
+    async def get_access_lists(self, guild_id: Optional[int]) -> AccessLists:
+        """Get the compiled lists for the given guild (or DMs)."""
+        try:
+            return self._access_lists[guild_id]
+        except KeyError:
+            pass
+
+        generation = self._generation
+        global_whitelist = frozenset(await self.get_whitelist())
+        global_blacklist = frozenset(await self.get_blacklist())
+        whitelist: Set[int] = set()
+        blacklist: Set[int] = set()
+        if guild_id is not None:
+            guild = discord.Object(id=guild_id)
+            whitelist = await self.get_whitelist(guild)
+            blacklist = await self.get_blacklist(guild)
+        access_lists = AccessLists(
+            global_whitelist,
+            global_blacklist,
+            frozenset(whitelist - {guild_id}) if whitelist else None,
+            frozenset(blacklist - {guild_id}),
+            not (global_whitelist or global_blacklist or whitelist or blacklist),
+        )
+        if generation == self._generation:
+            self._access_lists[guild_id] = access_lists
+        return access_lists
 
     async def discord_deleted_user(self, user_id: int):
         async with self._access_lock:
@@ -401,6 +540,20 @@ class DisabledCogCache:
     def __init__(self, config: Config):
         self._config = config
         self._disable_map: Dict[str, Dict[int, bool]] = defaultdict(dict)
+        config.add_change_listener(self._on_config_change)
+
+    def clear_cache(self) -> None:
+        """Drop every cached setting, so that it gets read from Config again."""
+        self._disable_map.clear()
+
+    def _on_config_change(self, change: ConfigChange) -> None:
+        if not change.overlaps("COG_DISABLE_SETTINGS"):
+            return
+        # A change of the default (guild ID 0) applies to every guild.
+        if change.primary_key:
+            self._disable_map.pop(change.primary_key[0], None)
+        else:
+            self._disable_map.clear()
 
     async def cog_disabled_in_guild(self, cog_name: str, guild_id: int) -> bool:
         """
@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 import collections.abc
 import contextlib
+import functools
+import heapq
 import json
 import logging
 import os
@@ -17,11 +19,14 @@ from typing import (
     AsyncIterator,
     Awaitable,
     Callable,
+    Dict,
     Generator,
+    Generic,
     Iterable,
     Iterator,
     List,
     Optional,
+    Set,
     Union,
     TypeVar,
     TYPE_CHECKING,
@@ -33,7 +38,8 @@ import aiohttp
 import discord
 import pkg_resources
 from discord.ext.commands.converter import get_converter  # DEP-WARN
-from fuzzywuzzy import fuzz, process
+from fuzzywuzzy import fuzz
+from fuzzywuzzy.utils import full_process
 from rich.progress import ProgressColumn
 from rich.progress_bar import ProgressBar
 from red_commons.logging import VERBOSE, TRACE
@@ -50,6 +56,7 @@ main_log = logging.getLogger("red")
 
 __all__ = (
     "safe_delete",
+    "FuzzyIndex",
     "fuzzy_command_search",
     "format_fuzzy_results",
     "create_backup",
@@ -86,6 +93,130 @@ def _fuzzy_log_filter(record):
 
 logging.getLogger().addFilter(_fuzzy_log_filter)
 
+# Below this score cutoff, or for shorter queries, a choice can score
+# without sharing a single bigram with the query, so the prefilter isn't used.
+_FUZZY_PREFILTER_MIN_CUTOFF = 70
+_FUZZY_PREFILTER_MIN_LENGTH = 4
+
+
+def _fuzzy_bigrams(key: str) -> Set[str]:
+    grams = set()
+    for token in key.split():
+        token = f" {token} "
+        grams.update(token[i : i + 2] for i in range(len(token) - 1))
+    return grams
+
+
+class FuzzyIndex(Generic[_T]):
+    """A prebuilt index for fuzzy searches over a fixed set of choices.
+
+    The keys of the choices are normalized once, when the index is built.
+    Searches with a high enough ``score_cutoff`` only score the choices
+    sharing at least one character bigram with the query.
+    The index is never mutated after it's built, so `search`
+    can safely be run in a worker thread (see `search_async`).
+
+    Parameters
+    ----------
+    choices : Iterable[Tuple[_T, str]]
+        Pairs of the item to return and the string to match it by.
+
+    """
+
+    __slots__ = ("_items", "_keys", "_grams")
+
+    def __init__(self, choices: Iterable[Tuple[_T, str]]):
+        self._items: List[_T] = []
+        self._keys: List[str] = []
+        self._grams: Dict[str, List[int]] = collections.defaultdict(list)
+        for idx, (item, key) in enumerate(choices):
+            key = full_process(key, force_ascii=True)
+            self._items.append(item)
+            self._keys.append(key)
+            for gram in _fuzzy_bigrams(key):
+                self._grams[gram].append(idx)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 5,
+        scorer: Callable[..., int] = fuzz.WRatio,
+        score_cutoff: int = 0,
+    ) -> List[Tuple[_T, int]]:
+        """Find the best matches for the query.
+
+        Parameters
+        ----------
+        query : str
+            The string to search for.
+        limit : int
+            The maximum amount of matches to return.
+        scorer : Callable[..., int]
+            A ``fuzzywuzzy.fuzz`` scorer accepting the ``full_process`` keyword argument.
+        score_cutoff : int
+            The minimum score for a choice to match.
+
+        Returns
+        -------
+        List[Tuple[_T, int]]
+            Pairs of the matched item and its score, in order of decreasing score.
+
+        """
+        query = full_process(query, force_ascii=True)
+        if not query:
+            return []
+        if (
+            score_cutoff >= _FUZZY_PREFILTER_MIN_CUTOFF
+            and len(query) >= _FUZZY_PREFILTER_MIN_LENGTH
+        ):
+            candidates: Iterable[int] = set()
+            for gram in _fuzzy_bigrams(query):
+                candidates.update(self._grams.get(gram, ()))
+        else:
+            candidates = range(len(self._keys))
+
+        keys = self._keys
+        scored = []
+        for idx in candidates:
+            score = scorer(query, keys[idx], full_process=False)
+            if score >= score_cutoff:
+                scored.append((score, -idx))
+        return [(self._items[-neg_idx], score) for score, neg_idx in heapq.nlargest(limit, scored)]
+
+    async def search_async(self, query: str, **kwargs) -> List[Tuple[_T, int]]:
+        """Same as `search`, but the scoring is done in a worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self.search, query, **kwargs)
+        )
+
+    @classmethod
+    async def extract(
+        cls, query: str, choices: Iterable[Tuple[_T, str]], **kwargs
+    ) -> List[Tuple[_T, int]]:
+        """Build a one-off index and search it, both in a worker thread.
+
+        Takes the same keyword arguments as `search`.
+        """
+
+        def build_and_search():
+            return cls(choices).search(query, **kwargs)
+
+        return await asyncio.get_running_loop().run_in_executor(None, build_and_search)
+
+
+def _get_command_fuzzy_index(bot: Red) -> FuzzyIndex[Command]:
+    # Invalidated by the bot whenever a command or cog is added or removed.
+    index = bot._command_fuzzy_index
+    if index is None:
+        index = bot._command_fuzzy_index = FuzzyIndex(
+            (command, command.qualified_name) for command in set(bot.walk_commands())
+        )
+    return index
+
 
 async def fuzzy_command_search(
     ctx: Context,
@@ -149,23 +280,22 @@ async def fuzzy_command_search(
             return None
 
     if commands is None:
-        choices = set(ctx.bot.walk_commands())
-    elif isinstance(commands, collections.abc.AsyncIterator):
-        choices = {c async for c in commands}
+        index = _get_command_fuzzy_index(ctx.bot)
     else:
-        choices = set(commands)
+        if isinstance(commands, collections.abc.AsyncIterator):
+            choices = {c async for c in commands}
+        else:
+            choices = set(commands)
+        index = FuzzyIndex((c, c.qualified_name) for c in choices)
 
     # Do the scoring. `extracted` is a list of tuples in the form `(command, score)`
-    extracted = process.extract(term, choices, limit=5, scorer=fuzz.QRatio)
+    extracted = await index.search_async(term, limit=5, scorer=fuzz.QRatio, score_cutoff=min_score)
     if not extracted:
         return None
 
     # Filter through the fuzzy-matched commands.
     matched_commands = []
     for command, score in extracted:
-        if score < min_score:
-            # Since the list is in decreasing order of score, we can exit early.
-            break
         if await command.can_see(ctx):
             matched_commands.append(command)
 
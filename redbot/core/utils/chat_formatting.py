@@ -2,7 +2,7 @@ import datetime
 import itertools
 import textwrap
 from io import BytesIO
-from typing import Iterator, List, Optional, Sequence, SupportsInt, Union
+from typing import Iterable, Iterator, List, Optional, Sequence, SupportsInt, Union
 
 import discord
 from babel.lists import format_list as babel_list
@@ -266,7 +266,7 @@ def bordered(*columns: Sequence[str], ascii_border: bool = False) -> str:
 
 
 def pagify(
-    text: str,
+    text: Union[str, Iterable[str]],
     delims: Sequence[str] = ["\n"],
     *,
     priority: bool = False,
@@ -276,14 +276,17 @@ def pagify(
 ) -> Iterator[str]:
     """Generate multiple pages from the given text.
 
+    The text is walked once using offsets, so this is suitable for very large inputs.
+
     Note
     ----
     This does not respect code blocks or inline code.
 
     Parameters
     ----------
-    text : str
-        The content to pagify and send.
+    text : Union[str, Iterable[str]]
+        The content to pagify and send. This may also be an iterable of chunks
+        of text (e.g. lines of a file), which will be consumed lazily.
     delims : `sequence` of `str`, optional
         Characters where page breaks will occur. If no delimiters are found
         in a page, the page will break after ``page_length`` characters.
@@ -309,28 +312,54 @@ def pagify(
         Pages of the given text.
 
     """
-    in_text = text
+    if isinstance(text, str):
+        in_text = text
+        chunks = None
+    else:
+        in_text = ""
+        chunks = iter(text)
+    start = 0
     page_length -= shorten_by
-    while len(in_text) > page_length:
-        this_page_len = page_length
+    while True:
+        if chunks is not None and len(in_text) - start <= page_length:
+            # Only the unconsumed remainder (shorter than a page) is copied here,
+            # so the total amount of copying stays linear in the size of the input.
+            pending = [in_text[start:]]
+            pending_len = len(pending[0])
+            for chunk in chunks:
+                pending.append(chunk)
+                pending_len += len(chunk)
+                if pending_len > page_length:
+                    break
+            else:
+                chunks = None
+            in_text = "".join(pending)
+            start = 0
+
+        if len(in_text) - start <= page_length:
+            break
+
+        end = start + page_length
+        this_page_end = end
         if escape_mass_mentions:
-            this_page_len -= in_text.count("@here", 0, page_length) + in_text.count(
-                "@everyone", 0, page_length
+            this_page_end -= in_text.count("@here", start, end) + in_text.count(
+                "@everyone", start, end
             )
-        closest_delim = (in_text.rfind(d, 1, this_page_len) for d in delims)
+        closest_delim = (in_text.rfind(d, start + 1, this_page_end) for d in delims)
         if priority:
-            closest_delim = next((x for x in closest_delim if x > 0), -1)
+            closest_delim = next((x for x in closest_delim if x > start), -1)
         else:
             closest_delim = max(closest_delim)
-        closest_delim = closest_delim if closest_delim != -1 else this_page_len
+        closest_delim = closest_delim if closest_delim != -1 else this_page_end
         if escape_mass_mentions:
-            to_send = escape(in_text[:closest_delim], mass_mentions=True)
+            to_send = escape(in_text[start:closest_delim], mass_mentions=True)
         else:
-            to_send = in_text[:closest_delim]
+            to_send = in_text[start:closest_delim]
         if len(to_send.strip()) > 0:
             yield to_send
-        in_text = in_text[closest_delim:]
+        start = closest_delim
 
+    in_text = in_text[start:]
     if len(in_text.strip()) > 0:
         if escape_mass_mentions:
             yield escape(in_text, mass_mentions=True)
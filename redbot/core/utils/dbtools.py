@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
+import asyncio
+import queue
+import threading
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import Generator, Union
+from typing import Any, Callable, Generator, Iterable, List, NamedTuple, Optional, Union
 
 import apsw
 
-__all__ = ["APSWConnectionWrapper"]
+__all__ = ["APSWConnectionWrapper", "ThreadedAPSWConnection"]
 
 
 # TODO (mikeshardmind): make this inherit typing_extensions.Protocol
@@ -58,4 +61,165 @@ class APSWConnectionWrapper(apsw.Connection, ContextManagerMixin):
         super().__init__(str(filename), *args, **kwargs)
 
 
-# TODO (mikeshardmind): asyncio friendly ThreadedAPSWConnection class
+class _Request(NamedTuple):
+    write: bool
+    func: Callable[..., Any]
+    args: tuple
+    future: asyncio.Future
+    loop: asyncio.AbstractEventLoop
+
+
+_STOP = object()
+
+
+def _set_future(future: asyncio.Future, result: Any, exc: Optional[BaseException]) -> None:
+    if future.cancelled():
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+
+class ThreadedAPSWConnection:
+    """
+    An asyncio friendly apsw connection.
+
+    Every statement runs on a single thread owned by the connection,
+    in the order they were submitted, and awaiting one never blocks the event loop.
+    Writes made with `execute` and `executemany` always run in a transaction,
+    consecutive ones are committed together but each of them is atomic,
+    and since all of them go through the same connection,
+    apsw's statement cache prepares each statement only once.
+    """
+
+    def __init__(
+        self, filename: Union[Path, str], *args, max_batch_size: int = 1000, **kwargs
+    ) -> None:
+        self.connection = APSWConnectionWrapper(filename, *args, **kwargs)
+        self._cursor = self.connection.cursor()
+        self._max_batch_size = max_batch_size
+        self._requests: queue.SimpleQueue = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"apsw-{Path(filename).name}", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """
+        Closes the connection once every statement submitted so far has run.
+        """
+        if not self._closed:
+            self._closed = True
+            self._requests.put(_STOP)
+
+    async def execute(
+        self, statement: str, values: Any = None, *, transaction: bool = True
+    ) -> None:
+        """
+        Runs a statement which doesn't return rows.
+
+        If ``transaction`` is ``False``, the statement isn't grouped with other writes,
+        this is needed by statements which can't run in a transaction,
+        e.g. ``PRAGMA journal_mode``.
+        """
+        await self._submit(transaction, self._execute, statement, values)
+
+    async def executemany(self, statement: str, sequenceofbindings: Iterable[Any]) -> None:
+        """
+        Runs a statement once for each of the given bindings.
+        """
+        await self._submit(True, self._executemany, statement, list(sequenceofbindings))
+
+    async def fetchone(self, statement: str, values: Any = None) -> Optional[tuple]:
+        """
+        Runs a query and returns its first row, or ``None`` if there are none.
+        """
+        return await self._submit(False, self._fetchone, statement, values)
+
+    async def fetchall(self, statement: str, values: Any = None) -> List[tuple]:
+        """
+        Runs a query and returns all of its rows.
+        """
+        return await self._submit(False, self._fetchall, statement, values)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Calls ``func(*args)`` on the connection's thread, e.g. to use `connection`
+        for work which doesn't fit the other methods, and returns its result.
+        """
+        return await self._submit(False, func, *args)
+
+    def _submit(self, write: bool, func: Callable[..., Any], *args: Any) -> asyncio.Future:
+        if self._closed:
+            raise apsw.ConnectionClosedError("The connection has been closed.")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._requests.put(_Request(write, func, args, future, loop))
+        return future
+
+    def _execute(self, statement: str, values: Any) -> None:
+        self._cursor.execute(statement, values)
+
+    def _executemany(self, statement: str, sequenceofbindings: List[Any]) -> None:
+        if sequenceofbindings:
+            self._cursor.executemany(statement, sequenceofbindings)
+
+    def _fetchone(self, statement: str, values: Any) -> Optional[tuple]:
+        return self._cursor.execute(statement, values).fetchone()
+
+    def _fetchall(self, statement: str, values: Any) -> List[tuple]:
+        return self._cursor.execute(statement, values).fetchall()
+
+    def _run(self) -> None:
+        next_request = None
+        while True:
+            request = next_request or self._requests.get()
+            next_request = None
+            if request is _STOP:
+                break
+            if not request.write:
+                self._process([request], transaction=False)
+                continue
+            batch = [request]
+            while len(batch) < self._max_batch_size:
+                try:
+                    next_request = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if next_request is _STOP or not next_request.write:
+                    break
+                batch.append(next_request)
+                next_request = None
+            self._process(batch, transaction=True)
+        with suppress(Exception):
+            self.connection.close()
+
+    def _process(self, batch: List[_Request], *, transaction: bool) -> None:
+        results = []
+        try:
+            if transaction:
+                self._cursor.execute("BEGIN TRANSACTION")
+            for request in batch:
+                if transaction:
+                    # Each write is applied as a whole or not at all, even in a batch.
+                    self._cursor.execute("SAVEPOINT request")
+                try:
+                    results.append((request.func(*request.args), None))
+                except Exception as exc:
+                    if transaction:
+                        self._cursor.execute("ROLLBACK TO request")
+                    results.append((None, exc))
+                if transaction:
+                    self._cursor.execute("RELEASE request")
+            if transaction:
+                self._cursor.execute("COMMIT TRANSACTION")
+        except Exception as exc:
+            if transaction:
+                with suppress(Exception):
+                    self._cursor.execute("ROLLBACK TRANSACTION")
+            results = [(None, exc)] * len(batch)
+        for request, (result, exc) in zip(batch, results):
+            with suppress(RuntimeError):  # The event loop has been closed.
+                request.loop.call_soon_threadsafe(_set_future, request.future, result, exc)
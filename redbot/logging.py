@@ -1,6 +1,10 @@
 import argparse
+import atexit
+import copy
+import json
 import logging.handlers
 import pathlib
+import queue
 import re
 import sys
 
@@ -35,6 +39,13 @@ from rich.traceback import PathHighlighter, Traceback
 
 
 MAX_OLD_LOGS = 8
+#: The maximum amount of log records waiting to be handled by the logging thread.
+LOG_QUEUE_SIZE = 10_000
+#: How long a ``WARNING`` or more severe record waits for room in a full queue, in seconds.
+LOG_QUEUE_PUT_TIMEOUT = 5
+
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_queue_listener: Optional["BoundedQueueListener"] = None
 
 
 class RotatingFileHandler(logging.handlers.RotatingFileHandler):
@@ -127,6 +138,85 @@ class RotatingFileHandler(logging.handlers.RotatingFileHandler):
         self.stream = self._open()
 
 
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler used to move log handling off the calling thread.
+
+    When the queue is full, records below ``WARNING`` are dropped,
+    while more severe records block the calling thread until there's room,
+    for up to `LOG_QUEUE_PUT_TIMEOUT` seconds before they're dropped too.
+    A warning with the count of dropped records is logged once the queue
+    is less than half full again.
+
+    Unlike the stdlib handler, records are not formatted before being queued,
+    so that the handlers on the other side can still use ``exc_info``.
+    """
+
+    def __init__(self, queue_: "queue.Queue[LogRecord]") -> None:
+        super().__init__(queue_)
+        self.dropped = 0
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        record = copy.copy(record)
+        # Merge the args now, they may be mutated before the logging thread gets to them.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: LogRecord) -> None:
+        if self.dropped and self.queue.qsize() < self.queue.maxsize // 2:
+            notice = logging.LogRecord(
+                "red.logging",
+                logging.WARNING,
+                __file__,
+                0,
+                f"{self.dropped} log records were dropped because the logging queue was full.",
+                None,
+                None,
+            )
+            try:
+                self.queue.put_nowait(notice)
+            except queue.Full:
+                # Other threads filled the queue in the meantime, report it next time.
+                pass
+            else:
+                self.dropped = 0
+        try:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=LOG_QUEUE_PUT_TIMEOUT)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BoundedQueueListener(logging.handlers.QueueListener):
+    """Queue listener which waits for room in a full queue when stopping."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats log records as single-line JSON objects."""
+
+    def format(self, record: LogRecord) -> str:
+        data = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc_info"] = record.exc_text
+        if record.stack_info:
+            data["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
 SYNTAX_THEME = {
     Token: Style(),
     Comment: Style(color="bright_black"),
@@ -341,7 +431,6 @@ def init_logging(level: int, location: pathlib.Path, cli_flags: argparse.Namespa
         stdout_handler = logging.StreamHandler(sys.stdout)
         stdout_handler.setFormatter(file_formatter)
 
-    root_logger.addHandler(stdout_handler)
     logging.captureWarnings(True)
 
     if not location.exists():
@@ -379,6 +468,37 @@ def init_logging(level: int, location: pathlib.Path, cli_flags: argparse.Namespa
         encoding="utf-8",
     )
 
+    if getattr(cli_flags, "json_logs", False):
+        file_formatter = JSONFormatter()
     for fhandler in (latest_fhandler, all_fhandler):
         fhandler.setFormatter(file_formatter)
-        root_logger.addHandler(fhandler)
+
+    # Rendering and file writes (including rollovers) happen in the listener's thread,
+    # so that logging doesn't block the event loop.
+    global _queue_handler, _queue_listener
+    log_queue: "queue.Queue[LogRecord]" = queue.Queue(LOG_QUEUE_SIZE)
+    _queue_handler = BoundedQueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+    _queue_listener = BoundedQueueListener(
+        log_queue, stdout_handler, latest_fhandler, all_fhandler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Handle all queued log records and stop the logging thread.
+
+    Records logged after this are handled synchronously by the calling thread.
+    """
+    global _queue_handler, _queue_listener
+    listener, _queue_listener = _queue_listener, None
+    if listener is None:
+        return
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(_queue_handler)
+    _queue_handler = None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+        root_logger.addHandler(handler)
@@ -0,0 +1,15 @@
+import functools
+import shutil
+import tempfile
+
+from redbot.core import data_manager
+
+
+def pytest_configure(config):
+    # Importing the Audio cog resolves its data path, which needs a basic config,
+    # before any of the fixtures that usually set one up have run.
+    data_path = tempfile.mkdtemp()
+    config.add_cleanup(functools.partial(shutil.rmtree, data_path, ignore_errors=True))
+    basic_config = data_manager.basic_config_default.copy()
+    basic_config["DATA_PATH"] = data_path
+    data_manager.basic_config = basic_config
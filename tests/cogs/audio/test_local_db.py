@@ -0,0 +1,184 @@
+import json
+import random
+import time
+
+import pytest
+
+from redbot.cogs.audio.apis.local_db import LavalinkTableWrapper, LocalCacheWrapper
+from redbot.core.utils.dbtools import ThreadedAPSWConnection
+
+CACHE_SIZE = 1_000_000
+DAY = 86400
+
+
+@pytest.fixture()
+async def lavalink_table(config, tmp_path):
+    config.register_global(cache_age=365)
+    conn = ThreadedAPSWConnection(tmp_path / "Audio.db")
+    table = LavalinkTableWrapper(None, config, conn, None)
+    await table.init()
+    now = int(time.time())
+    data = json.dumps({"loadType": "TRACK_LOADED", "playlistInfo": {}, "tracks": []})
+
+    def populate(connection):
+        # One in a thousand queries was fetched in the past week.
+        with connection.transaction() as transaction:
+            transaction.executemany(
+                "INSERT INTO lavalink VALUES (?, ?, ?, ?)",
+                (
+                    (f"query {i}", data, now, now if i % 1000 == 0 else now - 30 * DAY)
+                    for i in range(CACHE_SIZE)
+                ),
+            )
+
+    await conn.run(populate, conn.connection)
+    yield table
+    conn.close()
+
+
+@pytest.fixture()
+async def small_lavalink_table(config, tmp_path):
+    config.register_global(cache_age=365)
+    conn = ThreadedAPSWConnection(tmp_path / "Audio.db")
+    table = LavalinkTableWrapper(None, config, conn, None)
+    await table.init()
+    now = int(time.time())
+    # Only the even queries were fetched in the past week.
+    await conn.executemany(
+        "INSERT INTO lavalink VALUES (?, ?, ?, ?)",
+        [
+            (f"query {i}", json.dumps({"query": i}), now, now if i % 2 == 0 else now - 30 * DAY)
+            for i in range(10)
+        ],
+    )
+    yield table
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_lavalink_fetch_many(small_lavalink_table):
+    results = await small_lavalink_table.fetch_many(["query 1", "query 3", "missing query"])
+    assert {query: result.query for query, result in results.items()} == {
+        "query 1": {"query": 1},
+        "query 3": {"query": 3},
+    }
+    assert await small_lavalink_table.fetch_many([]) == {}
+
+
+@pytest.mark.asyncio
+async def test_lavalink_prefetch(small_lavalink_table):
+    await small_lavalink_table.prefetch(["query 0", "missing query"])
+    assert list(small_lavalink_table._prefetched) == ["query 0"]
+
+    await small_lavalink_table.database.execute("DELETE FROM lavalink WHERE query = 'query 0'")
+    # The prefetched entry is used once, without querying the table.
+    assert (await small_lavalink_table.fetch_one({"query": "query 0"}))[0] == {"query": 0}
+    assert not small_lavalink_table._prefetched
+    assert (await small_lavalink_table.fetch_one({"query": "query 0"}))[0] is None
+
+
+@pytest.mark.asyncio
+async def test_lavalink_fetch_random(small_lavalink_table):
+    now = int(time.time())
+    values = {"day": now - 7 * DAY, "maxage": now - 365 * DAY}
+
+    picks = [await small_lavalink_table.fetch_random(dict(values)) for __ in range(5)]
+    # Every recently fetched entry is picked once before the pool is refilled.
+    assert sorted(pick["query"] for pick in picks) == [0, 2, 4, 6, 8]
+
+    await small_lavalink_table.fetch_random(dict(values))
+    await small_lavalink_table.database.execute(
+        "INSERT INTO lavalink VALUES (?, ?, ?, ?)",
+        ("query 10", json.dumps({"query": 10}), now, now),
+    )
+    await small_lavalink_table.database.execute("DELETE FROM lavalink WHERE query != 'query 10'")
+    # The rest of the pool is stale, so it's refilled instead of giving up.
+    assert await small_lavalink_table.fetch_random(dict(values)) == {"query": 10}
+
+    await small_lavalink_table.database.execute("DELETE FROM lavalink")
+    assert await small_lavalink_table.fetch_random(dict(values)) is None
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_lavalink_fetch_many_benchmark(lavalink_table):
+    queries = [f"query {random.randrange(CACHE_SIZE * 2)}" for __ in range(500)]
+
+    start = time.perf_counter()
+    for query in queries:
+        await lavalink_table.fetch_one({"query": query})
+    one_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = await lavalink_table.fetch_many(queries)
+    many_elapsed = time.perf_counter() - start
+
+    assert set(results) == {query for query in queries if int(query[6:]) < CACHE_SIZE}
+    assert many_elapsed < one_elapsed
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_lavalink_fetch_random_benchmark(lavalink_table):
+    now = int(time.time())
+    values = {"day": now - 7 * DAY, "maxage": now - 365 * DAY}
+    count = 300
+
+    start = time.perf_counter()
+    picks = [await lavalink_table.fetch_random(dict(values)) for __ in range(count)]
+    elapsed = time.perf_counter() - start
+
+    assert all(
+        pick == {"loadType": "TRACK_LOADED", "playlistInfo": {}, "tracks": []} for pick in picks
+    )
+    assert elapsed / count < 0.01
+
+
+@pytest.mark.asyncio
+async def test_lavalink_evict(config, tmp_path):
+    config.register_global(cache_age=365)
+    conn = ThreadedAPSWConnection(tmp_path / "Audio.db")
+    table = LavalinkTableWrapper(None, config, conn, None)
+    await table.init()
+    now = int(time.time())
+    await conn.executemany(
+        "INSERT INTO lavalink VALUES (?, ?, ?, ?)",
+        [(f"query {i}", "{}", now, now - i) for i in range(10)],
+    )
+
+    assert await table.evict(20) == 0
+    assert await table.evict(6) == 4
+    assert await table.count() == 6
+    # The least recently fetched queries are gone.
+    assert (await table.fetch_one({"query": "query 9"}))[0] is None
+    assert (await table.fetch_one({"query": "query 0"}))[0] == {}
+    assert table.stats == {"evictions": 4, "hits": 1, "misses": 1}
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_run_maintenance(config, tmp_path):
+    config.register_global(cache_age=365)
+    conn = ThreadedAPSWConnection(tmp_path / "Audio.db")
+    cache = LocalCacheWrapper(None, config, conn, None)
+    for table in cache.tables.values():
+        await table.init()
+    now = int(time.time())
+    await conn.executemany(
+        "INSERT INTO lavalink VALUES (?, ?, ?, ?)",
+        [(f"query {i}", "{}", now, now - i) for i in range(10)],
+    )
+    # Older than the cache's maximum age.
+    await conn.execute(
+        "INSERT INTO lavalink VALUES (?, ?, ?, ?)", ("expired", "{}", now - 400 * DAY, now)
+    )
+
+    assert await cache.run_maintenance(6) == {"lavalink": 4, "spotify": 0, "youtube": 0}
+    assert await cache.lavalink.count() == 6
+    assert (await cache.lavalink.fetch_one({"query": "query 5"}))[0] == {}
+    # The database was switched to incremental vacuuming.
+    assert await conn.fetchone("PRAGMA auto_vacuum") == (2,)
+    # No limit.
+    assert await cache.run_maintenance(0) == {"lavalink": 0, "spotify": 0, "youtube": 0}
+    assert await cache.lavalink.count() == 6
+    conn.close()
@@ -0,0 +1,67 @@
+import random
+from types import SimpleNamespace
+
+import lavalink
+
+from redbot.cogs.audio.utils import IndexedQueue
+
+
+def _track(i, requester, *, uri=None, length=1000, is_stream=False):
+    track = lavalink.Track(
+        {
+            "track": f"track {i}",
+            "info": {
+                "uri": uri or f"https://example.com/{i}",
+                "length": length,
+                "isStream": is_stream,
+            },
+        }
+    )
+    track.requester = SimpleNamespace(id=requester)
+    return track
+
+
+def _check_index(queue):
+    expected = IndexedQueue(list(queue))
+    assert queue.requesters == expected.requesters
+    assert queue.uris == expected.uris
+    assert queue.identifiers == expected.identifiers
+    assert queue.duration == expected.duration
+
+
+def test_indexed_queue():
+    queue = IndexedQueue(_track(i, i % 3) for i in range(10))
+    queue.append(_track(10, 3, is_stream=True))
+    queue.insert(0, queue.pop(5))
+    queue.extend([_track(11, 4), _track(12, 4)])
+    queue.remove(_track(2, 0))
+    queue[1] = _track(13, 5)
+    del queue[2:4]
+    queue += [_track(14, 6)]
+    random.shuffle(queue)
+    _check_index(queue)
+    assert _track(14, 0) in queue
+    assert _track(2, 0) not in queue
+
+    version = queue.version
+    queue.clear()
+    assert not queue.requesters and not queue.identifiers and queue.duration == 0
+    assert queue.version > version
+
+
+def test_indexed_queue_remove():
+    queue = IndexedQueue(_track(i, i % 3) for i in range(10))
+    queue.append(_track(10, 3, uri="https://example.com/1"))
+
+    version = queue.version
+    assert queue.remove_requesters({42}) == []
+    assert queue.remove_uri("https://example.com/42") == []
+    assert queue.version == version
+
+    removed = queue.remove_requesters({0, 42})
+    assert [t.track_identifier for t in removed] == ["track 0", "track 3", "track 6", "track 9"]
+    removed = queue.remove_uri("https://example.com/1")
+    assert [t.track_identifier for t in removed] == ["track 1", "track 10"]
+    assert queue.remove_identifier("track 5")[0].track_identifier == "track 5"
+    assert [t.track_identifier for t in queue] == ["track 2", "track 4", "track 7", "track 8"]
+    _check_index(queue)
@@ -1,4 +1,7 @@
-from redbot.cogs.permissions.permissions import Permissions, GLOBAL
+import pytest
+
+from redbot.cogs.permissions.permissions import Permissions, GLOBAL, COG, COMMAND
+from redbot.pytest.permissions import *
 
 
 def test_schema_update():
@@ -64,3 +67,22 @@ def test_schema_update():
             },
         },
     )
+
+
+@pytest.mark.asyncio
+async def test_set_acl(permissions):
+    await permissions._set_acl(
+        {COMMAND: {"ping": {1234: True, "default": False}}}, guild_id=42, update=False
+    )
+    await permissions._set_acl({COG: {"General": {5678: False}}}, guild_id=42, update=True)
+    assert await permissions.config.custom(COMMAND).all() == {
+        "ping": {"42": {"1234": True, "default": False}}
+    }
+    assert await permissions.config.custom(COG).all() == {"General": {"42": {"5678": False}}}
+
+    await permissions._set_acl({COG: {"Admin": {1234: True}}}, guild_id=42, update=False)
+    assert await permissions.config.custom(COMMAND).all() == {"ping": {}}
+    assert await permissions.config.custom(COG).all() == {
+        "General": {},
+        "Admin": {"42": {"1234": True}},
+    }
@@ -19,6 +19,21 @@ def event_loop(request):
     loop.close()
 
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: timing-dependent test, only run if RED_BENCHMARKS is set"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.getenv("RED_BENCHMARKS"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="set RED_BENCHMARKS to run benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 def _get_backend_type():
     if os.getenv("RED_STORAGE_TYPE") == "postgres":
         return drivers.BackendType.POSTGRES
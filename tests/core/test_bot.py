@@ -0,0 +1,93 @@
+import time
+from collections import namedtuple
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import discord
+import pytest
+
+
+MockGuild = namedtuple("Guild", "id owner_id me")
+
+
+def _member(member_id, guild, roles):
+    # namedtuple fields can't start with an underscore.
+    return SimpleNamespace(id=member_id, guild=guild, _roles=roles, bot=False)
+
+
+def _guild_with_roles(role_count):
+    guild = MockGuild(1, 2, None)
+    roles = list(range(100, 100 + role_count))
+    return guild, _member(3, guild, roles)
+
+
+@pytest.mark.asyncio
+async def test_allowed_by_whitelist_blacklist(red):
+    guild, member = _guild_with_roles(5)
+    assert await red.allowed_by_whitelist_blacklist(member)
+
+    await red.add_to_blacklist([104], guild=guild)
+    assert not await red.allowed_by_whitelist_blacklist(member)
+    assert await red.allowed_by_whitelist_blacklist(who_id=member.id, guild=guild, role_ids=[1])
+
+    await red.clear_blacklist(guild)
+    # The default role (same ID as the guild) can't be used to list everyone.
+    await red.add_to_whitelist([guild.id], guild=guild)
+    assert not await red.allowed_by_whitelist_blacklist(member)
+    await red.add_to_whitelist([member.id], guild=guild)
+    assert await red.allowed_by_whitelist_blacklist(member)
+    assert await red.allowed_by_whitelist_blacklist(_member(2, guild, []))
+
+    await red.add_to_blacklist([member.id])
+    assert not await red.allowed_by_whitelist_blacklist(member)
+    await red.add_to_whitelist([5])
+    await red.remove_from_blacklist([member.id])
+    assert not await red.allowed_by_whitelist_blacklist(member)
+    await red.clear_whitelist()
+    assert await red.allowed_by_whitelist_blacklist(member)
+
+
+async def _listed_guild(red, listed):
+    guild, member = _guild_with_roles(500)
+    if listed:
+        await red.add_to_blacklist([1000], guild=guild)
+        await red.add_to_blacklist([4])
+    channel = MagicMock(spec=discord.TextChannel)
+    return member, MagicMock(author=member, guild=guild, channel=channel)
+
+
+@pytest.mark.parametrize("listed", [False, True])
+@pytest.mark.asyncio
+async def test_message_eligibility(red, listed):
+    member, message = await _listed_guild(red, listed)
+
+    with patch("redbot.core.bot.can_user_send_messages_in", return_value=True):
+        assert await red.message_eligible_as_command(message)
+    assert await red.allowed_by_whitelist_blacklist(member)
+
+    await red.add_to_blacklist([599], guild=message.guild)
+    with patch("redbot.core.bot.can_user_send_messages_in", return_value=True):
+        assert not await red.message_eligible_as_command(message)
+    assert not await red.allowed_by_whitelist_blacklist(member)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("listed", [False, True])
+@pytest.mark.asyncio
+async def test_message_eligibility_benchmark(red, listed):
+    member, message = await _listed_guild(red, listed)
+    count = 10_000
+
+    with patch("redbot.core.bot.can_user_send_messages_in", return_value=True):
+        start = time.perf_counter()
+        for __ in range(count):
+            await red.message_eligible_as_command(message)
+        eligible_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for __ in range(count):
+        await red.allowed_by_whitelist_blacklist(member)
+    allowed_elapsed = time.perf_counter() - start
+
+    assert eligible_elapsed / count < 0.001
+    assert allowed_elapsed / count < 0.001
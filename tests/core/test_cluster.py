@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from redbot.core import _cluster
+from redbot.core._cluster import (
+    ClusterBus,
+    _ClusterHub,
+    _readline,
+    _shard_ranges,
+    _strip_cluster_args,
+)
+
+
+def test_shard_ranges():
+    assert _shard_ranges(10, 3) == [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    assert _shard_ranges(2, 2) == [[0], [1]]
+
+
+def test_strip_cluster_args():
+    argv = ["instance", "--cluster-workers", "3", "--shard-count=8", "--dev"]
+    assert _strip_cluster_args(argv) == ["instance", "--dev"]
+
+
+@pytest.mark.asyncio
+async def test_cluster_bus_relays_to_other_workers():
+    hub = _ClusterHub("token")
+    host, __, port = (await hub.start()).rpartition(":")
+    buses = [ClusterBus(i, host, int(port), "token") for i in range(3)]
+    intruder = ClusterBus(3, host, int(port), "wrong token")
+    received = []
+
+    for bus in buses:
+
+        async def listener(data, bus=bus):
+            received.append((bus.cluster_id, data))
+            # Not relayed, as this is handling an event from another worker.
+            bus.publish("event", "echo")
+
+        bus.add_listener("event", listener)
+        await bus.connect()
+    await intruder.connect()
+
+    intruder.publish("event", "intrusion")
+    buses[0].publish("event", {"foo": "bar"})
+    await asyncio.sleep(0.2)
+
+    assert sorted(received) == [(1, {"foo": "bar"}), (2, {"foo": "bar"})]
+    for bus in (*buses, intruder):
+        await bus.close()
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_readline_skips_oversized_lines():
+    reader = asyncio.StreamReader(limit=16)
+    reader.feed_data(b"first\n" + b"x" * 20 + b"\nsecond\n")
+    reader.feed_data(b"y" * 50)
+    reader.feed_data(b"y" * 50 + b"\nthird")
+    reader.feed_eof()
+
+    assert await _readline(reader) == b"first\n"
+    assert await _readline(reader) == b"second\n"
+    assert await _readline(reader) == b"third"
+    assert await _readline(reader) == b""
+
+
+@pytest.mark.asyncio
+async def test_cluster_hub_survives_oversized_events(monkeypatch):
+    monkeypatch.setattr(_cluster, "_LINE_LIMIT", 1024)
+    hub = _ClusterHub("token")
+    host, __, port = (await hub.start()).rpartition(":")
+    buses = [ClusterBus(i, host, int(port), "token") for i in range(2)]
+    received = []
+
+    async def listener(data):
+        received.append(data)
+
+    buses[1].add_listener("event", listener)
+    for bus in buses:
+        await bus.connect()
+
+    buses[0].publish("event", "x" * 2048)
+    buses[0].publish("event", "small")
+    await asyncio.sleep(0.2)
+
+    assert received == ["small"]
+    for bus in buses:
+        await bus.close()
+    await hub.close()
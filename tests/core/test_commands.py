@@ -65,3 +65,53 @@ def test_converter_relativedelta():
     assert converter.parse_relativedelta("1 year 10 days 3 seconds") == relativedelta(
         years=1, days=10, seconds=3
     )
+
+
+def test_help_cache_lru_and_invalidation():
+    cache = commands.help._HelpCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    # "b" was the least recently used entry
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    cache.invalidate()
+    assert cache.get("a") is None
+
+
+def test_help_cache_ttl():
+    cache = commands.help._HelpCache(ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_requires_rules_revision(group):
+    revision = commands.Requires._rules_revision
+    group.requires.set_rule(1234, commands.PermState.ACTIVE_ALLOW, guild_id=5678)
+    assert commands.Requires._rules_revision > revision
+    revision = commands.Requires._rules_revision
+    group.requires.clear_all_rules(5678)
+    assert commands.Requires._rules_revision > revision
+
+
+def test_requires_compiled_rule_ids(group):
+    requires = group.requires
+    requires.set_rule(1234, commands.PermState.ACTIVE_DENY, guild_id=5678)
+    requires.set_rule(requires.DEFAULT, commands.PermState.ACTIVE_ALLOW, guild_id=5678)
+    requires.set_rule(4321, commands.PermState.ACTIVE_ALLOW, guild_id=requires.GLOBAL)
+    assert requires._guild_rule_ids[5678] == {1234}
+    assert requires._global_rule_ids == {4321}
+
+    requires.set_rule(1234, commands.PermState.NORMAL, guild_id=5678)
+    assert requires._guild_rule_ids[5678] == set()
+
+    requires.set_rule(1234, commands.PermState.ACTIVE_DENY, guild_id=5678)
+    requires.clear_all_rules(5678)
+    assert requires._guild_rule_ids[5678] == set()
+    assert requires.get_rule(requires.DEFAULT, 5678) is commands.PermState.ACTIVE_ALLOW
+
+    requires.reset()
+    assert not requires._guild_rule_ids
+    assert not requires._global_rule_ids
@@ -1,4 +1,6 @@
 import asyncio
+import os
+import time
 from unittest.mock import patch
 import pytest
 
@@ -660,3 +662,172 @@ async def test_config_custom_partial_pkeys_set(config, pkeys, raw_args, result):
     group = config.custom("TEST", *pkeys)
     await group.set_raw(*raw_args, value=result)
     assert await group.get_raw(*raw_args) == result
+
+
+@pytest.mark.asyncio
+async def test_config_cache_hits_and_invalidation(config, empty_guild):
+    config.register_guild(foo=0, bar={"baz": []})
+    cache = config.enable_cache()
+
+    assert await config.guild(empty_guild).foo() == 0
+    assert await config.guild(empty_guild).foo() == 0
+    assert cache.hits == 1
+
+    await config.guild(empty_guild).foo.set(1)
+    assert await config.guild(empty_guild).foo() == 1
+    assert (await config.guild(empty_guild).all())["foo"] == 1
+
+    # Writes to a group invalidate reads of its members, and vice versa.
+    await config.guild(empty_guild).set_raw("bar", value={"baz": [1]})
+    assert await config.guild(empty_guild).bar.baz() == [1]
+    await config.guild(empty_guild).bar.baz.set([2])
+    assert (await config.guild(empty_guild).all())["bar"] == {"baz": [2]}
+    await config.guild(empty_guild).clear()
+    assert await config.guild(empty_guild).bar.baz() == []
+    assert await config.guild(empty_guild).foo() == 0
+
+
+@pytest.mark.asyncio
+async def test_config_cache_returns_copies(config, empty_guild):
+    config.register_guild(foo=[])
+    config.enable_cache()
+    await config.guild(empty_guild).foo.set([1])
+
+    (await config.guild(empty_guild).foo()).append(2)
+    assert await config.guild(empty_guild).foo() == [1]
+
+
+@pytest.mark.asyncio
+async def test_config_cache_is_bounded(config):
+    config.register_custom("TEST")
+    config.init_custom("TEST", 1)
+    cache = config.enable_cache(max_size=10_000)
+    for i in range(100):
+        await config.custom("TEST", i).set_raw("foo", value="x" * 100)
+        await config.custom("TEST", i).get_raw("foo")
+
+    assert cache.size <= 10_000
+    assert 0 < len(cache) < 100
+    assert await config.custom("TEST", 0).get_raw("foo") == "x" * 100
+
+
+@pytest.mark.asyncio
+async def test_config_concurrent_writes(config):
+    config.register_custom("TEST")
+    config.init_custom("TEST", 1)
+
+    await config.custom("TEST", 0).set_raw("foo", value=0)
+
+    results = await asyncio.gather(
+        *(config.custom("TEST", i).set_raw("foo", value=i) for i in range(1, 100)),
+        config.custom("TEST", 0).clear(),
+        config.custom("TEST", 0).set_raw("bar", value=0),
+        return_exceptions=True,
+    )
+    assert not any(isinstance(r, Exception) for r in results)
+    assert await config.custom("TEST", 0).get_raw("foo", default=None) is None
+    assert await config.custom("TEST", 0).get_raw("bar") == 0
+    for i in range(1, 100):
+        assert await config.custom("TEST", i).get_raw("foo") == i
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(
+    os.getenv("RED_STORAGE_TYPE") != "postgres", reason="Benchmarks the PostgreSQL driver"
+)
+@pytest.mark.asyncio
+async def test_config_concurrent_writes_benchmark(config):
+    config.register_custom("TEST")
+    config.init_custom("TEST", 1)
+    ops = 1000
+
+    async def writer(n, count):
+        for i in range(count):
+            await config.custom("TEST", n).set_raw("foo", value=i)
+
+    start = time.perf_counter()
+    await writer(0, ops)
+    serial_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await asyncio.gather(*(writer(n, ops // 100) for n in range(1, 101)))
+    concurrent_elapsed = time.perf_counter() - start
+
+    for n in range(1, 101):
+        assert await config.custom("TEST", n).get_raw("foo") == ops // 100 - 1
+    # Concurrent writes are pipelined, so they don't wait for each other's round trip.
+    assert concurrent_elapsed < serial_elapsed
+
+
+@pytest.mark.asyncio
+async def test_config_change_listeners(config, empty_guild):
+    config.register_guild(foo=0, bar={"baz": 0})
+    changes = []
+    config.add_change_listener(changes.append)
+
+    await config.guild(empty_guild).foo.set(1)
+    await config.guild(empty_guild).set_raw("bar", "baz", value=1)
+    await config.guild(empty_guild).clear()
+    await config.clear_all_guilds()
+
+    assert [(c.category, c.primary_key, c.identifiers) for c in changes] == [
+        ("GUILD", (str(empty_guild.id),), ("foo",)),
+        ("GUILD", (str(empty_guild.id),), ("bar", "baz")),
+        ("GUILD", (str(empty_guild.id),), ()),
+        ("GUILD", (), ()),
+    ]
+    assert changes[0].overlaps(config.GUILD, empty_guild.id, "foo")
+    assert changes[0].overlaps(config.GUILD, empty_guild.id)
+    assert not changes[0].overlaps(config.GUILD, empty_guild.id, "bar")
+    assert not changes[0].overlaps(config.GLOBAL, "foo")
+    assert changes[1].overlaps(config.GUILD, empty_guild.id, "bar")
+    assert changes[3].overlaps(config.GUILD, empty_guild.id, "foo")
+
+    config.remove_change_listener(changes.append)
+    await config.guild(empty_guild).foo.set(2)
+    assert len(changes) == 4
+
+
+@pytest.mark.asyncio
+async def test_config_change_listeners_clear_all(config, empty_guild):
+    config.register_global(foo=0)
+    config.register_guild(foo=0)
+    changes = []
+    config.add_change_listener(changes.append)
+
+    await config.clear_all()
+
+    assert [(c.category, c.primary_key, c.identifiers) for c in changes] == [("", (), ())]
+    assert changes[0].overlaps(config.GLOBAL, "foo")
+    assert changes[0].overlaps(config.GUILD, empty_guild.id, "foo")
+    assert changes[0].overlaps("CUSTOM")
+    config.remove_change_listener(changes.append)
+
+
+@pytest.mark.asyncio
+async def test_config_coroutine_change_listeners(config, caplog):
+    config.register_global(foo=0)
+    changes = []
+
+    async def listener(change):
+        await asyncio.sleep(0)
+        changes.append(change)
+
+    async def failing_listener(change):
+        raise ValueError("listener failed")
+
+    config.add_change_listener(listener)
+    config.add_change_listener(failing_listener)
+    await config.foo.set(1)
+    # The tasks are kept until they're done.
+    assert len(config._listener_tasks) == 2
+    await asyncio.sleep(0.1)
+
+    assert [c.identifiers for c in changes] == [("foo",)]
+    assert not config._listener_tasks
+    assert any(
+        record.name == "red.config" and str(record.exc_info[1]) == "listener failed"
+        for record in caplog.records
+    )
+    config.remove_change_listener(listener)
+    config.remove_change_listener(failing_listener)
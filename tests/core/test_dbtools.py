@@ -0,0 +1,113 @@
+import asyncio
+import concurrent.futures
+import json
+import time
+
+import apsw
+import pytest
+
+from redbot.core.utils.dbtools import APSWConnectionWrapper, ThreadedAPSWConnection
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS persist_queue (
+    guild_id INTEGER NOT NULL,
+    track_id TEXT NOT NULL,
+    track JSON NOT NULL,
+    PRIMARY KEY (guild_id, track_id)
+);
+"""
+UPSERT = """
+INSERT INTO persist_queue (guild_id, track_id, track) VALUES (:guild_id, :track_id, :track)
+ON CONFLICT (guild_id, track_id) DO UPDATE SET track = excluded.track;
+"""
+
+
+def _track(i):
+    return {"guild_id": 1, "track_id": str(i), "track": json.dumps({"uri": f"track {i}"})}
+
+
+class _LoopLag:
+    def __init__(self):
+        self.max = 0.0
+        self._task = None
+
+    async def _sample(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0)
+            self.max = max(self.max, time.perf_counter() - start)
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self._sample())
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *args):
+        self._task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_threaded_apsw_connection(tmp_path):
+    conn = ThreadedAPSWConnection(tmp_path / "test.db")
+    await conn.execute("PRAGMA journal_mode = wal;", transaction=False)
+    await conn.execute(CREATE_TABLE)
+
+    # Concurrent writes are grouped, but fail on their own.
+    results = await asyncio.gather(
+        conn.execute(UPSERT, _track(1)),
+        conn.execute("INSERT INTO persist_queue VALUES (1, '1', '{}')"),
+        conn.executemany(UPSERT, [_track(2), _track(3)]),
+        return_exceptions=True,
+    )
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], apsw.ConstraintError)
+    assert await conn.fetchone("SELECT count(*) FROM persist_queue") == (3,)
+    assert await conn.fetchall("SELECT track_id FROM persist_queue ORDER BY track_id") == [
+        ("1",),
+        ("2",),
+        ("3",),
+    ]
+    assert await conn.run(conn.connection.changes) == 1
+
+    # A write is atomic even when it's alone.
+    with pytest.raises(apsw.ConstraintError):
+        await conn.executemany(
+            "INSERT INTO persist_queue VALUES (?, ?, ?)",
+            [(2, "4", "{}"), (1, "1", "{}"), (2, "5", "{}")],
+        )
+    assert await conn.fetchone("SELECT count(*) FROM persist_queue") == (3,)
+
+    conn.close()
+    with pytest.raises(apsw.ConnectionClosedError):
+        await conn.fetchone("SELECT 1")
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_enqueue_loop_lag_benchmark(tmp_path):
+    count = 5000
+
+    # How the Audio cog used to run statements.
+    old_conn = APSWConnectionWrapper(tmp_path / "old.db")
+    old_conn.cursor().execute(CREATE_TABLE)
+
+    async def old_enqueue(i):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(old_conn.cursor().execute, UPSERT, _track(i))
+
+    async with _LoopLag() as old_lag:
+        start = time.perf_counter()
+        await asyncio.gather(*(old_enqueue(i) for i in range(count)))
+        old_elapsed = time.perf_counter() - start
+    old_conn.close()
+
+    conn = ThreadedAPSWConnection(tmp_path / "new.db")
+    await conn.execute(CREATE_TABLE)
+    async with _LoopLag() as new_lag:
+        start = time.perf_counter()
+        await asyncio.gather(*(conn.execute(UPSERT, _track(i)) for i in range(count)))
+        new_elapsed = time.perf_counter() - start
+    assert await conn.fetchone("SELECT count(*) FROM persist_queue") == (count,)
+    conn.close()
+
+    assert new_elapsed < old_elapsed
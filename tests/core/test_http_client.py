@@ -0,0 +1,111 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from redbot.core import http_client as http_client_module
+from redbot.core.http_client import HTTPClient
+
+
+@pytest.fixture()
+async def server():
+    requests = []
+
+    async def handler(request):
+        requests.append((request.method, request.path))
+        if request.path == "/missing":
+            return web.Response(status=404, text="missing")
+        return web.Response(text=request.path * 10)
+
+    app = web.Application()
+    app.router.add_route("*", "/{path:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    server.requests = requests
+    yield server
+    await server.close()
+
+
+@pytest.fixture()
+async def client():
+    client = HTTPClient()
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_session(client):
+    assert client._session is None
+    session = client.session
+    assert client.session is session
+
+    # A closed session is replaced on next use.
+    await session.close()
+    assert client.session is not session
+    assert not client.session.closed
+
+    session = client.session
+    await client.close()
+    assert session.closed
+    assert client._session is None
+
+
+@pytest.mark.asyncio
+async def test_http_client_cache_ttl(client, server, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(http_client_module.time, "monotonic", lambda: now)
+    url = str(server.make_url("/a"))
+
+    first = await client.get(url, cache_ttl=60)
+    assert first.text() == "/a" * 10
+    assert await client.get(url, cache_ttl=60) is first
+    assert (client.cache_hits, client.cache_misses) == (1, 1)
+    # Other parameters, uncached requests and other methods always reach the server.
+    await client.get(url, params={"q": "1"}, cache_ttl=60)
+    await client.get(url)
+    await client.request("POST", url, cache_ttl=60)
+    assert len(server.requests) == 4
+
+    now += 61
+    assert await client.get(url, cache_ttl=60) is not first
+    assert len(server.requests) == 5
+
+    client.clear_cache()
+    await client.get(url, cache_ttl=60)
+    assert len(server.requests) == 6
+
+
+@pytest.mark.asyncio
+async def test_http_client_cache_errors_not_cached(client, server):
+    url = str(server.make_url("/missing"))
+    response = await client.get(url, cache_ttl=60)
+    assert response.status == 404 and not response.ok
+    await client.get(url, cache_ttl=60)
+    assert len(server.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_http_client_cache_lru(server):
+    # Every body is 20 bytes, the cache fits 4 of them.
+    client = HTTPClient(cache_max_size=80)
+    try:
+        for path in ("/a", "/b", "/c", "/d"):
+            await client.get(str(server.make_url(path)), cache_ttl=60)
+        await client.get(str(server.make_url("/a")), cache_ttl=60)
+        await client.get(str(server.make_url("/e")), cache_ttl=60)
+        assert client._cache_size == 80
+
+        # "/b" was the least recently used.
+        server.requests.clear()
+        for path in ("/a", "/c", "/d", "/e"):
+            await client.get(str(server.make_url(path)), cache_ttl=60)
+        assert server.requests == []
+        await client.get(str(server.make_url("/b")), cache_ttl=60)
+        assert server.requests == [("GET", "/b")]
+
+        # Bodies larger than a quarter of the cache are never cached.
+        client.cache_max_size = 40
+        client.clear_cache()
+        await client.get(str(server.make_url("/abc")), cache_ttl=60)
+        assert client._cache_size == 0
+    finally:
+        await client.close()
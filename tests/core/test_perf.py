@@ -0,0 +1,54 @@
+import asyncio
+import time
+
+import pytest
+
+from redbot.core._perf import PerfMonitor, TimingStats, listener_name
+
+
+def test_timing_stats():
+    stats = TimingStats()
+    for elapsed in (0.0005, 0.002, 0.002, 0.2):
+        stats.record(elapsed, busy=elapsed / 2)
+
+    assert stats.count == 4
+    assert stats.max == 0.2
+    assert stats.busy_max == 0.1
+    assert stats.percentile(50) == 0.005
+    assert stats.percentile(100) == 0.2
+    assert stats.to_dict()["buckets"]["0.005"] == 2
+
+
+@pytest.mark.asyncio
+async def test_perf_monitor_timed():
+    monitor = PerfMonitor()
+    monitor.enable()
+
+    async def listener():
+        time.sleep(0.02)
+        await asyncio.sleep(0.05)
+        return 1
+
+    async def failing_listener():
+        await asyncio.sleep(0)
+        raise ValueError
+
+    assert await monitor.timed(monitor.listeners, "listener", listener()) == 1
+    with pytest.raises(ValueError):
+        await monitor.timed(monitor.listeners, "failing", failing_listener())
+    monitor.disable()
+
+    stats = monitor.listeners["listener"]
+    assert stats.count == 1
+    assert stats.total >= 0.07
+    assert 0.02 <= stats.busy_total < stats.total
+    assert monitor.listeners["failing"].count == 1
+    assert not monitor.enabled
+
+
+def test_listener_name():
+    class Cog:
+        async def on_message(self, message):
+            pass
+
+    assert listener_name(Cog().on_message) == "Cog.on_message"
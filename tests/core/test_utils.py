@@ -2,6 +2,8 @@ import asyncio
 import pytest
 import random
 import textwrap
+import time
+from fuzzywuzzy import fuzz, process
 from redbot.core.utils import (
     chat_formatting,
     bounded_gather,
@@ -9,6 +11,7 @@ from redbot.core.utils import (
     deduplicate_iterables,
     common_filters,
 )
+from redbot.core.utils._internal_utils import FuzzyIndex
 
 
 def test_bordered_symmetrical():
@@ -65,6 +68,118 @@ def test_bordered_ascii():
     assert chat_formatting.bordered(col1, col2, ascii_border=True) == expected
 
 
+def test_pagify():
+    text = "one two\nthree four\nfive six seven eight"
+    pages = list(chat_formatting.pagify(text, page_length=16, shorten_by=0))
+    assert pages == ["one two", "\nthree four", "\nfive six seven ", "eight"]
+    pages = list(chat_formatting.pagify(text, delims=["\n", " "], page_length=16, shorten_by=0))
+    assert pages == ["one two\nthree", " four\nfive six", " seven eight"]
+
+
+def test_pagify_chunks():
+    text = "\n".join(f"line {i} " * random.randint(1, 20) for i in range(500))
+    chunks = [text[i : i + 37] for i in range(0, len(text), 37)]
+    assert list(chat_formatting.pagify(chunks)) == list(chat_formatting.pagify(text))
+    assert list(chat_formatting.pagify(iter(chunks), delims=[" ", "\n"], priority=True)) == list(
+        chat_formatting.pagify(text, delims=[" ", "\n"], priority=True)
+    )
+
+
+def test_pagify_large_text():
+    line = "a line of output that could come from eval or a log file\n"
+    text = line * (200_000 // len(line))
+
+    pages = list(chat_formatting.pagify(text, escape_mass_mentions=False))
+    assert "".join(pages) == text
+    assert all(len(page) <= 1992 for page in pages)
+    # Every page break is at the end of a line.
+    assert all(page.startswith("\n") for page in pages[1:])
+    chunks = iter([text[:100_000], text[100_000:]])
+    assert list(chat_formatting.pagify(chunks, escape_mass_mentions=False)) == pages
+
+
+@pytest.mark.benchmark
+def test_pagify_large_text_benchmark():
+    line = "a line of output that could come from eval or a log file\n"
+    text = line * (10_000_000 // len(line))
+
+    start = time.perf_counter()
+    pages = list(chat_formatting.pagify(text, escape_mass_mentions=False))
+    elapsed = time.perf_counter() - start
+
+    assert "".join(pages) == text
+    # The previous implementation copied the remaining text for each page,
+    # which took well over this on 10MB of input.
+    assert elapsed < 5
+
+
+def _random_names(amount, words_per_name):
+    rng = random.Random(0)
+    words = [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9)))
+        for _ in range(1000)
+    ]
+    names = {" ".join(rng.sample(words, rng.randint(*words_per_name))) for _ in range(amount)}
+    return sorted(names)
+
+
+def test_fuzzy_index_matches_process_extract():
+    names = _random_names(2000, (1, 3))
+    index = FuzzyIndex((name, name) for name in names)
+    rng = random.Random(1)
+    for name in rng.sample(names, 50):
+        query = list(name)
+        query[rng.randrange(len(query))] = "x"
+        query = "".join(query)
+        for scorer, cutoff in ((fuzz.QRatio, 80), (fuzz.WRatio, 90)):
+            expected = [
+                score
+                for __, score in process.extract(query, names, limit=5, scorer=scorer)
+                if score >= cutoff
+            ]
+            found = index.search(query, limit=5, scorer=scorer, score_cutoff=cutoff)
+            assert [score for __, score in found] == expected
+
+
+@pytest.mark.asyncio
+async def test_fuzzy_index_search_async():
+    index = FuzzyIndex([(1, "ping"), (2, "pong"), (3, "info")])
+    assert await index.search_async("ping", limit=1) == [(1, 100)]
+    assert await FuzzyIndex.extract("info", [("a", "info")]) == [("a", 100)]
+    assert index.search("") == []
+
+
+def test_fuzzy_index_queue_matches_process_extract():
+    titles = _random_names(2000, (3, 6))
+    index = FuzzyIndex((str(idx), title) for idx, title in enumerate(titles, start=1))
+    for title in titles[:10]:
+        expected = [score for __, score in process.extract(title, titles, limit=50) if score >= 90]
+        found = index.search(title, limit=50, score_cutoff=90)
+        assert [score for __, score in found] == expected
+
+
+@pytest.mark.benchmark
+def test_fuzzy_index_commands_benchmark():
+    names = _random_names(5000, (1, 3))
+    start = time.perf_counter()
+    index = FuzzyIndex((name, name) for name in names)
+    for name in names[:50]:
+        assert index.search(name, scorer=fuzz.QRatio, score_cutoff=80)[0][1] == 100
+    elapsed = time.perf_counter() - start
+    assert elapsed < 5
+
+
+@pytest.mark.benchmark
+def test_fuzzy_index_queue_benchmark():
+    titles = _random_names(50_000, (3, 6))
+    start = time.perf_counter()
+    index = FuzzyIndex((str(idx), title) for idx, title in enumerate(titles, start=1))
+    for title in titles[:3]:
+        assert index.search(title, limit=50, score_cutoff=90)
+    elapsed = time.perf_counter() - start
+    assert elapsed < 15
+
+
 def test_deduplicate_iterables():
     expected = [1, 2, 3, 4, 5]
     inputs = [[1, 2, 1], [3, 1, 2, 4], [5, 1, 2]]
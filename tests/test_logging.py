@@ -0,0 +1,99 @@
+import logging
+import queue
+
+from redbot import logging as red_logging
+from redbot.logging import BoundedQueueHandler, BoundedQueueListener, shutdown_logging
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _record(level, msg="message %s", *args):
+    return logging.LogRecord("red.test", level, __file__, 0, msg, args, None)
+
+
+def test_queue_handler_drops_records_when_full(monkeypatch):
+    monkeypatch.setattr(red_logging, "LOG_QUEUE_PUT_TIMEOUT", 0.01)
+    log_queue = queue.Queue(2)
+    handler = BoundedQueueHandler(log_queue)
+
+    for i in range(3):
+        handler.handle(_record(logging.INFO, "message %s", i))
+    assert handler.dropped == 1
+    # More severe records wait for room, but only for a while.
+    handler.handle(_record(logging.ERROR))
+    assert handler.dropped == 2
+    assert [log_queue.get_nowait().msg for __ in range(2)] == ["message 0", "message 1"]
+
+
+def test_queue_handler_warns_about_dropped_records():
+    log_queue = queue.Queue(2)
+    handler = BoundedQueueHandler(log_queue)
+    for level in (logging.INFO, logging.INFO, logging.DEBUG, logging.DEBUG):
+        handler.handle(_record(level))
+    log_queue.get_nowait()
+    log_queue.get_nowait()
+
+    handler.handle(_record(logging.INFO, "after"))
+    warning = log_queue.get_nowait()
+    assert warning.levelno == logging.WARNING
+    assert warning.getMessage() == (
+        "2 log records were dropped because the logging queue was full."
+    )
+    assert log_queue.get_nowait().msg == "after"
+    assert handler.dropped == 0
+
+
+def test_shutdown_logging_handles_queued_records(monkeypatch):
+    log_queue = queue.Queue(red_logging.LOG_QUEUE_SIZE)
+    queue_handler = BoundedQueueHandler(log_queue)
+    target = ListHandler()
+    listener = BoundedQueueListener(log_queue, target)
+    monkeypatch.setattr(red_logging, "_queue_handler", queue_handler)
+    monkeypatch.setattr(red_logging, "_queue_listener", listener)
+    root_logger = logging.getLogger()
+    root_logger.addHandler(queue_handler)
+    for i in range(100):
+        queue_handler.handle(_record(logging.WARNING, "message %s", i))
+
+    listener.start()
+    shutdown_logging()
+    try:
+        assert [record.getMessage() for record in target.records] == [
+            f"message {i}" for i in range(100)
+        ]
+        assert queue_handler not in root_logger.handlers
+        # Records logged after the shutdown are handled directly.
+        logging.getLogger("red.test").warning("after shutdown")
+        assert target.records[-1].getMessage() == "after shutdown"
+    finally:
+        root_logger.removeHandler(target)
+
+
+def test_queue_handler_keeps_count_when_warning_does_not_fit():
+    class RacingQueue(queue.Queue):
+        # The queue looks empty, as if another thread filled it right after the check.
+        def qsize(self):
+            return 0
+
+    log_queue = RacingQueue(2)
+    handler = BoundedQueueHandler(log_queue)
+    for level in (logging.INFO, logging.INFO, logging.DEBUG, logging.DEBUG):
+        handler.handle(_record(level))
+    # The warning about the first dropped record didn't fit either.
+    assert handler.dropped == 2
+    log_queue.get_nowait()
+    log_queue.get_nowait()
+
+    handler.handle(_record(logging.INFO, "after"))
+    assert log_queue.get_nowait().getMessage() == (
+        "2 log records were dropped because the logging queue was full."
+    )
+    assert log_queue.get_nowait().msg == "after"
+    assert handler.dropped == 0